@@ -0,0 +1,145 @@
+# benchmarks/bench_parser.py
+"""
+Save parser benchmarks on a full-size synthetic save (see synthetic_save.py).
+
+    python -m benchmarks.bench_parser             # run, compare with the thresholds
+    python -m benchmarks.bench_parser --update    # accept the current timings as the new baseline
+
+Each operation is timed as the best of several rounds. The results are
+checked against the budgets in THRESHOLDS_MS, and (if present) against
+benchmarks/parser_baseline.json with REGRESSION_FACTOR slack. The exit code
+is 1 on a regression, so this can gate CI. The parsed results are also
+compared with what the generator wrote before anything is timed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic_save import write_synthetic_save
+from src.services import save_parser
+from src.services import bnd4, user_data_x
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "parser_baseline.json")
+REGRESSION_FACTOR = 1.5  # Allowed slowdown against the stored baseline
+
+# Absolute budgets (ms per call), generous enough for slow CI machines
+THRESHOLDS_MS = {
+    "load_file": 150.0,
+    "list_characters": 1.0,
+    "get_boss_statuses": 2.0,
+    "get_full_status": 3.0,
+    "get_full_status_cold": 30.0,
+    "get_roster": 5.0,
+}
+
+
+def _best_ms(func, rounds, number):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best * 1000
+
+
+def _check_results(parser, characters, event_ids):
+    listed, err = parser.list_characters()
+    if err:
+        raise AssertionError(err)
+    if [c['slot_index'] for c in listed] != [c.slot_index for c in characters]:
+        raise AssertionError(f"Slots {[c['slot_index'] for c in listed]} != {[c.slot_index for c in characters]}")
+    for character in characters:
+        status, err = parser.get_full_status(character.slot_index, event_ids)
+        if err:
+            raise AssertionError(err)
+        defeated = {int(boss_id) for boss_id, is_defeated in status['boss_statuses'].items() if is_defeated}
+        if defeated != set(character.defeated):
+            raise AssertionError(f"Slot {character.slot_index}: {len(defeated)} defeated, expected {len(character.defeated)}")
+        if status['stats']['deaths'] != character.deaths:
+            raise AssertionError(f"Slot {character.slot_index}: {status['stats']['deaths']} deaths, expected {character.deaths}")
+
+
+def run_benchmarks(save_path, characters, event_ids, rounds=5):
+    slot = characters[-1].slot_index
+    parser = save_parser.EldenRingSaveParser()
+    parser.load_file(save_path)
+    _check_results(parser, characters, event_ids)
+
+    def full_status_cold():
+        user_data_x._layout_cache.clear()
+        parser.get_full_status(slot, event_ids)
+
+    def load_cold():
+        bnd4._directory_cache.clear()
+        save_parser.EldenRingSaveParser().load_file(save_path)
+
+    return {
+        "load_file": _best_ms(load_cold, rounds, 3),
+        "list_characters": _best_ms(parser.list_characters, rounds, 200),
+        "get_boss_statuses": _best_ms(lambda: parser.get_boss_statuses(slot, event_ids), rounds, 200),
+        "get_full_status": _best_ms(lambda: parser.get_full_status(slot, event_ids), rounds, 200),
+        "get_full_status_cold": _best_ms(full_status_cold, rounds, 5),
+        "get_roster": _best_ms(lambda: parser.get_roster(event_ids), rounds, 50),
+    }
+
+
+def compare(results, baseline):
+    """Returns a list of regression messages."""
+    failures = []
+    for name, ms in results.items():
+        budget = THRESHOLDS_MS.get(name)
+        if budget is not None and ms > budget:
+            failures.append(f"{name}: {ms:.3f} ms exceeds the budget of {budget:.3f} ms")
+        previous = baseline.get(name)
+        if previous and ms > previous * REGRESSION_FACTOR:
+            failures.append(f"{name}: {ms:.3f} ms is more than {REGRESSION_FACTOR}x the baseline {previous:.3f} ms")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_parser", description="Benchmark the save parser.")
+    parser.add_argument("--characters", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--update", action="store_true", help="Store the timings as the new baseline.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = os.path.join(tmp, "ER0000.sl2")
+        characters, event_ids, bst_map = write_synthetic_save(save_path, args.characters, args.seed)
+        save_parser.set_event_flag_block_map(bst_map)
+        size_mb = os.path.getsize(save_path) / (1024 * 1024)
+        print(f"Synthetic save: {size_mb:.1f} MB, {len(characters)} characters, {len(event_ids)} event IDs")
+        results = run_benchmarks(save_path, characters, event_ids, args.rounds)
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    for name, ms in results.items():
+        previous = f"  (baseline {baseline[name]:.3f} ms)" if name in baseline else ""
+        print(f"{name:<22} {ms:10.3f} ms{previous}")
+    print(f"load_file throughput: {size_mb / (results['load_file'] / 1000):.0f} MB/s")
+
+    if args.update:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({name: round(ms, 4) for name, ms in results.items()}, f, indent=2)
+        print(f"Baseline written to {BASELINE_FILE}")
+        return 0
+
+    failures = compare(results, baseline)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
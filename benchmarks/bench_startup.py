@@ -0,0 +1,164 @@
+# benchmarks/bench_startup.py
+"""
+Startup time of the GUI: time to first paint and the import-time budget of src.main.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --rounds 5 --importtime
+
+Starts `python -m src.main --trace-startup` under an offscreen Qt platform
+with the trace set to quit after the first paint (see src/utils/startup_trace.py),
+in a fresh process per round so every import is cold. Settings go to an
+empty temporary INI file (TTC_SETTINGS_FILE), so no saved path is parsed and
+no OBS push or IPC server is started; app data points to a temporary folder
+holding a minimal asset pack (with its index already built) and a version
+file, so no download dialog blocks startup, and the manifest URL is cleared
+(TTC_IMAGE_ASSETS_MANIFEST_URL), so no incremental update runs. The median of each phase is reported and
+checked against BUDGETS_MS; the exit code is 1 if a budget is exceeded.
+
+--importtime also runs `python -X importtime` on src.main's imports and lists
+the slowest modules (cumulative, including their own imports).
+
+Needs the compiled resources (python compile_resources.py), like the app itself.
+"""
+
+import os
+import sys
+import json
+import argparse
+import zipfile
+import tempfile
+import statistics
+import subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.config.app_config import APP_DATA_DIR, SETTINGS_FILE_ENV_VAR, IMAGE_ASSETS_MANIFEST_URL_ENV_VAR
+from src.services.asset_pack import AssetPack, ASSET_PACK_FILENAME
+from src.utils.startup_trace import TRACE_JSON_ENV_VAR, TRACE_EXIT_ENV_VAR
+
+# Median budgets (ms) for a fresh process, generous enough for slow CI machines
+BUDGETS_MS = {
+    "first paint": 4000.0,
+    "imports": 2000.0,
+    "main window": 1500.0,
+}
+PROCESS_TIMEOUT_S = 60
+IMPORTTIME_TARGET = "import PySide6.QtWidgets, src.services.asset_downloader, src.ui.main_window, resources_rc"
+
+
+def _prepare_environment(workdir):
+    """Isolated settings and app data with a minimal image asset pack in place."""
+    app_data = os.path.join(workdir, "appdata")
+    assets_dir = os.path.join(app_data, APP_DATA_DIR)
+    os.makedirs(assets_dir, exist_ok=True)
+    pack_path = os.path.join(assets_dir, ASSET_PACK_FILENAME)
+    with zipfile.ZipFile(pack_path, 'w') as pack:
+        pack.writestr("Bosses_locations/benchmark.png", b"benchmark")
+    AssetPack(pack_path).open().close()  # Caches the index, so every round opens the pack the same way
+    with open(os.path.join(assets_dir, "image_assets_version.txt"), 'w', encoding='utf-8') as f:
+        f.write("benchmark")
+
+    env = dict(os.environ)
+    env.update({
+        "QT_QPA_PLATFORM": env.get("QT_QPA_PLATFORM", "offscreen"),
+        "LOCALAPPDATA": app_data,
+        SETTINGS_FILE_ENV_VAR: os.path.join(workdir, "settings.ini"),  # Never the user's settings (registry on Windows)
+        IMAGE_ASSETS_MANIFEST_URL_ENV_VAR: "",  # No incremental asset update (network) inside the timed startup
+        TRACE_EXIT_ENV_VAR: "1",
+        "PYTHONDONTWRITEBYTECODE": "1",
+    })
+    return env
+
+
+def run_once(env, json_path):
+    """One traced startup. Returns (report, error)."""
+    if os.path.exists(json_path):
+        os.remove(json_path)
+    env = dict(env, **{TRACE_JSON_ENV_VAR: json_path})
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "src.main", "--trace-startup"],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=PROCESS_TIMEOUT_S
+        )
+    except subprocess.TimeoutExpired:
+        return None, f"src.main did not paint within {PROCESS_TIMEOUT_S} s"
+    if not os.path.exists(json_path):
+        tail = "\n".join((result.stderr or result.stdout).strip().splitlines()[-10:])
+        return None, f"src.main exited with {result.returncode} without a startup trace:\n{tail}"
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f), None
+
+
+def summarize(reports):
+    """Median duration per phase (in the order of the first report) and of the time to first paint."""
+    durations = {}
+    for report in reports:
+        for entry in report["phases"]:
+            if entry["name"] == "first paint":
+                continue
+            durations.setdefault((entry["name"], entry["depth"]), []).append(entry["duration_ms"])
+    summary = [(name, depth, statistics.median(values)) for (name, depth), values in durations.items()]
+    first_paint = statistics.median(report["first_paint_ms"] for report in reports)
+    return summary, first_paint
+
+
+def slowest_imports(env, count):
+    """[(cumulative_ms, module)] of the slowest imports of src.main, from `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORTTIME_TARGET],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=PROCESS_TIMEOUT_S
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        # "import time:      self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative) / 1000, module.rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup", description="Benchmark GUI startup time.")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--importtime", action="store_true", help="Also list the slowest imports.")
+    parser.add_argument("--top", type=int, default=15, help="Number of imports listed with --importtime.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = _prepare_environment(workdir)
+        json_path = os.path.join(workdir, "startup_trace.json")
+        reports = []
+        for _ in range(args.rounds):
+            report, err = run_once(env, json_path)
+            if err:
+                print(f"ERROR: {err}")
+                return 2
+            reports.append(report)
+        imports = slowest_imports(env, args.top) if args.importtime else []
+
+    summary, first_paint = summarize(reports)
+    print(f"Startup phases, median of {len(reports)} cold starts (ms):")
+    for name, depth, ms in summary:
+        print(f"  {'  ' * depth + name:<36} {ms:9.1f}")
+    print(f"  {'time to first paint':<36} {first_paint:9.1f}")
+
+    if imports:
+        print(f"\nSlowest imports (cumulative ms):")
+        for ms, module in imports:
+            print(f"  {ms:9.1f}  {module}")
+
+    medians = {name: ms for name, depth, ms in summary if depth == 0}
+    medians["first paint"] = first_paint
+    failures = [
+        f"{name}: {medians[name]:.1f} ms exceeds the budget of {budget:.1f} ms"
+        for name, budget in BUDGETS_MS.items() if name in medians and medians[name] > budget
+    ]
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
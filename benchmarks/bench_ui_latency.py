@@ -0,0 +1,277 @@
+# benchmarks/bench_ui_latency.py
+"""
+End-to-end UI update latency of BossChecklistApp under an offscreen Qt platform.
+
+    python -m benchmarks.bench_ui_latency
+    python -m benchmarks.bench_ui_latency --iterations 50 --json ui_latency.json
+
+Builds the real main window (with the overlay shown and OBS output enabled
+into a temporary folder; settings go to a temporary INI file through
+TTC_SETTINGS_FILE, never to the user's settings), then feeds synthetic
+monitor payloads through the same path as SaveMonitorLogic.delta_updated:
+AppLogic.handle_monitor_delta(), publish_state_snapshot() and one pass of
+the event loop (deferred deletes, layout, paint). The time of each stage is collected by wrapping the methods
+on the live objects:
+
+    boss_statuses   BossDataManager.update_boss_statuses + get_boss_counts
+    boss_area       AppLogic.update_main_boss_area
+    stats_section   StatsSectionWidget.update_stats + FooterWidget.update_stats
+    overlay         OverlayManager.update_text
+    obs             ObsManager.update_obs_files
+    live_clock      LiveClock.set_snapshot (pushes the time to its subscribers)
+    event_loop      QApplication.processEvents after the update
+
+Scenarios: one boss flip, a playtime-only save and a character switch. When
+the bundled boss definitions are not available, a synthetic set of the same
+size (locations from LOCATION_PROGRESSION_ORDER) is used.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+from functools import wraps
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PySide6.QtWidgets import QApplication
+
+from src.config.app_config import LOCATION_PROGRESSION_ORDER, SETTINGS_FILE_ENV_VAR
+from src.utils import get_app_settings
+from src.services.monitor_delta import compute_delta
+
+SYNTHETIC_BASE_FILENAME = "bench_boss_ids.json"
+SYNTHETIC_DLC_FILENAME = "bench_boss_ids_DLC.json"
+SYNTHETIC_DLC_LOCATIONS = [
+    "Gravesite Plain", "Scadu Altus", "Shadow Keep", "Cerulean Coast", "Jagged Peak",
+    "Abyssal Woods", "Ancient Ruins of Rauh", "Charo's Hidden Grave", "Enir-Ilim", "Scaduview",
+]
+BOSSES_PER_LOCATION = 8
+
+STAGES = ["boss_statuses", "boss_area", "stats_section", "overlay", "obs", "live_clock", "event_loop"]
+
+
+class StageTimer:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.current = dict.fromkeys(STAGES, 0.0)
+
+    def wrap(self, obj, method_name, stage):
+        """Replaces obj.method_name with a timed wrapper that adds to `stage`."""
+        original = getattr(obj, method_name)
+
+        @wraps(original)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.current[stage] += time.perf_counter() - started
+
+        setattr(obj, method_name, timed)
+
+
+def _write_synthetic_definitions(root):
+    """Writes boss definitions of realistic size under root/data/Bosses."""
+    folder = os.path.join(root, "data", "Bosses")
+    os.makedirs(folder, exist_ok=True)
+    event_id = 10000800
+    for filename, locations in ((SYNTHETIC_BASE_FILENAME, LOCATION_PROGRESSION_ORDER),
+                                (SYNTHETIC_DLC_FILENAME, SYNTHETIC_DLC_LOCATIONS)):
+        data = {}
+        for location in locations:
+            data[location] = []
+            for n in range(BOSSES_PER_LOCATION):
+                data[location].append({"name": f"{location} Boss {n + 1}", "event_id": event_id})
+                event_id += 1000
+        with open(os.path.join(folder, filename), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+
+def _payload(character_name, statuses, seconds_played, deaths=10, level=80):
+    return {
+        "stats": {"character_name": character_name, "deaths": deaths, "seconds_played": seconds_played, "level": level},
+        "boss_statuses": dict(statuses),
+    }
+
+
+class UiLatencyBench:
+    def __init__(self, workdir):
+        self.workdir = workdir
+        # The app reads and writes a throwaway INI file instead of the user's settings (registry on Windows)
+        os.environ[SETTINGS_FILE_ENV_VAR] = os.path.join(workdir, "settings.ini")
+        settings = get_app_settings()
+        settings.setValue("obs/enabled", True)
+        settings.setValue("obs/folder", os.path.join(workdir, "obs"))
+        settings.sync()
+        os.makedirs(os.path.join(workdir, "obs"), exist_ok=True)
+
+        from src.ui.main_window import BossChecklistApp
+        self.window = BossChecklistApp()
+        self.logic = self.window.app_logic
+        self._ensure_boss_definitions()
+        self.window.show()
+        self.window.overlay_window.show()
+        QApplication.processEvents()
+
+        self.timer = StageTimer()
+        self._instrument()
+        self.event_ids = [str(eid) for eid in sorted(self.window.boss_data_manager.get_all_event_ids_to_monitor())]
+        self.characters = self._select_characters(["Tarnished A", "Tarnished B"])
+
+    def _ensure_boss_definitions(self):
+        manager = self.window.boss_data_manager
+        self.synthetic_data = not manager.get_all_event_ids_to_monitor()
+        if not self.synthetic_data:
+            return
+        _write_synthetic_definitions(self.workdir)
+        os.chdir(self.workdir)  # resource_loader falls back to the working directory
+        manager.base_filename = SYNTHETIC_BASE_FILENAME
+        manager.dlc_filename = SYNTHETIC_DLC_FILENAME
+        manager.load_definitions()
+        manager.set_content_filter(self.window.content_filter_combobox.currentData() or "all")
+
+    def _instrument(self):
+        w, t = self.window, self.timer
+        t.wrap(w.boss_data_manager, "update_boss_statuses", "boss_statuses")
+        t.wrap(w.boss_data_manager, "get_boss_counts", "boss_statuses")
+        t.wrap(self.logic, "update_main_boss_area", "boss_area")
+        t.wrap(w.stats_section, "update_stats", "stats_section")
+        t.wrap(w.footer, "update_stats", "stats_section")
+        t.wrap(w.overlay_manager, "update_text", "overlay")
+        t.wrap(w.obs_manager, "update_obs_files", "obs")
+        t.wrap(w.live_clock, "set_snapshot", "live_clock")
+
+    def _select_characters(self, names):
+        """Fills the character combobox like a loaded save file, without reading one."""
+        combobox = self.window.character_slot_combobox
+        combobox.blockSignals(True)
+        combobox.clear()
+        combobox.addItem("Select a character", userData=None)
+        for slot_index, name in enumerate(names):
+            combobox.addItem(f"{name} (Level 80)", userData={"slot_index": slot_index, "character_name": name, "character_level": 80})
+        combobox.setEnabled(True)
+        combobox.setCurrentIndex(1)
+        combobox.blockSignals(False)
+        return names
+
+    def _select(self, index):
+        combobox = self.window.character_slot_combobox
+        combobox.blockSignals(True)
+        combobox.setCurrentIndex(index + 1)
+        combobox.blockSignals(False)
+
+    def _apply(self, previous, payload):
+        """One monitor update through the app's real handlers. Returns (total_seconds, stages)."""
+        delta = compute_delta(previous, payload)
+        self.timer.reset()
+        started = time.perf_counter()
+        self.logic.handle_monitor_delta(delta)
+        self.logic.publish_state_snapshot(delta)
+        loop_started = time.perf_counter()
+        QApplication.processEvents()
+        self.timer.current["event_loop"] = time.perf_counter() - loop_started
+        return time.perf_counter() - started, dict(self.timer.current)
+
+    def _reset_to(self, character_index, payload):
+        self._select(character_index)
+        self.logic.handle_stats_update(payload)
+        QApplication.processEvents()
+        return payload
+
+    # --- Scenarios ---
+
+    def scenario_boss_flip(self, iterations):
+        statuses = {eid: i % 3 == 0 for i, eid in enumerate(self.event_ids)}
+        previous = self._reset_to(0, _payload(self.characters[0], statuses, 36000))
+        undefeated = [eid for eid, defeated in statuses.items() if not defeated]
+        samples = []
+        for i in range(iterations):
+            statuses[undefeated[i % len(undefeated)]] = True
+            payload = _payload(self.characters[0], statuses, 36000 + i * 30)
+            samples.append(self._apply(previous, payload))
+            previous = payload
+        return samples
+
+    def scenario_playtime_only(self, iterations):
+        statuses = {eid: i % 2 == 0 for i, eid in enumerate(self.event_ids)}
+        previous = self._reset_to(0, _payload(self.characters[0], statuses, 50000))
+        samples = []
+        for i in range(iterations):
+            payload = _payload(self.characters[0], statuses, 50000 + (i + 1) * 5)
+            samples.append(self._apply(previous, payload))
+            previous = payload
+        return samples
+
+    def scenario_character_switch(self, iterations):
+        per_character = [
+            {eid: i % 4 == 0 for i, eid in enumerate(self.event_ids)},
+            {eid: i % 4 != 0 for i, eid in enumerate(self.event_ids)},
+        ]
+        previous = self._reset_to(0, _payload(self.characters[0], per_character[0], 20000))
+        samples = []
+        for i in range(iterations):
+            index = (i + 1) % 2
+            self._select(index)
+            payload = _payload(self.characters[index], per_character[index], 20000 + i, deaths=5 + index, level=60 + index)
+            samples.append(self._apply(previous, payload))
+            previous = payload
+        return samples
+
+
+def summarize(samples):
+    def stats_ms(values):
+        ordered = sorted(values)
+        p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+        return {"median": statistics.median(ordered) * 1000, "p95": p95 * 1000}
+
+    summary = {"total": stats_ms([total for total, _ in samples])}
+    for stage in STAGES:
+        summary[stage] = stats_ms([stages[stage] for _, stages in samples])
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_ui_latency", description="Measure UI update latency offscreen.")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+    json_path = os.path.abspath(args.json) if args.json else None
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        try:
+            bench = UiLatencyBench(workdir)
+            print(f"Boss definitions: {len(bench.event_ids)} bosses ({'synthetic' if bench.synthetic_data else 'bundled'})")
+            scenarios = {
+                "boss_flip": bench.scenario_boss_flip,
+                "playtime_only": bench.scenario_playtime_only,
+                "character_switch": bench.scenario_character_switch,
+            }
+            results = {name: summarize(run(args.iterations)) for name, run in scenarios.items()}
+            bench.window.close()
+            app.processEvents()
+        finally:
+            os.chdir(cwd)
+
+    for name, summary in results.items():
+        print(f"\n{name} ({args.iterations} updates)      median ms     p95 ms")
+        for stage, values in summary.items():
+            print(f"  {stage:<16} {values['median']:12.3f} {values['p95']:10.3f}")
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+# benchmarks/synthetic_save.py
+"""
+Deterministic synthetic Elden Ring save files for benchmarks and debugging.
+
+Real saves cannot be committed, so this builds a full-size PC save (BND4
+header and entry table, 10 character slots with checksums, item tables,
+PlayerGameData, death counters and event flags, and the profile summary in
+UserData10) from a seed and a chosen set of defeated bosses. The layout
+follows save_layout.py, so the parser reads it like a real file.
+
+    python -m benchmarks.synthetic_save out.sl2 --characters 3 --seed 7
+"""
+
+import os
+import sys
+import random
+import struct
+import hashlib
+import argparse
+from typing import Dict, List, NamedTuple, Set
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.save_layout import (
+    BND4_MAGIC, BND4_HEADER_SIZE, BND4_ENTRY_HEADER_SIZE, SAVE_HEADER_SIZE, SLOT_SIZE, SLOT_CHECKSUM_SIZE,
+    MAX_CHARACTER_SLOTS, USER_DATA_10_INDEX, PROFILE_SUMMARY_OFFSET_IN_USER_DATA_10, PROFILE_ENTRY_SIZE,
+    EVENT_FLAGS_SLOT_OFFSET, SLOT_HEADER, SLOT_TAIL, GAITEM_COUNT, GAITEM_TYPE_WEAPON, GAITEM_TYPE_ARMOR,
+    GAITEM_SIZE_WEAPON, GAITEM_SIZE_ARMOR, GAITEM_SIZE_OTHER
+)
+from src.services.save_parser import FlagPlan
+
+USER_DATA_10_SIZE = 0x60010
+USER_DATA_11_SIZE = 0x240010
+SAVE_VERSION = 251
+PLAYER_NAME_OFFSET = 0x94  # Within PlayerGameData
+PLAYER_LEVEL_OFFSET = 0x60
+
+
+class SyntheticCharacter(NamedTuple):
+    slot_index: int
+    name: str
+    level: int
+    seconds_played: int
+    deaths: int
+    defeated: frozenset  # Event IDs whose flags are set
+
+
+def synthetic_event_ids(count: int = 250, seed: int = 0) -> List[int]:
+    """Boss-like event IDs (block * 1000 + 800..899) spread over many flag blocks."""
+    rng = random.Random(seed)
+    blocks = rng.sample(range(10000, 1060000), count)
+    return sorted(block * 1000 + rng.randrange(800, 900) for block in blocks)
+
+
+def synthetic_bst(event_ids) -> Dict[int, int]:
+    """A block -> index map covering `event_ids`, like eventflag_bst.txt."""
+    blocks = sorted({event_id // 1000 for event_id in event_ids})
+    return {block: index for index, block in enumerate(blocks)}
+
+
+def random_characters(event_ids, count: int = 3, seed: int = 0) -> List[SyntheticCharacter]:
+    """`count` characters in random slots with increasing progress."""
+    rng = random.Random(seed)
+    slots = sorted(rng.sample(range(MAX_CHARACTER_SLOTS), count))
+    characters = []
+    for n, slot_index in enumerate(slots):
+        progress = (n + 1) / count
+        defeated = frozenset(rng.sample(list(event_ids), int(len(event_ids) * progress * 0.9)))
+        characters.append(SyntheticCharacter(
+            slot_index=slot_index,
+            name=f"Tarnished{slot_index}",
+            level=int(10 + 150 * progress),
+            seconds_played=int(3600 * 120 * progress),
+            deaths=int(900 * progress),
+            defeated=defeated,
+        ))
+    return characters
+
+
+def _entry_layout():
+    """[(name, data offset, size)] for USER_DATA000..011."""
+    sizes = [SLOT_SIZE] * MAX_CHARACTER_SLOTS + [USER_DATA_10_SIZE, USER_DATA_11_SIZE]
+    entries, offset = [], SAVE_HEADER_SIZE
+    for index, size in enumerate(sizes):
+        entries.append((f"USER_DATA{index:03d}", offset, size))
+        offset += size
+    return entries
+
+
+def _write_slot(data, start, character: SyntheticCharacter, plan: FlagPlan, rng: random.Random):
+    struct.pack_into("<I", data, start + 0x10, SAVE_VERSION)  # SLOT_HEADER.version
+
+    # Item handle table: a realistic mix of weapons, armor, goods and empty handles
+    position = start + SLOT_HEADER.size
+    for index in range(GAITEM_COUNT):
+        roll = rng.random()
+        if roll < 0.1:
+            struct.pack_into("<II", data, position, GAITEM_TYPE_WEAPON | index, rng.randrange(1, 1 << 24))
+            position += GAITEM_SIZE_WEAPON
+        elif roll < 0.25:
+            struct.pack_into("<II", data, position, GAITEM_TYPE_ARMOR | index, rng.randrange(1, 1 << 24))
+            position += GAITEM_SIZE_ARMOR
+        elif roll < 0.5:
+            struct.pack_into("<II", data, position, 0xB0000000 | index, rng.randrange(1, 1 << 24))
+            position += GAITEM_SIZE_OTHER
+        else:
+            struct.pack_into("<II", data, position, 0, 0xFFFFFFFF)
+            position += GAITEM_SIZE_OTHER
+
+    # PlayerGameData
+    struct.pack_into("<I", data, position + PLAYER_LEVEL_OFFSET, character.level)
+    name = character.name.encode("utf-16-le")[:32]
+    data[position + PLAYER_NAME_OFFSET:position + PLAYER_NAME_OFFSET + len(name)] = name
+
+    # Game manager fields and event flags
+    event_flags = start + EVENT_FLAGS_SLOT_OFFSET
+    struct.pack_into("<IiBIIBI", data, event_flags - SLOT_TAIL.size, character.deaths, 0, 0, 0, 0, 0, 0)
+    for key, offset, mask in zip(plan.keys, plan.offsets, plan.masks):
+        if int(key) in character.defeated:
+            data[event_flags + offset] |= mask
+
+
+def build_save(characters: List[SyntheticCharacter], event_ids, bst_map: Dict[int, int], seed: int = 0) -> bytes:
+    """Builds a complete save file. Deterministic for the same arguments."""
+    rng = random.Random(seed)
+    entries = _entry_layout()
+    data = bytearray(entries[-1][1] + entries[-1][2])
+
+    # BND4 header, entry table and UTF-16 entry names
+    struct.pack_into("<4s8xI", data, 0, BND4_MAGIC, len(entries))
+    struct.pack_into("<QQQQ", data, 0x10, BND4_HEADER_SIZE, int.from_bytes(b"00000001", "little"),
+                     BND4_ENTRY_HEADER_SIZE, SAVE_HEADER_SIZE)
+    struct.pack_into("<BB", data, 0x30, 1, 0x74)
+    names_offset = BND4_HEADER_SIZE + len(entries) * BND4_ENTRY_HEADER_SIZE
+    for index, (name, offset, size) in enumerate(entries):
+        encoded = name.encode("utf-16-le") + b"\x00\x00"
+        struct.pack_into("<B3xiQII", data, BND4_HEADER_SIZE + index * BND4_ENTRY_HEADER_SIZE,
+                         0x50, -1, size, offset, names_offset)
+        data[names_offset:names_offset + len(encoded)] = encoded
+        names_offset += len(encoded)
+
+    plan = FlagPlan(event_ids, bst_map)
+    summary = entries[USER_DATA_10_INDEX][1] + PROFILE_SUMMARY_OFFSET_IN_USER_DATA_10
+    for character in characters:
+        _write_slot(data, entries[character.slot_index][1], character, plan, rng)
+        entry = summary + character.slot_index * PROFILE_ENTRY_SIZE
+        name = character.name.encode("utf-16-le")[:32]
+        data[entry + 0x0E:entry + 0x0E + len(name)] = name
+        struct.pack_into("<II", data, entry + 0x30, character.level, character.seconds_played)
+
+    # Every entry starts with the MD5 of the rest of its data
+    for _, offset, size in entries:
+        data[offset:offset + SLOT_CHECKSUM_SIZE] = hashlib.md5(data[offset + SLOT_CHECKSUM_SIZE:offset + size]).digest()
+    return bytes(data)
+
+
+def write_synthetic_save(path: str, characters=3, seed: int = 0, event_ids=None):
+    """Writes a save to `path`. Returns (characters, event_ids, bst_map)."""
+    event_ids = list(event_ids) if event_ids else synthetic_event_ids(seed=seed)
+    bst_map = synthetic_bst(event_ids)
+    chosen = random_characters(event_ids, characters, seed)
+    with open(path, "wb") as f:
+        f.write(build_save(chosen, event_ids, bst_map, seed))
+    return chosen, event_ids, bst_map
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.synthetic_save", description="Write a synthetic Elden Ring save file.")
+    parser.add_argument("output", help="Output path (.sl2 or .co2, the format is the same).")
+    parser.add_argument("--characters", type=int, default=3, choices=range(1, MAX_CHARACTER_SLOTS + 1), metavar="1-10")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    characters, event_ids, _ = write_synthetic_save(args.output, args.characters, args.seed)
+    print(f"Wrote {args.output} ({os.path.getsize(args.output) / (1024 * 1024):.1f} MB)")
+    for character in characters:
+        print(f"  slot {character.slot_index}: {character.name}, level {character.level}, "
+              f"{len(character.defeated)}/{len(event_ids)} bosses, {character.deaths} deaths")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,8 @@
 
 import os
 import time
-import hashlib
 import tempfile
 import subprocess
-import requests
 import threading
 import ctypes
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QLabel, QApplication
@@ -13,6 +11,11 @@ from PySide6.QtCore import Qt, QTimer, QMetaObject, Q_ARG, Signal, QObject
 from .ui.widgets.location_section import LocationSectionWidget
 from .ui.dialogs.boss_stats_dialog import BossStatsDialog
 from .ui.dialogs.location_dialog import LocationDialog
+from .ui.dialogs.roster_dialog import RosterDialog
+from .domain.boss_search_index import BossSearchIndex
+from .services.state_snapshot import build_state_snapshot
+from .services.resumable_download import download_file, DownloadError, DownloadCancelled, IntegrityError
+from .services.http_client import get_shared_client
 from .config.app_config import LOCATION_PROGRESSION_ORDER, GAME_PHASE_HEADINGS
 
 class AppLogic:
@@ -21,9 +24,9 @@ class AppLogic:
         self.last_known_stats = {}
         self.last_killed_boss_info = None
         self.is_game_running = False
-        self.last_play_time_snapshot = -1
-        self.last_snapshot_real_time = -1
+        self.character_mismatch = False
         self._actual_save_file_path = ""  # Store the real path without UI decorations
+        self.search_index = BossSearchIndex()
 
     def browse_for_save_file(self):
         """Opens a file dialog to select the Elden Ring save file with improved logic."""
@@ -113,13 +116,16 @@ class AppLogic:
             else:
                 QMessageBox.warning(self.app, "Error", f"Failed to read characters:\n{err}")
             self.app.character_slot_combobox.setEnabled(False)
+            self.app.roster_button.setEnabled(False)
             return False
             
         if not characters:
             self.app.character_slot_combobox.setEnabled(False)
+            self.app.roster_button.setEnabled(False)
             return False
 
         self.app.character_slot_combobox.setEnabled(True)
+        self.app.roster_button.setEnabled(True)
         for char in sorted(characters, key=lambda x: x.get('slot_index', 0)):
             char_name = char.get('character_name', f"Slot {char.get('slot_index')}")
             level = char.get('character_level', '??')
@@ -202,6 +208,7 @@ class AppLogic:
                 self.last_killed_boss_info = {"name": last_defeated_boss_name, "time": 0}
             
         self.handle_stats_update(initial_data)
+        self.publish_state_snapshot()
         self.app.update_onboarding_state("done")
         
         self.app.save_monitor_logic.start_monitoring(
@@ -236,27 +243,26 @@ class AppLogic:
             section_widget.apply_status_filter(is_checked)
 
     def on_search_text_changed(self, text):
-        """Filters the displayed bosses based on the search text."""
-        for section_widget in self.app.location_widgets.values():
-            location_name = section_widget.location_name.lower()
-            
-            if text.lower() in location_name:
-                section_widget.show()
-                for row in range(section_widget.boss_table.rowCount()):
-                    section_widget.boss_table.setRowHidden(row, False)
-            else:
-                any_boss_matches = False
-                for row in range(section_widget.boss_table.rowCount()):
-                    boss_name_item = section_widget.boss_table.item(row, 0)
-                    boss_name = boss_name_item.text().lower()
-                    
-                    if text.lower() in boss_name:
-                        section_widget.boss_table.setRowHidden(row, False)
-                        any_boss_matches = True
-                    else:
-                        section_widget.boss_table.setRowHidden(row, True)
-                
-                section_widget.setVisible(any_boss_matches)
+        """Debounces the search input; the filtering itself runs in apply_search_filter."""
+        self.app.search_debounce_timer.start()
+
+    def apply_search_filter(self):
+        """Filters the displayed bosses using the prebuilt search index."""
+        matches = self.search_index.search(self.app.search_bar.text())
+
+        # Apply all visibility changes in one batch to avoid a relayout per widget.
+        container = self.app.main_boss_area_widget.widget()
+        container.setUpdatesEnabled(False)
+        try:
+            for location, section_widget in self.app.location_widgets.items():
+                if matches is None or location in matches:
+                    section_widget.apply_search_result(None if matches is None else matches[location])
+                    if section_widget.isHidden():
+                        section_widget.show()
+                elif not section_widget.isHidden():
+                    section_widget.hide()
+        finally:
+            container.setUpdatesEnabled(True)
 
     def on_boss_defeated(self, boss_event_id: str, play_time: int):
         """Slot to handle a newly defeated boss."""
@@ -297,12 +303,12 @@ class AppLogic:
 
         selected_char_name = selected_char_data.get("character_name")
 
-        if active_char_name and selected_char_name and active_char_name != selected_char_name:
+        self.character_mismatch = bool(active_char_name and selected_char_name and active_char_name != selected_char_name)
+        if self.character_mismatch:
             warning_text = f"Warning: Playing as '{active_char_name}' but '{selected_char_name}' is selected in the app."
             self.app.character_warning_label.setText(warning_text)
             self.app.character_warning_label.setVisible(True)
-            if self.app.ui_timer.isActive():
-                self.app.ui_timer.stop()
+            self.app.live_clock.stop()
             return
         else:
             self.app.character_warning_label.setVisible(False)
@@ -315,24 +321,57 @@ class AppLogic:
         final_stats_payload['defeated'] = boss_counts['total']['defeated']
         final_stats_payload['total'] = boss_counts['total']['total']
 
-        self.last_play_time_snapshot = final_stats_payload.get('seconds_played', -1)
-        self.last_snapshot_real_time = time.time()
-        
-        if self.is_game_running and self.last_play_time_snapshot >= 0 and not self.app.ui_timer.isActive():
-            self.app.ui_timer.start()
-        
         self.last_known_stats = {
             "stats": final_stats_payload,
             "boss_statuses": boss_statuses,
             "last_kill": self.last_killed_boss_info
         }
-        
-        self.app.footer.update_stats(final_stats_payload)
+
+        self._anchor_live_clock(final_stats_payload)
+        self._refresh_stats_views(final_stats_payload)
+        self.update_main_boss_area()
+
+    def handle_monitor_delta(self, delta):
+        """
+        Routes a MonitorDelta to the work it actually needs: boss changes go through the
+        full update, stat changes skip the boss table, playtime-only changes
+        re-anchor the live clock (which pushes the time to its subscribers) and
+        refresh state.json, whose consumers read the playtime from it.
+        """
+        if delta.bosses_changed or not self.last_known_stats:
+            self.handle_stats_update(delta.data)
+            return
+        if self.character_mismatch:
+            return  # Still playing a different character than the selected one
+
+        final_stats_payload = delta.data.get("stats", {}).copy()
+        previous_stats = self.last_known_stats["stats"]
+        for key in ('boss_counts', 'defeated', 'total'):
+            final_stats_payload[key] = previous_stats[key]
+        self.last_known_stats = {
+            "stats": final_stats_payload,
+            "boss_statuses": self.last_known_stats["boss_statuses"],
+            "last_kill": self.last_killed_boss_info
+        }
+
+        self._anchor_live_clock(final_stats_payload)
+        if delta.playtime_only:
+            self.app.obs_manager.update_state_file(self.last_known_stats)
+        else:
+            self._refresh_stats_views(final_stats_payload)
+
+    def _anchor_live_clock(self, stats_payload: dict):
+        """Re-anchors the shared live clock; it pushes the playtime to its subscribers."""
+        live_clock = self.app.live_clock
+        live_clock.set_snapshot(stats_payload.get('seconds_played', -1))
+        if self.is_game_running and live_clock.seconds_played() >= 0 and not live_clock.is_active():
+            live_clock.start()
+
+    def _refresh_stats_views(self, stats_payload: dict):
+        self.app.footer.update_stats(stats_payload)
         self.app.overlay_manager.update_text(self.last_known_stats)
         self.app.obs_manager.update_obs_files(self.last_known_stats)
-        
-        self.update_main_boss_area()
-        self.app.stats_section.update_stats(final_stats_payload)
+        self.app.stats_section.update_stats(stats_payload)
 
 
     def _handle_monitoring_started(self, char_name, interval):
@@ -342,72 +381,42 @@ class AppLogic:
         self.app.footer.update_monitoring_status(False)
 
     def on_game_process_status_changed(self, is_running: bool):
-        """Starts or stops the smooth UI timer based on game process status."""
+        """Starts or stops the shared live clock based on game process status."""
         self.is_game_running = is_running
         print(f"[AppLogic] Slot on_game_process_status_changed received: {is_running}") # DEBUG
         if is_running:
-            print("[AppLogic] Game process detected. Starting UI timer.") # DEBUG
-            self.last_snapshot_real_time = time.time()
-            self.app.ui_timer.start()
+            print("[AppLogic] Game process detected. Starting live clock.") # DEBUG
+            self.app.live_clock.start()
         else:
-            print("Game process stopped. Stopping UI timer.")
-            if self.last_play_time_snapshot > 0 and self.last_snapshot_real_time > 0:
-                elapsed = time.time() - self.last_snapshot_real_time
-                self.last_play_time_snapshot += elapsed
-            self.app.ui_timer.stop()
+            print("Game process stopped. Stopping live clock.")
+            self.app.live_clock.stop()
 
     def stop_ui_timer(self):
-        """Stops the UI timer and resets time snapshots."""
-        if self.app.ui_timer.isActive():
-            self.app.ui_timer.stop()
-        self.last_play_time_snapshot = -1
-        self.last_snapshot_real_time = -1
+        """Stops the live clock and resets the playtime snapshot."""
         self.is_game_running = False
+        self.app.live_clock.reset()
         self.app.footer.update_time(-1)
-        self.app.overlay_manager.update_text(self._get_current_stats_payload())
 
-    def update_live_timer(self):
-        """
-        This slot is called every second to create a smooth ticking timer.
-        """
-        if self.last_play_time_snapshot < 0:
+    def publish_state_snapshot(self, delta=None):
+        """Pushes the latest processed state to the local IPC endpoints (if enabled)."""
+        if not (self.app.state_ipc_server or self.app.status_block) or not self.last_known_stats:
             return
-
-        real_time_elapsed = time.time() - self.last_snapshot_real_time
-        
-        live_play_time = self.last_play_time_snapshot + real_time_elapsed
-        
-        # Update the main stats section and the overlay
-        self.app.stats_section.update_playtime(int(live_play_time))
-        
-        if self.app.overlay_manager.overlay_window.isVisible():
-            stats = self.last_known_stats.get("stats", {}).copy()
-            stats['seconds_played'] = int(live_play_time)
-            temp_payload = self.last_known_stats.copy()
-            temp_payload['stats'] = stats
-            self.app.overlay_manager.update_text(temp_payload)
+        snapshot = build_state_snapshot(
+            self.last_known_stats,
+            boss_data_manager=self.app.boss_data_manager,
+            timestamp_manager=self.app.timestamp_manager,
+            death_offset=self.app.obs_manager.death_offset,
+        )
+        if self.app.state_ipc_server:
+            self.app.state_ipc_server.publish(snapshot)
+        if self.app.status_block:
+            self.app.status_block.update(snapshot, self.app.boss_data_manager.get_boss_data_by_location())
 
     def force_stats_update_for_obs(self):
        """Forces a manual recalculation and pushes the latest data to OBS files."""
        if self.last_known_stats:
            self.app.obs_manager.update_obs_files(self.last_known_stats)
 
-    def _get_current_stats_payload(self) -> dict:
-        """Constructs the current payload of stats for the overlay."""
-        if not self.last_known_stats:
-            return {}
-        
-        live_play_time = self.last_play_time_snapshot
-        if self.is_game_running and self.last_snapshot_real_time > 0:
-            live_play_time += time.time() - self.last_snapshot_real_time
-
-        stats = self.last_known_stats.get("stats", {}).copy()
-        stats['seconds_played'] = int(live_play_time)
-        
-        payload = self.last_known_stats.copy()
-        payload['stats'] = stats
-        return payload
-
     def toggle_overlay_settings(self):
         """Toggles the visibility of the overlay settings panel."""
         # If the overlay panel is already visible, hide the stack.
@@ -435,6 +444,22 @@ class AppLogic:
         dialog = BossStatsDialog(boss_data, self.app)
         dialog.exec()
 
+    def show_roster_dialog(self):
+        """Shows boss progress for all characters in the save file (one read of the file)."""
+        event_ids = self.app.boss_data_manager.get_all_event_ids_to_monitor()
+        roster, err = self.app.rust_cli_handler.get_roster(self._actual_save_file_path, event_ids)
+        if err:
+            QMessageBox.warning(self.app, "Error", f"Failed to read characters:\n{err}")
+            return
+
+        for character in roster:
+            character["counts"] = self.app.boss_data_manager.count_defeated(character.get("boss_statuses", {}))
+
+        selected_data = self.app.character_slot_combobox.currentData()
+        selected_slot = selected_data.get("slot_index") if selected_data else None
+        dialog = RosterDialog(roster, selected_slot, self.app)
+        dialog.exec()
+
     def show_location_dialog(self, boss_data):
         """Shows a dialog with the boss's location."""
         # --- DEBUG MODE ---
@@ -451,6 +476,7 @@ class AppLogic:
         self._clear_boss_area()
 
         if clear:
+            self.search_index.clear()
             self.app.footer.update_stats({})
             return
 
@@ -461,6 +487,11 @@ class AppLogic:
         self._create_boss_widgets(sorted_base_game_items, expanded_states)
         self._create_boss_widgets(sorted_dlc_items, expanded_states, is_dlc=True)
 
+        # Rebuild the search index for the new widgets and keep the active search applied.
+        self.search_index.build(dict(sorted_base_game_items + sorted_dlc_items))
+        if self.app.search_bar.text():
+            self.apply_search_filter()
+
     def _clear_boss_area(self):
         """Clears the main boss area of all widgets."""
         layout = self.app.main_boss_area_widget.widget().layout()
@@ -567,110 +598,62 @@ class AppLogic:
                 return
     
             try:
-                # 1. Stažení souboru
+                # 1. Stažení souboru (hash se počítá průběžně během stahování)
                 temp_dir = tempfile.gettempdir()
                 installer_path = os.path.join(temp_dir, os.path.basename(url))
                 
                 print(f"Downloading update from {url} to {installer_path}...")
-                
-                # Better error handling for download with UI progress
+                QMetaObject.invokeMethod(
+                    self.progress_dialog,
+                    "update_status",
+                    Qt.ConnectionType.QueuedConnection,
+                    Q_ARG(str, "Downloading update...")
+                )
+
+                def on_progress(downloaded, total_size):
+                    # download_file calls this at most ~10x per second, so the UI queue stays small.
+                    if total_size > 0:
+                        QMetaObject.invokeMethod(
+                            self.progress_dialog,
+                            "update_progress",
+                            Qt.ConnectionType.QueuedConnection,
+                            Q_ARG(int, int(downloaded * 100 / total_size))
+                        )
+                        QMetaObject.invokeMethod(
+                            self.progress_dialog,
+                            "update_size",
+                            Qt.ConnectionType.QueuedConnection,
+                            Q_ARG(int, downloaded),
+                            Q_ARG(int, total_size)
+                        )
+
                 try:
-                    response = requests.get(url, stream=True, timeout=30)
-                    response.raise_for_status()
-                    
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    # Update dialog status
-                    QMetaObject.invokeMethod(
-                        self.progress_dialog,
-                        "update_status",
-                        Qt.ConnectionType.QueuedConnection,
-                        Q_ARG(str, "Downloading update...")
+                    # An interrupted download continues from the .part file on the next attempt;
+                    # the SHA-256 is checked before the installer is moved into place.
+                    download_file(
+                        url,
+                        installer_path,
+                        expected_sha256=expected_hash,
+                        progress_callback=on_progress,
+                        cancel_check=self.progress_dialog.is_cancelled,
+                        session=get_shared_client().session,
                     )
-                    
-                    with open(installer_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if hasattr(self, 'progress_dialog') and self.progress_dialog.is_cancelled():
-                                print("Download cancelled by user")
-                                return
-                            if chunk:
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                if total_size > 0:
-                                    progress = (downloaded / total_size) * 100
-                                    print(f"Download progress: {progress:.1f}%")
-                                    # Update UI progress
-                                    QMetaObject.invokeMethod(
-                                        self.progress_dialog,
-                                        "update_progress",
-                                        Qt.ConnectionType.QueuedConnection,
-                                        Q_ARG(int, int(progress))
-                                    )
-                                    QMetaObject.invokeMethod(
-                                        self.progress_dialog,
-                                        "update_size",
-                                        Qt.ConnectionType.QueuedConnection,
-                                        Q_ARG(int, downloaded),
-                                        Q_ARG(int, total_size)
-                                    )
-                    
-                    print("Download complete.")
-                    QMetaObject.invokeMethod(
-                        self.progress_dialog,
-                        "update_status",
-                        Qt.ConnectionType.QueuedConnection,
-                        Q_ARG(str, "Verifying file integrity...")
-                    )
-                except requests.exceptions.RequestException as e:
+                except DownloadCancelled:
+                    print("Download cancelled by user")
+                    return
+                except IntegrityError as e:
+                    self._show_update_error(f"Hash mismatch! {e}")
+                    return
+                except DownloadError as e:
                     print(f"Download failed: {e}")
                     if hasattr(self, 'progress_dialog'):
                         self.progress_dialog.close()
                     self._show_update_error(f"Failed to download update: {e}")
                     return
     
-                # 2. Ověření hashe
-                print("Verifying file integrity...")
-                sha256_hash = hashlib.sha256()
-                file_size = os.path.getsize(installer_path)
-                verified = 0
-
-                with open(installer_path, "rb") as f:
-                    # Zvětšit buffer na 8MB pro rychlejší čtení velkých souborů
-                    while True:
-                        # Check if cancelled during verification
-                        if hasattr(self, 'progress_dialog') and self.progress_dialog.is_cancelled():
-                            print("Verification cancelled by user")
-                            os.remove(installer_path)  # Clean up downloaded file
-                            return
-
-                        byte_block = f.read(8388608)  # 8MB chunks
-                        if not byte_block:
-                            break
-                        sha256_hash.update(byte_block)
-                        verified += len(byte_block)
-
-                        # Update progress for verification
-                        if file_size > 0:
-                            verify_progress = (verified / file_size) * 100
-                            QMetaObject.invokeMethod(
-                                self.progress_dialog,
-                                "update_progress",
-                                Qt.ConnectionType.QueuedConnection,
-                                Q_ARG(int, int(verify_progress))
-                            )
-
-                calculated_hash = sha256_hash.hexdigest()
-    
-                if calculated_hash.lower() != expected_hash.lower():
-                    error_msg = f"Hash mismatch! Expected {expected_hash}, but got {calculated_hash}."
-                    self._show_update_error(error_msg)
-                    os.remove(installer_path) # Smazat nebezpečný soubor
-                    return
-                
                 print("File integrity verified.")
     
-                # 3. Spuštění instalátoru jako správce a ukončení aplikace
+                # 2. Spuštění instalátoru jako správce a ukončení aplikace
                 print(f"Update downloaded. Waiting for user to click 'Install Now'...")
                 try:
                     # Update dialog to show completion
@@ -0,0 +1,174 @@
+# src/batch_scan.py
+"""
+Batch export of many save files (support / analytics).
+
+    python -m src.batch_scan saves/ --output report.jsonl
+    python -m src.batch_scan saves/ --output report.csv --content base --workers 8
+
+Walks a directory tree for .sl2/.co2 files and writes one row per character:
+stats and boss statuses (JSONL) or stats and defeated boss IDs (CSV). Files
+are parsed in a process pool; each worker compiles the flag plan once from
+the BST map resolved by the parent, so the BST is downloaded at most once.
+Throughput (files/s, MB/s) is printed at the end.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from .domain.boss_data_manager import BossDataManager
+from .services.save_parser import EldenRingSaveParser, FlagPlan, get_event_flag_block_map
+
+SAVE_EXTENSIONS = (".sl2", ".co2")
+CSV_COLUMNS = [
+    "file", "slot", "character_name", "level", "seconds_played", "deaths",
+    "defeated", "total", "defeated_ids", "error",
+]
+
+# Per worker process, set by _init_worker()
+_worker_plan = None
+_worker_event_ids = None
+
+
+def find_save_files(root):
+    """Returns the save files under `root` (a directory or a single file), sorted."""
+    if os.path.isfile(root):
+        return [root]
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.lower().endswith(SAVE_EXTENSIONS):
+                found.append(os.path.join(dirpath, filename))
+    return sorted(found)
+
+
+def _init_worker(event_ids, bst_map):
+    global _worker_plan, _worker_event_ids
+    _worker_event_ids = event_ids
+    _worker_plan = FlagPlan(event_ids, bst_map)
+
+
+def _scan_file(path):
+    """Worker: parses one save file. Returns (path, size_in_bytes, rows)."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    parser = EldenRingSaveParser()
+    success, err = parser.load_file(path)
+    if not success:
+        return path, size, [{"slot": None, "error": err}]
+
+    roster, err = parser.get_roster(_worker_event_ids, plan=_worker_plan)
+    if err:
+        return path, size, [{"slot": None, "error": err}]
+
+    rows = []
+    for entry in roster:
+        # The profile summary has no death counter; the slot stats do.
+        stats, stats_err = parser.get_character_stats(entry["slot_index"])
+        rows.append({
+            "slot": entry["slot_index"],
+            "character_name": entry["character_name"],
+            "level": entry["character_level"],
+            "seconds_played": entry["seconds_played"],
+            "deaths": stats["deaths"] if stats else None,
+            "defeated": entry["defeated"],
+            "total": entry["total"],
+            "boss_statuses": entry["boss_statuses"],
+            "error": entry.get("error") or stats_err,
+        })
+    return path, size, rows
+
+
+class _JsonlWriter:
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, row):
+        self.f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class _CsvWriter:
+    def __init__(self, f):
+        self.writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, row):
+        row = dict(row)
+        statuses = row.pop("boss_statuses", None) or {}
+        row["defeated_ids"] = " ".join(boss_id for boss_id, is_defeated in statuses.items() if is_defeated)
+        self.writer.writerow(row)
+
+
+def run_batch(paths, output_path, output_format, event_ids, workers=None, root=None):
+    """
+    Parses `paths` in a process pool and writes the rows to `output_path`.
+    Returns a summary dict (files, characters, errors, bytes, seconds).
+    """
+    bst_map = get_event_flag_block_map()
+    summary = {"files": 0, "characters": 0, "errors": 0, "bytes": 0, "seconds": 0.0}
+    started = time.perf_counter()
+
+    with open(output_path, "w", encoding="utf-8", newline="") as f, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(list(event_ids), bst_map)) as pool:
+        writer = _CsvWriter(f) if output_format == "csv" else _JsonlWriter(f)
+        # Small chunks keep all workers busy even when a few files are much larger.
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+        for path, size, rows in pool.map(_scan_file, paths, chunksize=chunksize):
+            summary["files"] += 1
+            summary["bytes"] += size
+            relative = os.path.relpath(path, root) if root and os.path.isdir(root) else path
+            for row in rows:
+                if row.get("error"):
+                    summary["errors"] += 1
+                if row.get("slot") is not None:
+                    summary["characters"] += 1
+                writer.write({"file": relative, **row})
+
+    summary["seconds"] = time.perf_counter() - started
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.batch_scan", description="Export characters and boss progress from many save files.")
+    parser.add_argument("root", help="Directory to scan recursively (or a single save file).")
+    parser.add_argument("--output", "-o", required=True, help="Output file (.jsonl or .csv).")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Output format (default: from the output file extension).")
+    parser.add_argument("--content", choices=["all", "base", "dlc"], default="all", help="Bosses to check.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    output_format = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+
+    paths = find_save_files(args.root)
+    if not paths:
+        print(f"No save files found in '{args.root}'.", file=sys.stderr)
+        return 2
+
+    boss_data_manager = BossDataManager()
+    boss_data_manager.load_definitions()
+    boss_data_manager.set_content_filter(args.content)
+    event_ids = boss_data_manager.get_all_event_ids_to_monitor()
+
+    summary = run_batch(paths, args.output, output_format, event_ids, args.workers, root=args.root)
+
+    seconds = max(summary["seconds"], 1e-9)
+    megabytes = summary["bytes"] / (1024 * 1024)
+    print(f"Scanned {summary['files']} files ({megabytes:.1f} MB), {summary['characters']} characters, "
+          f"{summary['errors']} errors in {summary['seconds']:.2f} s")
+    print(f"Throughput: {summary['files'] / seconds:.1f} files/s, {megabytes / seconds:.1f} MB/s")
+    print(f"Written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
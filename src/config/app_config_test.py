@@ -1,5 +1,7 @@
 # src/app_config_test.py - TEST CONFIGURATION
 
+import os
+
 # Verze aplikace
 APP_VERSION = "1.0.4"  # Simulujeme starou verzi
 
@@ -8,15 +10,48 @@ MANIFEST_URL = "http://localhost:8000/test_manifest.json"
 
 # Asset Management for large image files
 IMAGE_ASSETS_URL = "https://github.com/RysanekDavid/ER_checklist_assets/releases/download/v1.0.0/Bosses_locations.zip"
+IMAGE_ASSETS_SHA256 = None  # Set to the zip's SHA-256 to verify it while downloading
+IMAGE_ASSETS_MANIFEST_URL = None  # JSON manifest of per-image SHA-256 hashes; enables incremental image updates
+IMAGE_ASSETS_MANIFEST_URL_ENV_VAR = "TTC_IMAGE_ASSETS_MANIFEST_URL"  # Overrides the URL above; an empty value disables the updates (benchmarks)
+if IMAGE_ASSETS_MANIFEST_URL_ENV_VAR in os.environ:
+    IMAGE_ASSETS_MANIFEST_URL = os.environ[IMAGE_ASSETS_MANIFEST_URL_ENV_VAR] or None
 APP_DATA_DIR = "TheTarnishedChronicle"
 
+# QSettings location (registry on Windows); SETTINGS_FILE_ENV_VAR points it at an INI file instead (benchmarks, tests)
+SETTINGS_ORGANIZATION = "TheTarnishedChronicle"
+SETTINGS_APPLICATION = "App"
+SETTINGS_FILE_ENV_VAR = "TTC_SETTINGS_FILE"
+
 # Default overlay styles
 DEFAULT_OVERLAY_BG_COLOR_STR = "rgba(100, 100, 100, 220)"
 DEFAULT_OVERLAY_TEXT_COLOR_STR = "lightblue"
 DEFAULT_OVERLAY_FONT_SIZE_STR = "15pt"
 
 # Monitoring settings
-DEFAULT_MONITORING_INTERVAL_SEC = 5
+DEFAULT_MONITORING_INTERVAL_SEC = 5  # Base poll interval; the cadence adapts around it (see monitor_cadence.py)
+MONITOR_MIN_INTERVAL_SEC = 1  # Right after a save write
+MONITOR_ACTIVE_INTERVAL_SEC = 2  # While the game is running
+MONITOR_MAX_INTERVAL_SEC = 60  # Backoff ceiling while the game is closed
+GAME_PROCESS_NAME = "eldenring.exe"
+GAME_PROCESS_CHECK_INTERVAL_SEC = 2  # Cheap check of the known PID
+GAME_PROCESS_MAX_SCAN_INTERVAL_SEC = 30  # Full process scans back off up to this while the game is not running
+
+# Search settings
+SEARCH_DEBOUNCE_MS = 150
+
+# OBS output settings
+OBS_FLUSH_INTERVAL_SEC = 0.25  # Bursts of updates are coalesced into one write per interval
+OBS_PUSH_SERVER_PORT = 8765  # Local browser-source server (127.0.0.1 only)
+
+# Local IPC for external tools (off by default; toggled in the OBS panel, saved as "ipc/enabled" and "ipc/statusBlock")
+STATE_IPC_ENABLED = False
+STATE_IPC_STATUS_BLOCK_ENABLED = False
+STATE_IPC_SOCKET_NAME = "state.sock"
+STATE_IPC_PORT = 8766  # TCP loopback fallback where Unix sockets are unavailable
+STATUS_BLOCK_FILENAME = "status.bin"
+
+# Location images
+LOCATION_IMAGE_WIDTH = 870
 
 # Rust CLI settings
 RUST_CLI_TOOL_PATH_PLACEHOLDER = "RUST_CLI_TOOL_PATH_PLACEHOLDER"
@@ -1,9 +1,9 @@
 # src/boss_data_manager.py
-import json
 import copy
 import re
-from PySide6.QtCore import QFile, QIODevice
 from .stats_manager import StatsManager
+from .resource_loader import load_json_resource
+from ..utils import startup_trace
 
 class BossDataManager:
     def __init__(self, base_filename="boss_ids_reference.json", dlc_filename="boss_ids_reference_DLC.json", descriptions_filename="boss_descriptions.json", dlc_descriptions_filename="boss_descriptions_DLC.json"):
@@ -11,7 +11,8 @@ class BossDataManager:
         self.dlc_filename = dlc_filename
         self.descriptions_filename = descriptions_filename
         self.dlc_descriptions_filename = dlc_descriptions_filename
-        self.stats_manager = StatsManager()
+        with startup_trace.phase("StatsManager"):
+            self.stats_manager = StatsManager()
         
         # Internal storage for raw, unfiltered data
         self._base_data = {}
@@ -31,27 +32,20 @@ class BossDataManager:
         
 
     def _load_json_file(self, filename):
-        """Loads and validates a single JSON file from the Qt Resource System."""
-        # Construct the resource path
-        filepath = f":/data/Bosses/{filename}"
-        
-        qfile = QFile(filepath)
-        if not qfile.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
-            print(f"Error: Cannot open resource file '{filepath}'")
-            return {}
-            
+        """Loads and validates a single JSON file from the bundled data (Qt resources or files)."""
         try:
-            content = qfile.readAll().data().decode('utf-8')
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                print(f"ERROR: Data in resource '{filename}' is not a dictionary.")
-                return {}
-            return data
+            data = load_json_resource(f"data/Bosses/{filename}")
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return {}
         except Exception as e:
             print(f"ERROR loading resource '{filename}': {e}")
             return {}
-        finally:
-            qfile.close()
+
+        if not isinstance(data, dict):
+            print(f"ERROR: Data in resource '{filename}' is not a dictionary.")
+            return {}
+        return data
 
     def load_definitions(self):
         """Loads base and DLC definitions into internal storage."""
@@ -293,6 +287,48 @@ class BossDataManager:
             
         return counts
 
+    def count_defeated(self, statuses_dict):
+        """
+        Boss counts ({"base"|"dlc"|"total": {"defeated", "total"}}) for a statuses dict
+        of any character, computed against the template without changing the current data.
+        """
+        counts = {key: {"defeated": 0, "total": 0} for key in ("base", "dlc", "total")}
+        dlc_locations = self.get_dlc_location_names()
+
+        for loc, bosses in self._active_data_template.items():
+            if not isinstance(bosses, list):
+                continue
+            key = "dlc" if loc in dlc_locations else "base"
+            for boss in bosses:
+                if not isinstance(boss, dict):
+                    continue
+                event_id_value = boss.get("event_id")
+                ids_for_this_boss = event_id_value if isinstance(event_id_value, list) else [event_id_value]
+                defeated = any(statuses_dict.get(str(eid)) for eid in ids_for_this_boss if eid is not None)
+                for bucket in (key, "total"):
+                    counts[bucket]["total"] += 1
+                    if defeated:
+                        counts[bucket]["defeated"] += 1
+        return counts
+
+    def get_location_counts(self):
+        """
+        Returns per-location boss counts for the currently filtered data:
+        {location_name: {"defeated": int, "total": int}}.
+        """
+        location_counts = {}
+        for loc, bosses in self.boss_data_by_location.items():
+            if not isinstance(bosses, list):
+                continue
+            total = defeated = 0
+            for boss in bosses:
+                if isinstance(boss, dict):
+                    total += 1
+                    if boss.get("is_defeated", False):
+                        defeated += 1
+            location_counts[loc] = {"defeated": defeated, "total": total}
+        return location_counts
+
     def get_defeated_bosses_for_character(self, character_name: str):
         """
         Returns a list of defeated boss dictionaries for the current data set.
@@ -0,0 +1,96 @@
+# src/domain/boss_search_index.py
+import re
+from thefuzz import fuzz
+
+# Queries shorter than this only use substring matching; fuzzy scoring on
+# a handful of letters matches almost everything.
+FUZZY_MIN_QUERY_LENGTH = 5
+FUZZY_SCORE_THRESHOLD = 80
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_search_text(text: str) -> str:
+    """Lower-cases the text and collapses punctuation/whitespace into single spaces."""
+    return _NON_ALNUM.sub(" ", str(text).lower()).strip()
+
+
+class BossSearchIndex:
+    """
+    Prebuilt search index over the bosses currently shown in the main area.
+
+    The index is rebuilt whenever the location widgets are recreated, so a
+    keystroke only has to compare the query against precomputed strings
+    instead of walking every table row and lower-casing names.
+    """
+    def __init__(self):
+        # location -> (location terms, [(row, boss terms), ...])
+        self._entries = {}
+
+    def build(self, boss_data_by_location: dict):
+        """Indexes the given {location: [boss_info, ...]} mapping. Row numbers follow list order."""
+        entries = {}
+        for location, bosses in boss_data_by_location.items():
+            location_terms = self._make_terms([location])
+            rows = []
+            for row, boss_info in enumerate(bosses):
+                if not isinstance(boss_info, dict):
+                    continue
+                names = [boss_info.get("name", "")]
+                aliases = boss_info.get("aliases", [])
+                if isinstance(aliases, str):
+                    aliases = [aliases]
+                names.extend(aliases)
+                rows.append((row, self._make_terms(names)))
+            entries[location] = (location_terms, rows)
+        self._entries = entries
+
+    def clear(self):
+        self._entries = {}
+
+    def _make_terms(self, texts):
+        """Returns (spaced, compact) normalized forms for every non-empty text."""
+        terms = []
+        for text in texts:
+            spaced = normalize_search_text(text)
+            if spaced:
+                terms.append((spaced, spaced.replace(" ", "")))
+        return tuple(terms)
+
+    def _matches(self, terms, query, compact_query, use_fuzzy):
+        for spaced, compact in terms:
+            if query in spaced or compact_query in compact:
+                return True
+        if use_fuzzy:
+            for spaced, _ in terms:
+                if fuzz.partial_ratio(query, spaced) >= FUZZY_SCORE_THRESHOLD:
+                    return True
+        return False
+
+    def search(self, text: str):
+        """
+        Matches the query against the index.
+
+        Returns None if the query is empty (everything visible). Otherwise returns
+        a dict {location: visible_rows}, where visible_rows is None when the
+        location itself matched (all rows visible) or a set of matching row numbers.
+        Locations missing from the dict have no matches and should be hidden.
+        """
+        query = normalize_search_text(text)
+        if not query:
+            return None
+
+        compact_query = query.replace(" ", "")
+        use_fuzzy = len(compact_query) >= FUZZY_MIN_QUERY_LENGTH
+        results = {}
+
+        for location, (location_terms, rows) in self._entries.items():
+            if self._matches(location_terms, query, compact_query, use_fuzzy):
+                results[location] = None
+                continue
+
+            visible_rows = {row for row, terms in rows if self._matches(terms, query, compact_query, use_fuzzy)}
+            if visible_rows:
+                results[location] = visible_rows
+
+        return results
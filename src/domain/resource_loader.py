@@ -0,0 +1,60 @@
+# src/domain/resource_loader.py
+"""
+Reads the bundled data files ('data/Bosses/...', 'data/Bosses_stats/...').
+
+The GUI compiles them into Qt resources (resources_rc); when those are
+loaded they are read through QFile. Without Qt (headless daemon, scripts) or
+without compiled resources the same relative paths are read from the file
+system: the PyInstaller bundle, the project root, or the working directory.
+"""
+
+import os
+import sys
+import json
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _read_qt_resource(relative_path):
+    # Only if the app already uses Qt; importing PySide6 here would defeat the headless mode.
+    if "PySide6.QtCore" not in sys.modules:
+        return None
+    from PySide6.QtCore import QFile, QIODevice
+    qfile = QFile(f":/{relative_path}")
+    if not qfile.exists() or not qfile.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        return None
+    try:
+        return qfile.readAll().data().decode('utf-8')
+    finally:
+        qfile.close()
+
+
+def _resource_roots():
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        yield sys._MEIPASS
+    yield _PROJECT_ROOT
+    yield os.getcwd()
+
+
+def read_resource_text(relative_path):
+    """Returns the text of a bundled data file, or None if it cannot be found."""
+    text = _read_qt_resource(relative_path)
+    if text is not None:
+        return text
+    for root in _resource_roots():
+        path = os.path.join(root, *relative_path.split("/"))
+        if os.path.isfile(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+    return None
+
+
+def load_json_resource(relative_path):
+    """
+    Returns the parsed JSON of a bundled data file.
+    Raises FileNotFoundError if it does not exist and ValueError if it is not valid JSON.
+    """
+    text = read_resource_text(relative_path)
+    if text is None:
+        raise FileNotFoundError(f"Cannot open resource file '{relative_path}'")
+    return json.loads(text)
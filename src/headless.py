@@ -0,0 +1,268 @@
+# src/headless.py
+"""
+Headless monitoring daemon (no Qt, no window).
+
+    python -m src.headless --save "C:/.../ER0000.sl2"            # every character in the file
+    python -m src.headless --save ER0000.sl2:0 --save ER0000.co2:2 --obs-dir obs_output
+
+Watches the given save files / character slots with the same parser, boss
+data, timestamps and OBS outputs as the GUI and logs every change. With
+several targets, each gets its own OBS subfolder. `--once` does a single
+pass and exits (useful in CI); `--log-format json` prints one JSON object
+per event on stdout, and everything else (library messages, errors) goes to
+stderr so stdout stays valid JSONL. The exit code is 2 if no target can be
+watched or no boss definitions could be loaded.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+import contextlib
+
+from .config.app_config import (
+    OBS_FLUSH_INTERVAL_SEC, DEFAULT_MONITORING_INTERVAL_SEC, GAME_PROCESS_NAME,
+    GAME_PROCESS_CHECK_INTERVAL_SEC, GAME_PROCESS_MAX_SCAN_INTERVAL_SEC,
+    MONITOR_MIN_INTERVAL_SEC, MONITOR_ACTIVE_INTERVAL_SEC, MONITOR_MAX_INTERVAL_SEC
+)
+from .domain.boss_data_manager import BossDataManager
+from .domain.timestamp_manager import TimestampManager
+from .services.save_parser import EldenRingSaveParser
+from .services.monitor_manager import MonitorManager
+from .services.monitor_cadence import MonitorCadence
+from .services.game_process_tracker import GameProcessTracker
+from .services.obs_writer import ObsFileWriter
+from .services.obs_templates import compile_template, TemplateContext, DEFAULT_FORMATS
+from .services.state_snapshot import build_state_snapshot, read_sequence
+from .utils import format_seconds_to_hms
+
+
+class HeadlessMonitor:
+    def __init__(self, content_filter="all", obs_dir=None, log_format="text", event_stream=None):
+        self.boss_data_manager = BossDataManager()
+        self.boss_data_manager.load_definitions()
+        self.boss_data_manager.set_content_filter(content_filter)
+        self.timestamp_manager = TimestampManager()
+
+        self.monitor = MonitorManager(self.boss_data_manager.get_all_event_ids_to_monitor)
+        self.cadence = MonitorCadence(
+            min_interval=MONITOR_MIN_INTERVAL_SEC,
+            active_interval=MONITOR_ACTIVE_INTERVAL_SEC,
+            base_interval=DEFAULT_MONITORING_INTERVAL_SEC,
+            max_interval=MONITOR_MAX_INTERVAL_SEC,
+        )
+        self.process_tracker = GameProcessTracker(
+            GAME_PROCESS_NAME,
+            min_scan_interval=GAME_PROCESS_CHECK_INTERVAL_SEC,
+            max_scan_interval=GAME_PROCESS_MAX_SCAN_INTERVAL_SEC,
+        )
+
+        self.obs_dir = obs_dir
+        self.obs_writer = ObsFileWriter(flush_interval_sec=OBS_FLUSH_INTERVAL_SEC) if obs_dir else None
+        self.templates = {key: compile_template(fmt) for key, fmt in DEFAULT_FORMATS.items()}
+        self.log_format = log_format
+        self.event_stream = event_stream  # None: the current sys.stdout
+
+        self.last_kill = {}  # target key -> {"name", "time"}
+        self.session_start_defeated = {}  # target key -> defeated count at the first update
+        self.state_seq = {}  # state.json path -> last written sequence
+        self._stop = asyncio.Event()
+
+    # --- Targets ---
+
+    def add_targets(self, spec: str):
+        """Adds 'path' (every character in the file) or 'path:slot'. Returns an error message or None."""
+        path, slot = spec, None
+        match = re.match(r"^(.*):(\d)$", spec)
+        if match and not os.path.exists(spec):
+            path, slot = match.group(1), int(match.group(2))
+
+        parser = EldenRingSaveParser()
+        success, err = parser.load_file(path)
+        if not success:
+            return err
+        characters, err = parser.list_characters()
+        if err:
+            return err
+
+        for character in characters:
+            if slot is None or character['slot_index'] == slot:
+                label = f"{os.path.basename(path)}:{character['slot_index']} {character['character_name']}"
+                self.monitor.add_target(path, character['slot_index'], label)
+        if slot is not None and not any(t.key == (path, slot) for t in self.monitor.targets()):
+            return f"No character in slot {slot} of {path}"
+        return None
+
+    # --- Main loop ---
+
+    def stop(self):
+        self._stop.set()
+
+    async def run(self, once=False):
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            changes = await loop.run_in_executor(None, self.monitor.poll)
+            for target, delta in changes:
+                self._handle_delta(target, delta)
+            for target in self.monitor.targets():
+                if target.last_error:
+                    self._log("error", target, message=target.last_error)
+
+            if once:
+                break
+
+            game_running = self.process_tracker.is_running()
+            interval, _ = self.cadence.next_interval(time.monotonic(), bool(changes), game_running)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+        if self.obs_writer:
+            self.obs_writer.close()
+        self.monitor.close()
+
+    # --- Per change ---
+
+    def _handle_delta(self, target, delta):
+        data = delta.data
+        stats = data.get("stats", {})
+        character_name = stats.get("character_name")
+        seconds_played = stats.get("seconds_played", 0)
+
+        if not delta.initial:
+            for boss_id in sorted(delta.newly_defeated):
+                # Names are looked up after the statuses below are applied.
+                if character_name:
+                    self.timestamp_manager.add_timestamp(character_name, int(boss_id), seconds_played)
+
+        self.boss_data_manager.update_boss_statuses(data.get("boss_statuses", {}))
+        boss_counts = self.boss_data_manager.get_boss_counts()
+
+        if not delta.initial:
+            for boss_id in sorted(delta.newly_defeated):
+                boss_name = self.boss_data_manager.get_boss_name_by_id(boss_id)
+                self.last_kill[target.key] = {"name": boss_name, "time": seconds_played}
+                self._log("boss_defeated", target, boss_id=boss_id, boss_name=boss_name, time=seconds_played)
+
+        payload_stats = dict(stats)
+        payload_stats['boss_counts'] = boss_counts
+        payload_stats['defeated'] = boss_counts['total']['defeated']
+        payload_stats['total'] = boss_counts['total']['total']
+        payload = {
+            "stats": payload_stats,
+            "boss_statuses": data.get("boss_statuses", {}),
+            "last_kill": self.last_kill.get(target.key),
+        }
+        self.session_start_defeated.setdefault(target.key, payload_stats['defeated'])
+
+        self._log(
+            "update", target,
+            defeated=payload_stats['defeated'], total=payload_stats['total'],
+            deaths=stats.get("deaths"), level=stats.get("level"), time=seconds_played,
+        )
+        if self.obs_writer:
+            self._write_obs_outputs(target, payload)
+
+    def _write_obs_outputs(self, target, payload):
+        folder = self.obs_dir
+        if len(self.monitor.targets()) > 1:
+            folder = os.path.join(folder, re.sub(r"[^\w.-]+", "_", target.label))
+        os.makedirs(folder, exist_ok=True)
+
+        context = TemplateContext(
+            payload,
+            boss_data_manager=self.boss_data_manager,
+            session_start_defeated=self.session_start_defeated.get(target.key),
+        )
+        for key, template in self.templates.items():
+            text = "" if key == "last_boss" and not context.last_kill else template.render(context)
+            self.obs_writer.write(os.path.join(folder, f"{key}.txt"), text)
+
+        snapshot = build_state_snapshot(
+            payload,
+            boss_data_manager=self.boss_data_manager,
+            timestamp_manager=self.timestamp_manager,
+        )
+        path = os.path.join(folder, "state.json")
+        if path not in self.state_seq:
+            # Continue the sequence of an existing file so consumers never see it go backwards.
+            self.state_seq[path] = read_sequence(path)
+        self.state_seq[path] += 1
+        snapshot["seq"] = self.state_seq[path]
+        snapshot["updated_at"] = time.time()
+        self.obs_writer.write(path, json.dumps(snapshot, indent=2, ensure_ascii=False))
+
+    def _log(self, event, target, **fields):
+        if self.log_format == "json":
+            print(json.dumps({"event": event, "target": target.label, **fields}, ensure_ascii=False),
+                  file=self.event_stream or sys.stdout, flush=True)
+            return
+        if event == "update":
+            print(f"[{target.label}] Bosses {fields['defeated']}/{fields['total']}, deaths {fields['deaths']}, "
+                  f"level {fields['level']}, time {format_seconds_to_hms(fields['time'])}", flush=True)
+        elif event == "boss_defeated":
+            print(f"[{target.label}] Defeated: {fields['boss_name']} at {format_seconds_to_hms(fields['time'])}", flush=True)
+        else:
+            print(f"[{target.label}] Error: {fields.get('message')}", flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.headless", description="Monitor Elden Ring saves without the GUI.")
+    parser.add_argument("--save", action="append", required=True, metavar="PATH[:SLOT]",
+                        help="Save file to watch, optionally limited to one character slot. Repeatable.")
+    parser.add_argument("--obs-dir", help="Write the OBS text files and state.json to this folder.")
+    parser.add_argument("--content", choices=["all", "base", "dlc"], default="all", help="Bosses to track.")
+    parser.add_argument("--log-format", choices=["text", "json"], default="text")
+    parser.add_argument("--once", action="store_true", help="Read the saves once, write outputs and exit.")
+    return parser.parse_args(argv)
+
+
+async def _main(args, event_stream=None):
+    monitor = HeadlessMonitor(args.content, args.obs_dir, args.log_format, event_stream)
+    if not monitor.boss_data_manager.get_all_event_ids_to_monitor():
+        print("No boss definitions could be loaded; nothing would be tracked.", file=sys.stderr)
+        return 2
+    for spec in args.save:
+        err = monitor.add_targets(spec)
+        if err:
+            print(f"Cannot watch '{spec}': {err}", file=sys.stderr)
+            return 2
+    if not monitor.monitor.targets():
+        print("Nothing to watch.", file=sys.stderr)
+        return 2
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, monitor.stop)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+
+    await monitor.run(once=args.once)
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.log_format != "json":
+        try:
+            return asyncio.run(_main(args))
+        except KeyboardInterrupt:
+            return 0
+
+    # stdout carries only the JSON events; the prints of the shared services go to stderr
+    event_stream = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            return asyncio.run(_main(args, event_stream))
+        except KeyboardInterrupt:
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,22 +6,55 @@ import os
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from PySide6.QtWidgets import QApplication
-from src.services.asset_downloader import check_and_download_image_assets
-from src.ui.main_window import BossChecklistApp
-import resources_rc # Import the compiled resources
+from src.utils import startup_trace
+startup_trace.configure(sys.argv)
+
+with startup_trace.phase("imports"):
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent, QTimer
+    from src.services.asset_downloader import check_and_download_image_assets
+    from src.ui.main_window import BossChecklistApp
+with startup_trace.phase("resource registration"):
+    import resources_rc # Import the compiled resources
+
+
+class FirstPaintWatcher(QObject):
+    """Ends the startup trace once the window has been painted for the first time."""
+    def __init__(self, window, app):
+        super().__init__(window)
+        self.app = app
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # Runs after the paint event has been handled
+            QTimer.singleShot(0, self._finish)
+        return False
+
+    def _finish(self):
+        startup_trace.finish()
+        if startup_trace.exit_after_first_paint():
+            self.app.quit()
+
 
 def main():
     # QApplication must be created before any UI elements like progress dialogs
-    app = QApplication(sys.argv)
+    with startup_trace.phase("QApplication"):
+        app = QApplication(sys.argv)
 
     # Check for image assets before creating the main window
-    check_and_download_image_assets()
+    with startup_trace.phase("image asset check"):
+        check_and_download_image_assets()
 
-    window = BossChecklistApp()
+    with startup_trace.phase("main window"):
+        window = BossChecklistApp()
+    if startup_trace.is_enabled():
+        FirstPaintWatcher(window, app)
     window.show()
-    window.update_checker.check_for_updates()
+    if not startup_trace.exit_after_first_paint():
+        window.update_checker.check_for_updates()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
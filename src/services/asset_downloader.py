@@ -2,33 +2,42 @@
 
 import os
 import sys
-import requests
-import zipfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
 from PySide6.QtWidgets import QProgressDialog, QMessageBox, QApplication
 from PySide6.QtCore import Qt
 
-from ..config.app_config import IMAGE_ASSETS_URL, APP_VERSION
+from ..config.app_config import IMAGE_ASSETS_URL, IMAGE_ASSETS_SHA256, IMAGE_ASSETS_MANIFEST_URL, APP_VERSION
 from ..utils import get_app_data_path
+from .resumable_download import download_file, DownloadCancelled
+from .asset_pack import get_asset_pack, get_asset_pack_path, reset_asset_pack
+from .asset_updater import fetch_manifest, plan_asset_update, apply_asset_update
+from .http_client import get_shared_client
 
 def check_and_download_image_assets():
     """
-    Checks if the image assets are present and up-to-date. If not, downloads and extracts them.
+    Checks if the image assets are present and up-to-date. If not, downloads them.
+    The assets zip is kept as a single pack and read in place (see asset_pack.py);
+    an already extracted 'Bosses_locations' folder from older versions is still used.
     Returns True if assets are ready, False if there was an unrecoverable error.
     """
     app_data_path = get_app_data_path()
-    # The zip should contain the 'Bosses_locations' structure, not 'data/Bosses_locations'
+    pack_path = get_asset_pack_path()
+    # Legacy layout: the zip's 'Bosses_locations' structure extracted into app data
     image_assets_path = os.path.join(app_data_path, "Bosses_locations")
     version_file = os.path.join(app_data_path, "image_assets_version.txt")
 
-    # Check if the folder exists, is not empty, and the version file matches.
-    if os.path.exists(image_assets_path) and os.path.exists(version_file) and os.listdir(image_assets_path):
+    has_pack = os.path.exists(pack_path)
+    has_extracted = os.path.exists(image_assets_path) and os.listdir(image_assets_path)
+    if os.path.exists(version_file) and (has_pack or has_extracted):
         try:
             with open(version_file, 'r') as f:
                 local_version = f.read().strip()
             # Always consider assets up to date if they exist, regardless of version
             # to prevent re-downloading on every launch
             print(f"Image assets found (version: {local_version}). Skipping download.")
+            if IMAGE_ASSETS_MANIFEST_URL:
+                update_image_assets_incrementally()
             return True
         except Exception as e:
             print(f"Error reading version file: {e}")
@@ -45,46 +54,129 @@ def check_and_download_image_assets():
     progress.setValue(0)
     QApplication.processEvents()
 
+    def on_progress(downloaded_size, total_size):
+        # Called at most ~10x per second by download_file.
+        if total_size > 0:
+            progress.setValue(int((downloaded_size / total_size) * 100))
+            progress.setLabelText(f"Downloading Boss Images... {downloaded_size / 1048576:.1f} / {total_size / 1048576:.1f} MB")
+        QApplication.processEvents()
+
     try:
-        response = requests.get(IMAGE_ASSETS_URL, stream=True)
-        response.raise_for_status()
-        
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded_size = 0
-        
-        zip_path = os.path.join(app_data_path, "boss_locations.zip")
-
-        with open(zip_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if progress.wasCanceled():
-                    raise Exception("Download canceled by user.")
-                f.write(chunk)
-                downloaded_size += len(chunk)
-                if total_size > 0:
-                    progress.setValue(int((downloaded_size / total_size) * 100))
-                QApplication.processEvents()
+        # The open pack (if any) must be released before it can be replaced.
+        reset_asset_pack()
+        # An interrupted or cancelled download is resumed from the .part file next time.
+        download_file(
+            IMAGE_ASSETS_URL,
+            pack_path,
+            expected_sha256=IMAGE_ASSETS_SHA256,
+            progress_callback=on_progress,
+            cancel_check=progress.wasCanceled,
+            session=get_shared_client().session,
+        )
         
-        progress.setLabelText("Extracting images...")
+        progress.setLabelText("Indexing images...")
         progress.setValue(100)
         QApplication.processEvents()
 
-        # The zip file should contain a top-level 'Bosses_locations' folder.
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(app_data_path)
-        
-        os.remove(zip_path)
+        # Opening the pack validates the zip and caches its index for later starts.
+        if get_asset_pack() is None:
+            os.remove(pack_path)
+            raise Exception("The downloaded asset pack is not a valid zip file.")
 
         with open(version_file, 'w') as f:
             f.write(APP_VERSION)
 
-        print("Image assets downloaded and extracted successfully.")
+        print("Image assets downloaded successfully.")
+        progress.close()
+        return True
+
+    except DownloadCancelled:
         progress.close()
+        print("Image download canceled by user. It will resume on next start.")
         return True
 
     except Exception as e:
         progress.close()
-        error_message = f"Failed to download or extract image assets: {e}\nBoss images will not be available."
+        error_message = f"Failed to download image assets: {e}\nBoss images will not be available."
         print(error_message)
         QMessageBox.critical(None, "Asset Error", error_message)
         # We return True because the app can function without images, unlike core data.
-        return True
\ No newline at end of file
+        return True
+
+
+def _plan_with_progress(manifest):
+    """
+    Runs plan_asset_update on a worker thread. The first check of a new pack hashes
+    all of it, so a progress dialog is shown (after a short delay) meanwhile.
+    Returns the changed entries, or None if the user canceled.
+    """
+    progress = QProgressDialog("Checking Boss Images...", "Cancel", 0, 0, None)
+    progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+    progress.setWindowTitle("Checking Images")
+    progress.setMinimumDuration(500)
+    progress.setValue(0)
+
+    # The worker only writes these; QProgressDialog is only touched from this thread.
+    canceled = []
+    state = {"done": 0, "total": 0}
+    def on_progress(done, total):
+        state["done"], state["total"] = done, total
+
+    progress.canceled.connect(lambda: canceled.append(True))
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="AssetCheck") as pool:
+        future = pool.submit(plan_asset_update, manifest, on_progress, lambda: bool(canceled))
+        while not wait([future], timeout=0.05).done:
+            if state["total"]:
+                progress.setMaximum(state["total"])
+                progress.setValue(state["done"])
+                progress.setLabelText(f"Checking Boss Images... {state['done']} / {state['total']}")
+            QApplication.processEvents()
+    progress.close()
+    return future.result()
+
+
+def update_image_assets_incrementally():
+    """
+    Brings existing image assets up to date using the content-hash manifest:
+    only images that are missing or whose hash changed are downloaded.
+    Failures are not fatal; the current images stay in use.
+    """
+    manifest, err = fetch_manifest(IMAGE_ASSETS_MANIFEST_URL)
+    if err:
+        print(err)
+        return
+
+    changed = _plan_with_progress(manifest)
+    if changed is None:
+        print("Image asset check canceled.")
+        return
+    if not changed:
+        print("Image assets are up to date.")
+        return
+
+    total_bytes = sum(size or 0 for _, _, size in changed)
+    print(f"Updating {len(changed)} image(s) ({total_bytes / 1048576:.1f} MB)...")
+
+    progress = QProgressDialog("Updating Boss Images...", "Cancel", 0, len(changed), None)
+    progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+    progress.setWindowTitle("Updating Images")
+    progress.setMinimumDuration(500)
+    progress.setValue(0)
+
+    def on_progress(done_files, total_files, done_bytes):
+        progress.setValue(done_files)
+        progress.setLabelText(f"Updating Boss Images... {done_files} / {total_files}")
+        QApplication.processEvents()
+
+    # Workers poll the flag; QProgressDialog itself is only touched from this thread.
+    canceled = []
+    def cancel_check():
+        return bool(canceled)
+
+    progress.canceled.connect(lambda: canceled.append(True))
+    updated, errors = apply_asset_update(manifest, changed, progress_callback=on_progress, cancel_check=cancel_check)
+    progress.close()
+
+    print(f"Updated {updated} of {len(changed)} image(s).")
+    for error in errors:
+        print(f"  {error}")
@@ -0,0 +1,219 @@
+# src/services/asset_pack.py
+"""
+Read-only access to the image asset pack (the downloaded assets zip), without
+extracting it.
+
+The zip's central directory is resolved once into an index of
+{name: (data_offset, compressed_size, size, method, crc)} that is cached next to
+the pack, so later starts do not have to walk the archive. The pack itself is
+memory-mapped: stored entries are returned as zero-copy memoryview slices of the
+map, deflated entries are inflated straight from the mapped bytes.
+"""
+
+import os
+import json
+import mmap
+import zlib
+import struct
+import zipfile
+import threading
+
+from ..utils import get_app_data_path
+
+ASSET_PACK_FILENAME = "Bosses_locations.zip"
+ASSET_OVERRIDES_DIR = "asset_overrides"  # Images updated individually (see asset_updater.py), checked before the pack
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+
+
+class AssetPackError(Exception):
+    """The pack is missing, corrupt, or an entry could not be read."""
+
+
+def normalize_asset_name(name: str) -> str:
+    """Maps 'data/Bosses_locations/X.png', 'Bosses_locations\\X.png', ... to one lookup key."""
+    key = name.replace("\\", "/").lstrip("/")
+    if key.startswith("data/"):
+        key = key[len("data/"):]
+    return key.casefold()
+
+
+class AssetPack:
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._map = None
+        self._index = {}
+        self._names = {}
+        self.identity = ""
+
+    def open(self):
+        """Maps the pack and loads (or builds) its index. Raises AssetPackError."""
+        try:
+            st = os.stat(self.path)
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.close()
+            raise AssetPackError(f"Cannot open asset pack '{self.path}': {e}") from e
+
+        self.identity = f"{os.path.abspath(self.path)}|{st.st_size}|{st.st_mtime_ns}"
+        self._index = self._load_cached_index(st)
+        if self._index is None:
+            self._index = self._build_index()
+            self._save_index(st)
+        return self
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, name):
+        return normalize_asset_name(name) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def names(self):
+        """Normalized names of all entries."""
+        return self._index.keys()
+
+    def entry_identity(self, name):
+        """Stable identity of an entry (changes when the pack or the entry changes), or None."""
+        entry = self._index.get(normalize_asset_name(name))
+        if entry is None:
+            return None
+        return f"{self.identity}|{normalize_asset_name(name)}|{entry[4]}"
+
+    def read(self, name, verify=True):
+        """
+        Returns the entry's bytes: a zero-copy memoryview for stored entries,
+        bytes for compressed ones. Raises KeyError if the entry does not exist.
+        """
+        entry = self._index.get(normalize_asset_name(name))
+        if entry is None:
+            raise KeyError(name)
+        data_offset, compressed_size, size, method, crc = entry
+        raw = memoryview(self._map)[data_offset:data_offset + compressed_size]
+
+        if method == zipfile.ZIP_STORED:
+            data = raw
+        elif method == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(raw, -zlib.MAX_WBITS, size or zlib.DEF_BUF_SIZE)
+        else:
+            # Rare compression methods go through zipfile.
+            with zipfile.ZipFile(self.path) as zf:
+                data = zf.read(self._index_names()[normalize_asset_name(name)])
+
+        if verify and zlib.crc32(data) != crc:
+            raise AssetPackError(f"CRC mismatch for '{name}' in asset pack")
+        return data
+
+    # --- Index ---
+
+    def _index_path(self):
+        return self.path + INDEX_SUFFIX
+
+    def _load_cached_index(self, st):
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("version") != INDEX_VERSION or cached.get("size") != st.st_size or cached.get("mtime_ns") != st.st_mtime_ns:
+            return None
+        return {name: tuple(entry) for name, entry in cached.get("entries", {}).items()}
+
+    def _save_index(self, st):
+        cached = {
+            "version": INDEX_VERSION,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "entries": self._index,
+        }
+        tmp_path = self._index_path() + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cached, f, separators=(",", ":"))
+            os.replace(tmp_path, self._index_path())
+        except OSError as e:
+            print(f"Could not cache asset pack index: {e}")
+
+    def _build_index(self):
+        try:
+            with zipfile.ZipFile(self.path) as zf:
+                infos = zf.infolist()
+        except (zipfile.BadZipFile, OSError) as e:
+            raise AssetPackError(f"Asset pack '{self.path}' is not a valid zip: {e}") from e
+
+        index = {}
+        for info in infos:
+            if info.is_dir():
+                continue
+            header = _LOCAL_HEADER.unpack_from(self._map, info.header_offset)
+            if header[0] != _LOCAL_HEADER_MAGIC:
+                raise AssetPackError(f"Bad local header for '{info.filename}' in asset pack")
+            name_length, extra_length = header[9], header[10]
+            data_offset = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+            key = normalize_asset_name(info.filename)
+            index[key] = (data_offset, info.compress_size, info.file_size, info.compress_type, info.CRC)
+            self._names[key] = info.filename
+        return index
+
+    def _index_names(self):
+        """Original archive names (only needed for the zipfile fallback)."""
+        if not self._names:
+            with zipfile.ZipFile(self.path) as zf:
+                self._names = {normalize_asset_name(n): n for n in zf.namelist()}
+        return self._names
+
+
+_pack = None
+_pack_checked = False
+_pack_lock = threading.Lock()
+
+
+def get_asset_pack_path():
+    return os.path.join(get_app_data_path(), ASSET_PACK_FILENAME)
+
+
+def get_asset_override_path(name, must_exist=True):
+    """Path of an individually updated image; None if it does not exist (unless must_exist is False)."""
+    path = os.path.join(get_app_data_path(), ASSET_OVERRIDES_DIR, *normalize_asset_name(name).split("/"))
+    if must_exist and not os.path.isfile(path):
+        return None
+    return path
+
+
+def get_asset_pack():
+    """Returns the shared, opened asset pack, or None if there is no (valid) pack."""
+    global _pack, _pack_checked
+    with _pack_lock:
+        if not _pack_checked:
+            _pack_checked = True
+            path = get_asset_pack_path()
+            if os.path.exists(path):
+                try:
+                    _pack = AssetPack(path).open()
+                    print(f"Asset pack opened: {len(_pack)} entries.")
+                except AssetPackError as e:
+                    print(e)
+                    _pack = None
+        return _pack
+
+
+def reset_asset_pack():
+    """Closes the shared pack so the next get_asset_pack() reopens it (e.g. after a download)."""
+    global _pack, _pack_checked
+    with _pack_lock:
+        if _pack is not None:
+            _pack.close()
+        _pack = None
+        _pack_checked = False
@@ -0,0 +1,199 @@
+# src/services/asset_updater.py
+"""
+Incremental image asset updates driven by a content-hash manifest.
+
+Manifest format (JSON at IMAGE_ASSETS_MANIFEST_URL):
+    {
+        "base_url": "https://.../assets/",      # optional, defaults to the manifest's folder
+        "files": {
+            "Bosses_locations/Limgrave/Margit.png": {"sha256": "...", "size": 123456},
+            ...
+        }
+    }
+
+Local images (asset pack entries, already extracted legacy files and earlier
+overrides) are hashed once and cached; only images whose hash differs or that
+are missing are downloaded, into the overrides folder that the image loader
+checks before the pack.
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, quote
+
+from ..utils import get_app_data_path
+from .asset_pack import get_asset_pack, get_asset_override_path, normalize_asset_name
+from .resumable_download import download_file, DownloadError, DownloadCancelled
+from .http_client import get_shared_client
+
+HASH_CACHE_FILENAME = "asset_hashes.json"
+MAX_WORKERS = 4
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def fetch_manifest(manifest_url, client=None):
+    """Downloads (or revalidates the cached copy of) the manifest. Returns (manifest, err)."""
+    manifest, err = (client or get_shared_client()).fetch_json(manifest_url)
+    if err:
+        return None, f"Could not fetch asset manifest: {err}"
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+        return None, "Asset manifest has no 'files' table."
+    manifest.setdefault("base_url", manifest_url.rsplit("/", 1)[0] + "/")
+    return manifest, None
+
+
+def plan_asset_update(manifest, progress_callback=None, cancel_check=None):
+    """
+    Returns the manifest entries [(name, sha256, size), ...] that are missing or different locally,
+    or None if cancel_check() turned true. The first run after a new pack hashes every pack
+    entry, so call it off the GUI thread; progress_callback(done_entries, total_entries) reports it.
+    """
+    local_hashes = _local_asset_hashes(manifest["files"], progress_callback, cancel_check)
+    if local_hashes is None:
+        return None
+    changed = []
+    for name, info in manifest["files"].items():
+        expected = str(info.get("sha256", "")).lower()
+        if expected and local_hashes.get(normalize_asset_name(name)) != expected:
+            changed.append((name, expected, info.get("size")))
+    return changed
+
+
+def apply_asset_update(manifest, changed, progress_callback=None, cancel_check=None, max_workers=MAX_WORKERS, client=None):
+    """
+    Downloads the changed images into the overrides folder with a bounded pool
+    over the shared client's connection pool.
+    progress_callback(done_files, total_files, done_bytes). Returns (updated_count, errors).
+    """
+    if not changed:
+        return 0, []
+
+    errors = []
+    updated = done_files = done_bytes = 0
+    hash_cache = _load_hash_cache()
+
+    session = (client or get_shared_client()).session
+
+    def fetch(name, sha256):
+        dest_path = get_asset_override_path(name, must_exist=False)
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        url = urljoin(manifest["base_url"], quote(name.replace("\\", "/")))
+        download_file(url, dest_path, expected_sha256=sha256, session=session, cancel_check=cancel_check)
+        return name, sha256, dest_path
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AssetUpdate") as pool:
+        futures = {pool.submit(fetch, name, sha256): (name, size) for name, sha256, size in changed}
+        for future in as_completed(futures):
+            name, size = futures[future]
+            try:
+                _, sha256, dest_path = future.result()
+                _remember_hash(hash_cache, dest_path, sha256)
+                updated += 1
+                done_bytes += size or 0
+            except DownloadCancelled:
+                for other in futures:
+                    other.cancel()
+                errors.append("Canceled by user.")
+                break
+            except (DownloadError, OSError) as e:
+                errors.append(f"{name}: {e}")
+            done_files += 1
+            if progress_callback:
+                progress_callback(done_files, len(changed), done_bytes)
+
+    _save_hash_cache(hash_cache)
+    return updated, errors
+
+
+# --- Local state ---
+
+def _local_asset_hashes(manifest_files, progress_callback=None, cancel_check=None):
+    """
+    SHA-256 of every local image (override > pack > extracted file), keyed by normalized name.
+    Returns None if canceled while hashing the pack (nothing is cached then).
+    """
+    hash_cache = _load_hash_cache()
+    hashes = {}
+
+    pack = get_asset_pack()
+    if pack is not None:
+        pack_hashes = hash_cache.setdefault("packs", {}).get(pack.identity)
+        if pack_hashes is None:
+            # One full pass over the pack; cached until the pack file changes.
+            pack_hashes = {}
+            names = pack.names()
+            for done, name in enumerate(names, 1):
+                if cancel_check and cancel_check():
+                    return None
+                pack_hashes[name] = hashlib.sha256(pack.read(name, verify=False)).hexdigest()
+                if progress_callback:
+                    progress_callback(done, len(names))
+            hash_cache["packs"] = {pack.identity: pack_hashes}
+        hashes.update(pack_hashes)
+
+    legacy_root = get_app_data_path()
+    for name in manifest_files:
+        key = normalize_asset_name(name)
+        override_path = get_asset_override_path(name)
+        if override_path:
+            hashes[key] = _hash_file_cached(hash_cache, override_path)
+        elif key not in hashes:
+            legacy_path = os.path.join(legacy_root, *name.replace("\\", "/").split("/"))
+            if os.path.isfile(legacy_path):
+                hashes[key] = _hash_file_cached(hash_cache, legacy_path)
+
+    _save_hash_cache(hash_cache)
+    return hashes
+
+
+def _hash_file_cached(hash_cache, path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    stamp = [st.st_size, st.st_mtime_ns]
+    cached = hash_cache.setdefault("files", {}).get(path)
+    if cached and cached[:2] == stamp:
+        return cached[2]
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            hasher.update(block)
+    digest = hasher.hexdigest()
+    hash_cache["files"][path] = stamp + [digest]
+    return digest
+
+
+def _remember_hash(hash_cache, path, sha256):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    hash_cache.setdefault("files", {})[path] = [st.st_size, st.st_mtime_ns, sha256]
+
+
+def _hash_cache_path():
+    return os.path.join(get_app_data_path(), HASH_CACHE_FILENAME)
+
+
+def _load_hash_cache():
+    try:
+        with open(_hash_cache_path(), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_hash_cache(hash_cache):
+    path = _hash_cache_path()
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(hash_cache, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not save asset hash cache: {e}")
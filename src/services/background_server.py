@@ -0,0 +1,105 @@
+# src/services/background_server.py
+import asyncio
+import threading
+
+
+class BackgroundServer:
+    """
+    Base for small asyncio servers that run on their own thread next to the Qt event loop.
+
+    Subclasses implement `_create_server()` (returning an asyncio Server whose client
+    callback is wrapped with `_tracked`) and may override `_on_stopping()` to release
+    waiting clients. `call_soon` is the only safe way to touch server state from
+    other threads.
+    """
+    name = "BackgroundServer"
+
+    def __init__(self):
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._connections = set()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Starts the server thread. Returns False if the server could not be created."""
+        if self.is_running():
+            return True
+
+        started = threading.Event()
+        result = {}
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                self._server = loop.run_until_complete(self._create_server())
+            except OSError as e:
+                result["error"] = e
+                started.set()
+                loop.close()
+                return
+            self._loop = loop
+            started.set()
+            try:
+                loop.run_forever()
+            finally:
+                self._server.close()
+                loop.run_until_complete(self._server.wait_closed())
+                # Give connection handlers a moment to finish after their sockets were closed.
+                pending = asyncio.all_tasks(loop)
+                if pending:
+                    loop.run_until_complete(asyncio.wait(pending, timeout=1))
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        started.wait()
+
+        if "error" in result:
+            print(f"Could not start {self.name} on {self.address()}: {result['error']}")
+            self._thread = None
+            return False
+        print(f"{self.name} listening on {self.address()}")
+        return True
+
+    def stop(self):
+        if not self.is_running():
+            return
+        loop = self._loop
+        loop.call_soon_threadsafe(self._close_connections)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        self._thread = None
+        self._loop = None
+
+    def call_soon(self, callback, *args):
+        """Schedules callback(*args) on the server's event loop; ignored when not running."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def _tracked(self, handler):
+        """Wraps a client callback so its connection is closed when the server stops."""
+        async def run_handler(reader, writer):
+            self._connections.add(writer)
+            try:
+                await handler(reader, writer)
+            finally:
+                self._connections.discard(writer)
+        return run_handler
+
+    def _close_connections(self):
+        self._on_stopping()
+        for writer in list(self._connections):
+            writer.close()
+
+    def address(self) -> str:
+        raise NotImplementedError
+
+    async def _create_server(self):
+        raise NotImplementedError
+
+    def _on_stopping(self):
+        pass
@@ -0,0 +1,108 @@
+# src/services/bnd4.py
+"""
+BND4 container directory of a save file.
+
+A PC save is a BND4 archive: a header, a table of entries (USER_DATA000..011)
+and their data. The directory (entry name, data offset, size) is read from
+the file instead of assuming `0x300 + i * 0x280010`, so .co2 files, exports
+and patched layouts resolve correctly. Parsing it touches a few hundred
+bytes; the result is still cached per file identity (path, size, mtime) so
+every poll of an unchanged layout reuses it. Entry data is handed out as
+zero-copy memoryviews and the per-entry MD5 checksums are only verified on
+request.
+"""
+
+import os
+import hashlib
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from .save_layout import (
+    BND4_MAGIC, BND4_HEADER, BND4_ENTRY, BND4_HEADER_SIZE, SLOT_CHECKSUM_SIZE, decode_utf16
+)
+
+_CACHE_SIZE = 16
+_directory_cache = OrderedDict()  # (path, size, mtime_ns) -> Bnd4Directory
+
+
+class Bnd4Entry(NamedTuple):
+    index: int
+    name: str
+    data_offset: int
+    size: int
+
+
+class Bnd4Directory:
+    def __init__(self, entries, file_size: int):
+        self.entries = entries
+        self.file_size = file_size
+        self._checksums = {}  # entry index -> bool, verified lazily
+
+    def __len__(self):
+        return len(self.entries)
+
+    def entry(self, index: int) -> Optional[Bnd4Entry]:
+        return self.entries[index] if 0 <= index < len(self.entries) else None
+
+    def view(self, data, index: int) -> Optional[memoryview]:
+        """Zero-copy view of an entry's data (including its checksum prefix)."""
+        entry = self.entry(index)
+        if entry is None:
+            return None
+        return memoryview(data)[entry.data_offset:entry.data_offset + entry.size]
+
+    def checksum_ok(self, data, index: int) -> Optional[bool]:
+        """
+        True if the entry's leading MD5 matches the rest of its data (PC saves).
+        Computed once per directory, i.e. once per file version. None for unknown entries.
+        """
+        if index in self._checksums:
+            return self._checksums[index]
+        view = self.view(data, index)
+        if view is None or len(view) <= SLOT_CHECKSUM_SIZE:
+            return None
+        ok = hashlib.md5(view[SLOT_CHECKSUM_SIZE:]).digest() == bytes(view[:SLOT_CHECKSUM_SIZE])
+        self._checksums[index] = ok
+        return ok
+
+
+def parse_directory(data) -> Tuple[Optional[Bnd4Directory], Optional[str]]:
+    """Parses the BND4 header and entry table. Returns (directory, error)."""
+    if len(data) < BND4_HEADER_SIZE:
+        return None, "File too small for a BND4 header"
+    header = BND4_HEADER.unpack_from(data, 0)
+    if header["magic"] != BND4_MAGIC:
+        return None, "Not a BND4 container"
+
+    stride = header["entry_header_size"]
+    count = header["entry_count"]
+    if stride < BND4_ENTRY.size or count == 0 or header["header_size"] + count * stride > len(data):
+        return None, f"Invalid BND4 entry table ({count} entries of 0x{stride:X} bytes)"
+
+    entries = []
+    for index in range(count):
+        raw = BND4_ENTRY.unpack_from(data, header["header_size"] + index * stride)
+        data_offset, size = raw["data_offset"], raw["size"]
+        if data_offset + size > len(data):
+            return None, f"BND4 entry {index} (0x{data_offset:X} + 0x{size:X}) is outside the file"
+        name = ""
+        if header["unicode"] and 0 < raw["name_offset"] < len(data):
+            name = decode_utf16(bytes(data[raw["name_offset"]:raw["name_offset"] + 64]))
+        entries.append(Bnd4Entry(index, name, data_offset, size))
+    return Bnd4Directory(entries, len(data)), None
+
+
+def get_directory(path: str, data, mtime_ns: int) -> Tuple[Optional[Bnd4Directory], Optional[str]]:
+    """parse_directory() cached per (path, size, mtime). Errors are not cached."""
+    key = (os.path.abspath(path), len(data), mtime_ns)
+    directory = _directory_cache.get(key)
+    if directory is not None:
+        _directory_cache.move_to_end(key)
+        return directory, None
+
+    directory, err = parse_directory(data)
+    if directory is not None:
+        _directory_cache[key] = directory
+        if len(_directory_cache) > _CACHE_SIZE:
+            _directory_cache.popitem(last=False)
+    return directory, err
@@ -0,0 +1,67 @@
+# src/services/game_process_tracker.py
+import time
+import psutil
+
+
+class GameProcessTracker:
+    """
+    Cheap "is the game running?" check.
+
+    Once the game process is found its PID and create time are remembered, so later
+    checks are a single lookup of that PID (the create time guards against the PID
+    being reused by another process). The full process scan only runs while the game
+    is not known to be running, and backs off from min_scan_interval to
+    max_scan_interval while it keeps missing.
+    """
+
+    def __init__(self, process_name="eldenring.exe", min_scan_interval=2.0, max_scan_interval=30.0):
+        self.process_name = process_name.lower()
+        self.min_scan_interval = min_scan_interval
+        self.max_scan_interval = max_scan_interval
+        self._pid = None
+        self._create_time = None
+        self._scan_interval = min_scan_interval
+        self._next_scan = 0.0
+
+    def is_running(self) -> bool:
+        if self._pid is not None:
+            if self._is_tracked_process_alive():
+                return True
+            # The game just exited; it is likely to be restarted soon, so scan eagerly again.
+            self._pid = None
+            self._create_time = None
+            self.reset_backoff()
+
+        now = time.monotonic()
+        if now < self._next_scan:
+            return False
+
+        if self._scan():
+            self._scan_interval = self.min_scan_interval
+            return True
+
+        self._next_scan = now + self._scan_interval
+        self._scan_interval = min(self._scan_interval * 2, self.max_scan_interval)
+        return False
+
+    def reset_backoff(self):
+        """Makes the next is_running() call do a full scan (e.g. when monitoring starts)."""
+        self._scan_interval = self.min_scan_interval
+        self._next_scan = 0.0
+
+    def _is_tracked_process_alive(self) -> bool:
+        if not psutil.pid_exists(self._pid):
+            return False
+        try:
+            return psutil.Process(self._pid).create_time() == self._create_time
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+
+    def _scan(self) -> bool:
+        for proc in psutil.process_iter(['name', 'create_time']):
+            name = proc.info['name']
+            if name and name.lower() == self.process_name:
+                self._pid = proc.pid
+                self._create_time = proc.info['create_time']
+                return True
+        return False
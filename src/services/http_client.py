@@ -0,0 +1,167 @@
+# src/services/http_client.py
+"""
+Shared HTTP client for the app's network I/O (update manifest, image assets,
+event flag BST).
+
+One pooled requests.Session with keep-alive, retry with exponential backoff for
+transient failures, default timeouts, and a small disk cache for conditional
+requests: a cached response is revalidated with If-None-Match /
+If-Modified-Since, so repeated startup checks usually end in a 304.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = (10, 30)  # (connect, read) seconds
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5  # 0.5 s, 1 s, 2 s, ...
+POOL_MAXSIZE = 8
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_CACHE_DIR = "http_cache"
+
+
+class HttpClient:
+    def __init__(self, cache_dir=None, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                 timeout=DEFAULT_TIMEOUT, pool_maxsize=POOL_MAXSIZE):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url, **kwargs):
+        """session.get with the client's default timeout."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def fetch(self, url, use_cache=True, offline_fallback=True):
+        """
+        Returns (body_bytes, err). With use_cache, a cached copy is revalidated with a
+        conditional request (a 304 returns it without downloading) and, with
+        offline_fallback, is also used when the server cannot be reached (connection
+        error or timeout). An HTTP error status is returned as an error; a 404/410
+        also drops the cached copy.
+        """
+        body_path, meta_path = self._cache_paths(url) if use_cache and self.cache_dir else (None, None)
+        meta = self._read_meta(meta_path) if body_path and os.path.exists(body_path) else {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.get(url, headers=headers)
+            if response.status_code == 304 and meta:
+                return self._read_body(body_path)
+            response.raise_for_status()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if meta and offline_fallback:
+                print(f"Network error for {url} ({e}), using cached copy.")
+                return self._read_body(body_path)
+            return None, f"Request failed: {e}"
+        except requests.HTTPError as e:
+            if meta and e.response is not None and e.response.status_code in (404, 410):
+                self._discard(body_path, meta_path)
+            return None, f"Request failed: {e}"
+        except requests.RequestException as e:
+            return None, f"Request failed: {e}"
+
+        body = response.content
+        if body_path:
+            self._store(body_path, meta_path, url, response, body)
+        return body, None
+
+    def fetch_json(self, url, use_cache=True, offline_fallback=True):
+        """Like fetch(), decoded as JSON. Returns (data, err)."""
+        body, err = self.fetch(url, use_cache=use_cache, offline_fallback=offline_fallback)
+        if err:
+            return None, err
+        try:
+            return json.loads(body), None
+        except ValueError as e:
+            return None, f"Invalid JSON from {url}: {e}"
+
+    def close(self):
+        self.session.close()
+
+    # --- Disk cache ---
+
+    def _cache_paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.body", f"{base}.json"
+
+    @staticmethod
+    def _read_meta(meta_path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _read_body(body_path):
+        try:
+            with open(body_path, "rb") as f:
+                return f.read(), None
+        except OSError as e:
+            return None, f"Could not read cached response: {e}"
+
+    @staticmethod
+    def _discard(body_path, meta_path):
+        for path in (meta_path, body_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _store(body_path, meta_path, url, response, body):
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with
+        meta = {"url": url, "etag": etag, "last_modified": last_modified}
+        try:
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            with open(f"{body_path}.tmp", "wb") as f:
+                f.write(body)
+            os.replace(f"{body_path}.tmp", body_path)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except OSError as e:
+            print(f"Could not cache response for {url}: {e}")
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_shared_client() -> HttpClient:
+    """The app-wide client (created on first use, cache in the app data folder)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            from ..utils import get_app_data_path
+            _client = HttpClient(cache_dir=os.path.join(get_app_data_path(), HTTP_CACHE_DIR))
+        return _client
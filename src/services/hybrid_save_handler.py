@@ -96,6 +96,17 @@ class HybridSaveHandler:
         self._last_used = "none"
         return None, "Python parser failed. Rust CLI not available as fallback."
     
+    def get_roster(self, save_file_path: str, event_ids: List[int]) -> Tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        Boss statuses for all characters in one pass.
+        Only the Python parser supports this; the Rust CLI has no equivalent command.
+        """
+        try:
+            return self._python_handler.get_roster(save_file_path, event_ids)
+        except Exception as e:
+            print(f"[HybridHandler] Python parser exception for get_roster: {e}")
+            return None, f"Could not read the character roster: {e}"
+    
     def get_last_used_parser(self) -> str:
         """Returns which parser was last used: 'python', 'rust', or 'none'"""
         return self._last_used
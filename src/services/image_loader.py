@@ -0,0 +1,186 @@
+# src/services/image_loader.py
+import os
+import hashlib
+from collections import OrderedDict
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool, QSize, QMutex, QMutexLocker, QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QImage, QImageReader
+
+from ..utils import get_app_data_path, get_image_path
+from .asset_pack import get_asset_pack, get_asset_override_path, AssetPackError
+
+THUMBNAIL_CACHE_DIR = "thumbnail_cache"
+MEMORY_CACHE_SIZE = 24  # Scaled images kept in memory (~2 MB each at 870 px)
+
+# Requests for a dialog that is being opened go before prefetches.
+REQUEST_PRIORITY = 1
+PREFETCH_PRIORITY = 0
+
+
+def _source_identity(image_name: str):
+    """Identity of an updated image, else of the pack entry, else of the loose file; None if missing."""
+    source_path = get_asset_override_path(image_name)
+    if source_path is None:
+        pack = get_asset_pack()
+        if pack is not None:
+            identity = pack.entry_identity(image_name)
+            if identity is not None:
+                return identity
+        source_path = get_image_path(image_name)
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(source_path)}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def _source_key(image_name: str, width: int):
+    """Cache key for a source image at a target width, or None if the source does not exist."""
+    identity = _source_identity(image_name)
+    if identity is None:
+        return None
+    return hashlib.sha1(f"{identity}|{width}".encode('utf-8')).hexdigest()
+
+
+class _ImageLoadTask(QRunnable):
+    """Decodes (or reads from the thumbnail cache) one image on a worker thread."""
+    def __init__(self, loader, image_name, width, key):
+        super().__init__()
+        self.loader = loader
+        self.image_name = image_name
+        self.width = width
+        self.key = key
+
+    def run(self):
+        image = self.loader._load_scaled_image(self.image_name, self.width, self.key)
+        self.loader._finish(self.image_name, self.width, self.key, image)
+
+
+class LocationImageLoader(QObject):
+    """
+    Loads location images off the GUI thread.
+
+    Images are addressed by their asset name (the boss data's 'location_image'),
+    read from the asset pack when there is one and from loose files otherwise.
+    They are decoded with QImageReader directly at the target size and stored
+    in an on-disk thumbnail cache (keyed by source identity and width) plus a
+    small in-memory LRU, so reopening a location is instant.
+    """
+    # (image_name, width, image) - image is null if it could not be loaded
+    image_ready = Signal(str, int, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount() - 1)))
+        self._cache_dir = os.path.join(get_app_data_path(), THUMBNAIL_CACHE_DIR)
+        self._mutex = QMutex()
+        self._memory_cache = OrderedDict()  # key -> QImage
+        self._in_flight = set()
+
+    def cached_image(self, image_name: str, width: int):
+        """Returns the scaled image if it is already in memory, else None."""
+        key = _source_key(image_name, width)
+        if key is None:
+            return None
+        with QMutexLocker(self._mutex):
+            image = self._memory_cache.get(key)
+            if image is not None:
+                self._memory_cache.move_to_end(key)
+            return image
+
+    def request(self, image_name: str, width: int):
+        """Starts loading the image; `image_ready` is emitted when it is available."""
+        self._schedule(image_name, width, REQUEST_PRIORITY)
+
+    def prefetch(self, image_names, width: int):
+        """Warms the caches for images that are likely to be opened soon."""
+        for image_name in image_names:
+            if self.cached_image(image_name, width) is None:
+                self._schedule(image_name, width, PREFETCH_PRIORITY)
+
+    def _schedule(self, image_name, width, priority):
+        key = _source_key(image_name, width)
+        if key is None:
+            self.image_ready.emit(image_name, width, QImage())
+            return
+        with QMutexLocker(self._mutex):
+            if key in self._in_flight:
+                return
+            self._in_flight.add(key)
+        self._pool.start(_ImageLoadTask(self, image_name, width, key), priority)
+
+    def _load_scaled_image(self, image_name, width, key):
+        """Runs on a worker thread: thumbnail cache first, then a scaled decode of the source."""
+        with QMutexLocker(self._mutex):
+            image = self._memory_cache.get(key)
+        if image is not None:
+            return image
+
+        thumbnail_path = os.path.join(self._cache_dir, f"{key}.png")
+        if os.path.exists(thumbnail_path):
+            image = QImage(thumbnail_path)
+            if not image.isNull():
+                return image
+
+        buffer = None
+        pack = get_asset_pack()
+        override_path = get_asset_override_path(image_name)
+        if override_path is not None:
+            reader = QImageReader(override_path)
+        elif pack is not None and image_name in pack:
+            try:
+                data = pack.read(image_name)
+            except AssetPackError as e:
+                print(e)
+                return QImage()
+            # QByteArray owns its data and PySide6 cannot wrap a memoryview (fromRawData only
+            # takes str), so a stored entry's view into the mapped file is copied twice here
+            # (to bytes, then into Qt); an inflated entry is already bytes and copied once.
+            buffer = QBuffer()
+            buffer.setData(QByteArray(data.tobytes() if isinstance(data, memoryview) else data))
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            reader = QImageReader(buffer)
+        else:
+            reader = QImageReader(get_image_path(image_name))
+        source_size = reader.size()
+        if source_size.isValid() and source_size.width() > 0 and source_size.width() != width:
+            height = round(source_size.height() * width / source_size.width())
+            reader.setScaledSize(QSize(width, height))
+        image = reader.read()
+        if image.isNull():
+            print(f"Failed to load image '{image_name}': {reader.errorString()}")
+            return image
+
+        self._store_thumbnail(thumbnail_path, image)
+        return image
+
+    def _store_thumbnail(self, thumbnail_path, image):
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp_path = f"{thumbnail_path}.tmp"
+            if image.save(tmp_path, "PNG"):
+                os.replace(tmp_path, thumbnail_path)
+        except OSError as e:
+            print(f"Could not write thumbnail cache '{thumbnail_path}': {e}")
+
+    def _finish(self, image_name, width, key, image):
+        with QMutexLocker(self._mutex):
+            self._in_flight.discard(key)
+            if not image.isNull():
+                self._memory_cache[key] = image
+                self._memory_cache.move_to_end(key)
+                while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                    self._memory_cache.popitem(last=False)
+        # Emitted from the worker thread; Qt queues it to receivers on the GUI thread.
+        self.image_ready.emit(image_name, width, image)
+
+
+_loader = None
+
+
+def get_location_image_loader() -> LocationImageLoader:
+    """Returns the shared loader (created lazily on the GUI thread)."""
+    global _loader
+    if _loader is None:
+        _loader = LocationImageLoader()
+    return _loader
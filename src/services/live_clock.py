@@ -0,0 +1,68 @@
+# src/services/live_clock.py
+import time
+from PySide6.QtCore import QObject, Signal, QTimer
+
+
+class LiveClock(QObject):
+    """
+    Shared 1 Hz clock that extrapolates the in-game playtime between save reads.
+
+    Subscribers connect to `seconds_changed` and receive only the derived
+    `seconds_played` value; the signal fires only when that value changes.
+    """
+    seconds_changed = Signal(int)
+
+    def __init__(self, parent=None, interval_ms=1000):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._publish)
+
+        self._snapshot_seconds = -1
+        self._snapshot_real_time = -1.0
+        self._last_published = None
+
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def set_snapshot(self, seconds_played: int):
+        """Re-anchors the clock to a playtime value read from the save file."""
+        self._snapshot_seconds = seconds_played if seconds_played is not None else -1
+        self._snapshot_real_time = time.monotonic()
+        self._publish()
+
+    def start(self):
+        """Starts ticking from the current snapshot. Time spent stopped is not counted."""
+        self._snapshot_real_time = time.monotonic()
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self):
+        """Stops ticking and keeps the playtime reached so far."""
+        if self._timer.isActive():
+            if self._snapshot_seconds >= 0:
+                self._snapshot_seconds += time.monotonic() - self._snapshot_real_time
+            self._timer.stop()
+        self._snapshot_real_time = time.monotonic()
+
+    def reset(self):
+        """Stops the clock and clears the snapshot (no character selected)."""
+        self._timer.stop()
+        self._snapshot_seconds = -1
+        self._snapshot_real_time = -1.0
+        self._publish()
+
+    def seconds_played(self) -> int:
+        """Returns the current live playtime in seconds, or -1 if unknown."""
+        if self._snapshot_seconds < 0:
+            return -1
+        seconds = self._snapshot_seconds
+        if self._timer.isActive():
+            seconds += time.monotonic() - self._snapshot_real_time
+        return int(seconds)
+
+    def _publish(self):
+        seconds = self.seconds_played()
+        if seconds != self._last_published:
+            self._last_published = seconds
+            self.seconds_changed.emit(seconds)
@@ -0,0 +1,76 @@
+# src/services/monitor_cadence.py
+
+
+class MonitorCadence:
+    """
+    Decides how long SaveMonitorLogic waits before the next save poll.
+
+    - Right after a save write: poll at min_interval (kills are followed by more writes).
+    - While the game is running: active_interval, relaxing towards base_interval once
+      the save has been stable for a couple of (learned) autosave periods.
+    - While the game is closed: back off exponentially from base_interval to max_interval.
+
+    The autosave interval is learned as an exponential moving average of the gaps
+    between observed save writes. Times are monotonic seconds supplied by the caller.
+    """
+
+    RECENT_WRITE_WINDOW_SEC = 10.0
+    DEFAULT_STABLE_AFTER_SEC = 60.0
+    MAX_LEARNED_GAP_SEC = 600.0  # Longer gaps are pauses, not autosaves
+    EMA_ALPHA = 0.3
+
+    def __init__(self, min_interval=1.0, active_interval=2.0, base_interval=5.0, max_interval=60.0):
+        self.min_interval = min_interval
+        self.active_interval = active_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.autosave_interval = None
+        self.reset()
+
+    def reset(self):
+        self.interval = self.min_interval
+        self.reason = "monitoring started"
+        self._last_write = None
+        self._backoff_interval = self.base_interval
+
+    def on_game_state_changed(self, is_running: bool):
+        """A game start/exit is a good moment to look at the save again soon."""
+        self._backoff_interval = self.base_interval
+        return self._set(self.min_interval, "game started" if is_running else "game exited")
+
+    def next_interval(self, now: float, save_written: bool, game_running: bool):
+        """Records the result of a poll and returns (interval_sec, reason) for the next one."""
+        if save_written:
+            if self._last_write is not None:
+                gap = now - self._last_write
+                if self.min_interval <= gap <= self.MAX_LEARNED_GAP_SEC:
+                    if self.autosave_interval is None:
+                        self.autosave_interval = gap
+                    else:
+                        self.autosave_interval += self.EMA_ALPHA * (gap - self.autosave_interval)
+            self._last_write = now
+            self._backoff_interval = self.base_interval
+            return self._set(self.min_interval, "save written")
+
+        since_write = now - self._last_write if self._last_write is not None else None
+        if since_write is not None and since_write < self.RECENT_WRITE_WINDOW_SEC:
+            return self._set(self.min_interval, "recent save write")
+
+        if game_running:
+            stable_after = 2 * self.autosave_interval if self.autosave_interval else self.DEFAULT_STABLE_AFTER_SEC
+            if since_write is None or since_write < stable_after:
+                return self._set(self.active_interval, "game running")
+            # Player is idle in game: relax, but never sleep through a whole autosave period.
+            ceiling = self.base_interval
+            if self.autosave_interval:
+                ceiling = max(self.active_interval, min(ceiling, self.autosave_interval / 2))
+            return self._set(ceiling, "game running, save stable")
+
+        interval = self._backoff_interval
+        self._backoff_interval = min(self._backoff_interval * 2, self.max_interval)
+        return self._set(interval, "game not running")
+
+    def _set(self, interval, reason):
+        self.interval = interval
+        self.reason = reason
+        return interval, reason
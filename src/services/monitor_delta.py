@@ -0,0 +1,71 @@
+# src/services/monitor_delta.py
+"""
+What changed between two monitor payloads ({"stats": {...}, "boss_statuses": {...}}).
+
+SaveMonitorLogic emits a MonitorDelta per change so consumers can skip work
+that the change does not affect; most saves only advance the playtime.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class MonitorDelta:
+    data: dict  # The complete new payload, for consumers that need everything
+    initial: bool = False  # First payload after monitoring (re)started
+    newly_defeated: frozenset = field(default_factory=frozenset)  # Event IDs set since the last payload
+    newly_cleared: frozenset = field(default_factory=frozenset)  # Event IDs cleared (e.g. a reloaded backup)
+    deaths_delta: int = 0
+    level_changed: bool = False
+    playtime_delta: int = 0
+    character_changed: bool = False
+    other_stats_changed: bool = False  # Any other "stats" field
+
+    @property
+    def bosses_changed(self) -> bool:
+        """True if boss statuses (and therefore counts, the boss list, ...) need to be refreshed."""
+        return self.initial or self.character_changed or bool(self.newly_defeated or self.newly_cleared)
+
+    @property
+    def playtime_only(self) -> bool:
+        return (not self.bosses_changed and not self.deaths_delta and not self.level_changed
+                and not self.other_stats_changed)
+
+    def is_empty(self) -> bool:
+        return self.playtime_only and not self.playtime_delta
+
+
+def compute_delta(old_data, new_data) -> MonitorDelta:
+    """Compares two payloads. `old_data` may be None (initial payload)."""
+    if not old_data:
+        return MonitorDelta(data=new_data, initial=True)
+
+    old_stats = old_data.get("stats", {})
+    new_stats = new_data.get("stats", {})
+    old_statuses = old_data.get("boss_statuses", {})
+    new_statuses = new_data.get("boss_statuses", {})
+
+    newly_defeated = frozenset(
+        boss_id for boss_id, is_defeated in new_statuses.items()
+        if is_defeated and not old_statuses.get(boss_id, False)
+    )
+    newly_cleared = frozenset(
+        boss_id for boss_id, was_defeated in old_statuses.items()
+        if was_defeated and not new_statuses.get(boss_id, False)
+    )
+
+    known_fields = ("deaths", "level", "seconds_played", "character_name")
+    other_changed = any(
+        old_stats.get(key) != value for key, value in new_stats.items() if key not in known_fields
+    ) or any(key not in new_stats for key in old_stats if key not in known_fields)
+
+    return MonitorDelta(
+        data=new_data,
+        newly_defeated=newly_defeated,
+        newly_cleared=newly_cleared,
+        deaths_delta=(new_stats.get("deaths") or 0) - (old_stats.get("deaths") or 0),
+        level_changed=new_stats.get("level") != old_stats.get("level"),
+        playtime_delta=(new_stats.get("seconds_played") or 0) - (old_stats.get("seconds_played") or 0),
+        character_changed=new_stats.get("character_name") != old_stats.get("character_name"),
+        other_stats_changed=other_changed,
+    )
@@ -0,0 +1,128 @@
+# src/services/monitor_manager.py
+"""
+Monitoring of several (save file, character slot) targets at once, e.g. a
+vanilla .sl2, a Seamless Coop .co2 and a second Steam account.
+
+Targets are grouped by file. A poll costs one os.stat() per file; only files
+that were written since the last poll are read, each once, on a shared worker
+pool, and every watched slot of that file is evaluated with the same compiled
+flag plan. Each target keeps its own last payload, so every change is reported
+as a MonitorDelta tagged with its target.
+
+Pure Python (no Qt), so it runs in the GUI, the headless daemon or a test.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .save_parser import EldenRingSaveParser, get_flag_plan
+from .monitor_delta import compute_delta
+
+DEFAULT_MAX_WORKERS = 2  # Each in-flight read holds one save file (~28 MB) in memory
+
+
+class WatchTarget:
+    def __init__(self, save_file_path: str, slot_index: int, label: str = None):
+        self.save_file_path = save_file_path
+        self.slot_index = slot_index
+        self.label = label or f"{os.path.basename(save_file_path)}:{slot_index}"
+        self.last_data = None
+        self.last_error = None
+
+    @property
+    def key(self):
+        return (self.save_file_path, self.slot_index)
+
+    def __repr__(self):
+        return f"WatchTarget({self.label!r})"
+
+
+class MonitorManager:
+    def __init__(self, event_ids_provider, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            event_ids_provider: Callable returning the event IDs to check
+                                (e.g. BossDataManager.get_all_event_ids_to_monitor).
+        """
+        self.event_ids_provider = event_ids_provider
+        self._targets = {}  # (path, slot) -> WatchTarget
+        self._file_stamps = {}  # path -> (mtime_ns, size, flag plan) of the last read
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SaveMonitor")
+
+    def add_target(self, save_file_path: str, slot_index: int, label: str = None) -> WatchTarget:
+        target = WatchTarget(save_file_path, slot_index, label)
+        self._targets[target.key] = target
+        self._file_stamps.pop(save_file_path, None)  # Read the file on the next poll for the new target
+        return target
+
+    def remove_target(self, save_file_path: str, slot_index: int):
+        self._targets.pop((save_file_path, slot_index), None)
+        if not any(path == save_file_path for path, _ in self._targets):
+            self._file_stamps.pop(save_file_path, None)
+
+    def targets(self):
+        return list(self._targets.values())
+
+    def poll(self):
+        """
+        Checks all targets once. Returns [(target, MonitorDelta), ...] for the targets that changed.
+        Blocks while changed files are read (in parallel); call it from a worker
+        thread or executor if the caller must stay responsive.
+        """
+        if not self._targets:
+            return []
+        event_ids = self.event_ids_provider()
+        # Compiled here (once) so the workers only ever hit the cache. Without event IDs
+        # (no boss definitions loaded) only the stats are read.
+        plan = get_flag_plan(event_ids) if event_ids else None
+
+        slots_by_file = {}
+        for path, slot_index in self._targets:
+            slots_by_file.setdefault(path, []).append(slot_index)
+
+        futures = {}
+        for path, slots in slots_by_file.items():
+            try:
+                st = os.stat(path)
+                stamp = (st.st_mtime_ns, st.st_size, plan)
+            except OSError as e:
+                self._set_error(path, slots, f"Cannot access save file: {e}")
+                continue
+            if self._file_stamps.get(path) == stamp:
+                continue
+            self._file_stamps[path] = stamp
+            futures[path] = self._pool.submit(_read_slots, path, slots, event_ids)
+
+        changes = []
+        for path, future in futures.items():
+            for slot_index, (new_data, err) in future.result().items():
+                target = self._targets.get((path, slot_index))
+                if target is None:
+                    continue
+                if err or new_data is None:
+                    target.last_error = err or "No data returned"
+                    self._file_stamps.pop(path, None)  # Retry on the next poll
+                    continue
+                target.last_error = None
+                delta = compute_delta(target.last_data, new_data)
+                if delta.is_empty():
+                    continue
+                target.last_data = new_data
+                changes.append((target, delta))
+        return changes
+
+    def close(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _set_error(self, path, slots, message):
+        for slot_index in slots:
+            self._targets[(path, slot_index)].last_error = message
+
+
+def _read_slots(path, slots, event_ids):
+    """Worker: reads one save file and evaluates every requested slot. Returns {slot: (data, err)}."""
+    parser = EldenRingSaveParser()
+    success, err = parser.load_file(path)
+    if not success:
+        return {slot_index: (None, err) for slot_index in slots}
+    return {slot_index: parser.get_full_status(slot_index, event_ids) for slot_index in slots}
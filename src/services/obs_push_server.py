@@ -0,0 +1,179 @@
+# src/services/obs_push_server.py
+"""
+Opt-in local server for OBS browser sources.
+
+Serves a tiny HTML overlay on 127.0.0.1 and pushes state changes to it over
+Server-Sent Events, so browser sources update the moment new stats arrive
+instead of polling text files. Any number of browser sources can share the
+same feed.
+
+Endpoints:
+    GET /        - HTML overlay
+    GET /state   - current state as JSON
+    GET /events  - SSE stream: one "state" event with the full state, then
+                   "delta" events containing only the changed fields
+"""
+
+import json
+import asyncio
+
+from .background_server import BackgroundServer
+
+DEFAULT_HOST = "127.0.0.1"
+KEEPALIVE_INTERVAL_SEC = 15
+CLIENT_QUEUE_SIZE = 64
+
+OVERLAY_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>The Tarnished's Chronicle</title>
+<style>
+  body { margin: 0; background: transparent; color: #fff; font: bold 28px sans-serif;
+         text-shadow: 0 0 4px #000, 0 0 2px #000; }
+  .row { white-space: nowrap; }
+  .hidden { display: none; }
+</style>
+</head>
+<body>
+<div class="row" id="bosses">Bosses: <span data-field="defeated">--</span>/<span data-field="total">--</span></div>
+<div class="row" id="deaths">Deaths: <span data-field="deaths">--</span></div>
+<div class="row" id="time">Time: <span data-field="time">--:--:--</span></div>
+<div class="row hidden" id="last_kill">Last Kill: <span data-field="last_boss_name"></span> (<span data-field="last_kill_time"></span>)</div>
+<script>
+  const state = {};
+  function render() {
+    document.querySelectorAll("[data-field]").forEach(el => {
+      const value = state[el.dataset.field];
+      el.textContent = (value === undefined || value === null) ? "--" : value;
+    });
+    document.getElementById("last_kill").classList.toggle("hidden", !state.last_boss_name);
+  }
+  const source = new EventSource("/events");
+  source.addEventListener("state", e => { Object.keys(state).forEach(k => delete state[k]); Object.assign(state, JSON.parse(e.data)); render(); });
+  source.addEventListener("delta", e => { Object.assign(state, JSON.parse(e.data)); render(); });
+</script>
+</body>
+</html>
+"""
+
+
+class ObsPushServer(BackgroundServer):
+    """asyncio HTTP/SSE server running on its own thread; `publish` is safe to call from any thread."""
+    name = "OBS push server"
+
+    def __init__(self, host=DEFAULT_HOST, port=8765):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self._state = {}
+        self._clients = set()
+
+    def address(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def publish(self, state: dict):
+        """Merges the given fields into the state and pushes the changed ones to all clients."""
+        self.call_soon(self._apply_state, dict(state))
+
+    async def _create_server(self):
+        server = await asyncio.start_server(self._tracked(self._handle_connection), self.host, self.port)
+        # Port 0 means "pick a free port"; report the real one.
+        self.port = server.sockets[0].getsockname()[1]
+        return server
+
+    # --- Event loop side ---
+
+    def _apply_state(self, state):
+        delta = {key: value for key, value in state.items() if self._state.get(key, object()) != value}
+        if not delta:
+            return
+        self._state.update(delta)
+        message = self._format_event("delta", delta)
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A stalled client gets a full resync instead of an ever-growing backlog.
+                self._drain(queue)
+                queue.put_nowait(self._format_event("state", self._state))
+
+    def _on_stopping(self):
+        for queue in list(self._clients):
+            self._drain(queue)
+            queue.put_nowait(None)
+
+    @staticmethod
+    def _drain(queue):
+        while not queue.empty():
+            queue.get_nowait()
+
+    @staticmethod
+    def _format_event(event, data):
+        return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode('utf-8')
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            # Skip the headers; none of them matter for these endpoints.
+            while True:
+                line = await reader.readline()
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+
+            parts = request_line.decode('latin-1').split()
+            method = parts[0] if parts else ""
+            path = parts[1].split('?', 1)[0] if len(parts) > 1 else ""
+
+            if method != "GET":
+                await self._send_response(writer, 405, "text/plain", b"Method Not Allowed")
+            elif path == "/":
+                await self._send_response(writer, 200, "text/html; charset=utf-8", OVERLAY_HTML.encode('utf-8'))
+            elif path == "/state":
+                body = json.dumps(self._state).encode('utf-8')
+                await self._send_response(writer, 200, "application/json", body)
+            elif path == "/events":
+                await self._stream_events(writer)
+            else:
+                await self._send_response(writer, 404, "text/plain", b"Not Found")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send_response(self, writer, status, content_type, body):
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}.get(status, "")
+        headers = (
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(headers.encode('latin-1') + body)
+        await writer.drain()
+
+    async def _stream_events(self, writer):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+        )
+        writer.write(self._format_event("state", self._state))
+        await writer.drain()
+
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._clients.add(queue)
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL_SEC)
+                except asyncio.TimeoutError:
+                    message = b": keepalive\n\n"
+                if message is None:
+                    break
+                writer.write(message)
+                await writer.drain()
+        finally:
+            self._clients.discard(queue)
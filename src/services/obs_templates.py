@@ -0,0 +1,240 @@
+# src/services/obs_templates.py
+"""
+Compiled format templates for the OBS text outputs.
+
+A template such as "Bosses: {defeated}/{total} ({percent}%)" is parsed and
+validated once by `compile_template`. Rendering then only walks the literal
+pieces and resolves the placeholders the template actually uses; every value
+is computed lazily by `TemplateContext`, so expensive ones (per-region counts)
+cost nothing unless referenced.
+"""
+
+import re
+import string
+
+from ..utils import format_seconds_to_hms
+
+MISSING_VALUE = "--"
+MISSING_TIME = "--:--:--"
+
+# Output file -> default format string
+DEFAULT_FORMATS = {
+    "bosses": "Bosses: {defeated}/{total}",
+    "deaths": "Deaths: {deaths}",
+    "time": "Time: {time}",
+    "last_boss": "Last Kill: {boss_name} ({kill_time})",
+}
+
+# Placeholder name -> description (shown in the OBS setup instructions).
+# Names ending in "[...]" take a region name as index, e.g. {region[Limgrave]}.
+PLACEHOLDERS = {
+    "defeated": "Number of bosses defeated.",
+    "total": "Total number of bosses.",
+    "live": "Number of bosses still alive.",
+    "percent": "Percentage of bosses defeated.",
+    "defeated_base": "Bosses defeated in the base game.",
+    "total_base": "Total bosses in the base game.",
+    "defeated_dlc": "Bosses defeated in the DLC.",
+    "total_dlc": "Total bosses in the DLC.",
+    "deaths": "Current death count.",
+    "deaths_per_hour": "Deaths per hour of play time.",
+    "time": "Total play time (HH:MM:SS).",
+    "boss_name": "Name of the last boss killed.",
+    "kill_time": "Play time when the last boss was killed.",
+    "since_last_kill": "Play time since the last boss kill (HH:MM:SS).",
+    "kills_session": "Bosses killed since the app was started.",
+    "region[...]": "Defeated/total bosses in a region, e.g. {region[Limgrave]}.",
+    "region_defeated[...]": "Bosses defeated in a region.",
+    "region_total[...]": "Total bosses in a region.",
+}
+
+# Placeholders that change as the live clock ticks
+TIME_DEPENDENT_FIELDS = {"time", "since_last_kill", "deaths_per_hour"}
+
+_INDEXED_FIELDS = {name[:-5] for name in PLACEHOLDERS if name.endswith("[...]")}
+_PLAIN_FIELDS = {name for name in PLACEHOLDERS if not name.endswith("[...]")}
+_FIELD_RE = re.compile(r"^(\w+)(?:\[([^\[\]]+)\])?$")
+
+
+class TemplateError(ValueError):
+    """Raised when a template cannot be compiled (syntax error or unknown placeholder)."""
+
+
+class CompiledTemplate:
+    """A validated template: literal text interleaved with field lookups."""
+
+    def __init__(self, source, parts):
+        self.source = source
+        # [(literal, field_name | None, index | None, conversion | None, format_spec), ...]
+        self._parts = parts
+        self.fields = {part[1] for part in parts if part[1] is not None}
+
+    def render(self, context) -> str:
+        out = []
+        for literal, name, index, conversion, format_spec in self._parts:
+            if literal:
+                out.append(literal)
+            if name is None:
+                continue
+            value = context.get(name, index)
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            try:
+                out.append(format(value, format_spec))
+            except (ValueError, TypeError):
+                # e.g. "{deaths_per_hour:.1f}" while the value is still "--"
+                out.append(str(value))
+        return "".join(out)
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """Parses and validates a template. Raises TemplateError on bad syntax or unknown placeholders."""
+    parts = []
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError as e:
+        raise TemplateError(f"Invalid template '{template}': {e}") from None
+
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is None:
+            parts.append((literal, None, None, None, ""))
+            continue
+
+        match = _FIELD_RE.match(field_name)
+        if not match:
+            raise TemplateError(f"Unknown placeholder '{{{field_name}}}'.")
+        name, index = match.group(1), match.group(2)
+        if index is None and name not in _PLAIN_FIELDS:
+            if name in _INDEXED_FIELDS:
+                raise TemplateError(f"Placeholder '{{{name}}}' needs a region, e.g. {{{name}[Limgrave]}}.")
+            raise TemplateError(f"Unknown placeholder '{{{field_name}}}'.")
+        if index is not None and name not in _INDEXED_FIELDS:
+            raise TemplateError(f"Placeholder '{{{name}}}' does not take an index.")
+        if format_spec and "{" in format_spec:
+            raise TemplateError(f"Nested placeholders are not supported in '{{{field_name}:{format_spec}}}'.")
+
+        parts.append((literal, name, index.strip() if index else None, conversion, format_spec or ""))
+    return CompiledTemplate(template, parts)
+
+
+class TemplateContext:
+    """
+    Lazily computed placeholder values for one update.
+
+    `data` is the usual stats payload ({"stats": ..., "last_kill": ...}).
+    Values are computed on first use and memoized for the lifetime of the context,
+    so several templates rendered from one context share the work.
+    """
+
+    def __init__(self, data, boss_data_manager=None, death_offset=0, session_start_defeated=None, seconds_played=None):
+        self.stats = data.get("stats", {}) if data else {}
+        self.last_kill = data.get("last_kill") if data else None
+        self.boss_data_manager = boss_data_manager
+        self.death_offset = death_offset
+        self.session_start_defeated = session_start_defeated
+        self._seconds_played = seconds_played
+        self._cache = {}
+
+    def get(self, name, index=None):
+        key = (name, index)
+        if key not in self._cache:
+            resolver = getattr(self, f"_resolve_{name}")
+            self._cache[key] = resolver(index) if index is not None else resolver()
+        return self._cache[key]
+
+    # --- Helpers ---
+
+    def _seconds(self):
+        if self._seconds_played is not None:
+            return self._seconds_played
+        return self.stats.get("seconds_played", -1)
+
+    def _boss_counts(self):
+        return self.stats.get("boss_counts") or {}
+
+    def _location_counts(self):
+        if "_location_counts" not in self._cache:
+            counts = self.boss_data_manager.get_location_counts() if self.boss_data_manager else {}
+            # Region names are matched case-insensitively.
+            self._cache["_location_counts"] = {loc.casefold(): c for loc, c in counts.items()}
+        return self._cache["_location_counts"]
+
+    def _region(self, region):
+        return self._location_counts().get(region.casefold())
+
+    # --- Resolvers ---
+
+    def _resolve_defeated(self):
+        return self.stats.get("defeated", MISSING_VALUE)
+
+    def _resolve_total(self):
+        return self.stats.get("total", MISSING_VALUE)
+
+    def _resolve_live(self):
+        defeated, total = self.stats.get("defeated"), self.stats.get("total")
+        return total - defeated if defeated is not None and total is not None else MISSING_VALUE
+
+    def _resolve_percent(self):
+        defeated, total = self.stats.get("defeated"), self.stats.get("total")
+        if not total or defeated is None:
+            return MISSING_VALUE
+        return round(defeated * 100 / total, 1)
+
+    def _resolve_defeated_base(self):
+        return self._boss_counts().get("base", {}).get("defeated", MISSING_VALUE)
+
+    def _resolve_total_base(self):
+        return self._boss_counts().get("base", {}).get("total", MISSING_VALUE)
+
+    def _resolve_defeated_dlc(self):
+        return self._boss_counts().get("dlc", {}).get("defeated", MISSING_VALUE)
+
+    def _resolve_total_dlc(self):
+        return self._boss_counts().get("dlc", {}).get("total", MISSING_VALUE)
+
+    def _resolve_deaths(self):
+        return self.stats.get("deaths", 0) + self.death_offset
+
+    def _resolve_deaths_per_hour(self):
+        seconds = self._seconds()
+        if seconds <= 0:
+            return MISSING_VALUE
+        return round(self.get("deaths") * 3600 / seconds, 1)
+
+    def _resolve_time(self):
+        seconds = self._seconds()
+        return format_seconds_to_hms(seconds) if seconds >= 0 else MISSING_TIME
+
+    def _resolve_boss_name(self):
+        return self.last_kill.get("name", "N/A") if self.last_kill else ""
+
+    def _resolve_kill_time(self):
+        return format_seconds_to_hms(self.last_kill.get("time", 0)) if self.last_kill else ""
+
+    def _resolve_since_last_kill(self):
+        seconds = self._seconds()
+        if not self.last_kill or seconds < 0:
+            return MISSING_TIME
+        return format_seconds_to_hms(max(0, seconds - self.last_kill.get("time", 0)))
+
+    def _resolve_kills_session(self):
+        defeated = self.stats.get("defeated")
+        if defeated is None or self.session_start_defeated is None:
+            return 0
+        return max(0, defeated - self.session_start_defeated)
+
+    def _resolve_region(self, region):
+        counts = self._region(region)
+        return f"{counts['defeated']}/{counts['total']}" if counts else MISSING_VALUE
+
+    def _resolve_region_defeated(self, region):
+        counts = self._region(region)
+        return counts["defeated"] if counts else MISSING_VALUE
+
+    def _resolve_region_total(self, region):
+        counts = self._region(region)
+        return counts["total"] if counts else MISSING_VALUE
@@ -0,0 +1,105 @@
+# src/services/obs_writer.py
+import os
+import time
+import threading
+
+
+class ObsFileWriter:
+    """
+    Writes the OBS text files.
+
+    - Keeps the last written content per file and skips identical writes.
+    - Writes through a temp file + os.replace, so OBS never reads a half-written
+      or truncated file.
+    - Coalesces bursts of updates into at most one flush per interval; only the
+      newest content of each file is written.
+    - A file that cannot be replaced (e.g. held open by OBS on Windows) stays
+      pending and is retried on the next interval.
+    """
+    def __init__(self, flush_interval_sec=0.25):
+        self.flush_interval_sec = flush_interval_sec
+        self._lock = threading.Lock()  # Guards the state below; never held during disk I/O
+        self._flush_lock = threading.Lock()  # One flush at a time (they share the temp files)
+        self._written = {}  # path -> content currently on disk
+        self._pending = {}  # path -> content waiting for the next flush
+        self._timer = None
+        self._last_flush = 0.0
+        self._closed = False
+
+    def write(self, path: str, content: str):
+        """Queues content for the file. Returns False if the file already has this content."""
+        flush_now = False
+        with self._lock:
+            if self._written.get(path) == content:
+                # The file already holds this text; drop any older pending change.
+                self._pending.pop(path, None)
+                return False
+
+            self._pending[path] = content
+            if self._timer is None:
+                delay = self._last_flush + self.flush_interval_sec - time.monotonic()
+                if delay <= 0:
+                    flush_now = True
+                else:
+                    self._schedule(delay)
+
+        if flush_now:
+            self.flush()
+        return True
+
+    def flush(self):
+        """Writes all pending files immediately. Failed writes are retried after the flush interval."""
+        with self._flush_lock:
+            with self._lock:
+                pending = {path: content for path, content in self._pending.items() if self._written.get(path) != content}
+                self._pending = {}
+                self._timer = None
+                self._last_flush = time.monotonic()
+
+            # Outside the lock, so write() (GUI thread) never waits for the disk.
+            results = {path: self._atomic_write(path, content) for path, content in pending.items()}
+
+            with self._lock:
+                for path, ok in results.items():
+                    if ok:
+                        self._written[path] = pending[path]
+                    else:
+                        # Keep newer content queued meanwhile; otherwise retry this one.
+                        self._pending.setdefault(path, pending[path])
+                if self._pending and self._timer is None and not self._closed:
+                    self._schedule(self.flush_interval_sec)
+
+    def _schedule(self, delay):
+        """Arms the flush timer. Called with _lock held."""
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def forget(self):
+        """Forgets what was written, so the next write of every file goes to disk (e.g. after a folder change)."""
+        with self._lock:
+            self._written.clear()
+
+    def close(self):
+        """Cancels the scheduled flush and writes whatever is still pending."""
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+        self.flush()
+
+    def _atomic_write(self, path, content):
+        tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            # On Windows os.replace can fail while another process holds the file open.
+            print(f"Error writing to OBS file '{path}': {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
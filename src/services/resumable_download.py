@@ -0,0 +1,223 @@
+# src/services/resumable_download.py
+"""
+Resumable HTTP downloads.
+
+The file is streamed into `<dest>.part` and only moved to `<dest>` once it is
+complete (and its SHA-256 matches, if one was given). An interrupted or
+cancelled download continues from the `.part` file next time with an HTTP
+Range request; the validators (ETag / Last-Modified) of the first response are
+kept next to it so a changed file on the server restarts cleanly.
+
+Pure Python (requests only), so it can be used from worker threads and tested
+against a local http.server.
+"""
+
+import os
+import json
+import time
+import hashlib
+import requests
+
+DEFAULT_TIMEOUT = (10, 30)  # (connect, read) seconds
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+FAST_CHUNK_SEC = 0.05  # Chunks read faster than this grow
+SLOW_CHUNK_SEC = 0.25  # Chunks read slower than this shrink (keeps cancel/progress responsive)
+PROGRESS_INTERVAL_SEC = 0.1
+MAX_ATTEMPTS = 3
+
+
+class DownloadError(Exception):
+    """The download failed; a `.part` file may be kept for resuming."""
+
+
+class DownloadCancelled(DownloadError):
+    """The download was cancelled; the `.part` file is kept for resuming."""
+
+
+class IntegrityError(DownloadError):
+    """The downloaded file does not match the expected SHA-256; the partial data is discarded."""
+
+
+def download_file(url, dest_path, expected_sha256=None, progress_callback=None, cancel_check=None,
+                  session=None, timeout=DEFAULT_TIMEOUT, progress_interval=PROGRESS_INTERVAL_SEC,
+                  max_attempts=MAX_ATTEMPTS):
+    """
+    Downloads `url` to `dest_path`, resuming a previous partial download if possible.
+
+    Args:
+        expected_sha256: Hex digest to verify while streaming (None skips the check).
+        progress_callback: Called as (downloaded_bytes, total_bytes or 0), at most
+                           every `progress_interval` seconds plus once at the end.
+        cancel_check: Callable returning True to stop; raises DownloadCancelled.
+        session: requests.Session to reuse connections (a plain request otherwise).
+
+    Returns the SHA-256 hex digest of the file. Raises DownloadError on failure.
+    """
+    part_path = f"{dest_path}.part"
+    meta_path = f"{part_path}.json"
+    http = session or requests
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            digest = _download_attempt(http, url, part_path, meta_path, progress_callback,
+                                       cancel_check, timeout, progress_interval)
+            break
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            # Network hiccup: what was written so far stays in the .part file for the next attempt.
+            if attempt >= max_attempts:
+                raise DownloadError(f"Download failed after {attempt} attempts: {e}") from e
+            print(f"Download interrupted ({e}), resuming (attempt {attempt + 1}/{max_attempts})...")
+            time.sleep(min(2 ** attempt, 10))
+        except requests.RequestException as e:
+            raise DownloadError(f"Download failed: {e}") from e
+
+    if expected_sha256 and digest.lower() != expected_sha256.lower():
+        _remove(part_path, meta_path)
+        raise IntegrityError(f"SHA-256 mismatch: expected {expected_sha256}, got {digest}")
+
+    try:
+        os.replace(part_path, dest_path)
+    except OSError as e:
+        raise DownloadError(f"Could not move download into place: {e}") from e
+    _remove(meta_path)
+    return digest
+
+
+def _download_attempt(http, url, part_path, meta_path, progress_callback, cancel_check, timeout, progress_interval):
+    hasher = hashlib.sha256()
+    offset = _resume_offset(url, part_path, meta_path)
+    # Ranges and Content-Length must refer to the bytes we store, not a compressed transfer.
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        meta = _read_meta(meta_path)
+        headers["Range"] = f"bytes={offset}-"
+        etag = meta.get("etag")
+        # Weak ETags are not allowed in If-Range.
+        validator = etag if etag and not etag.startswith("W/") else meta.get("last_modified")
+        if validator:
+            # If the file changed on the server we get the whole new file (200) instead of a range.
+            headers["If-Range"] = validator
+
+    with http.get(url, stream=True, timeout=timeout, headers=headers) as response:
+        if response.status_code == 416:
+            # Our partial file is not a valid prefix any more; start over.
+            _remove(part_path, meta_path)
+            return _download_attempt(http, url, part_path, meta_path, progress_callback, cancel_check, timeout, progress_interval)
+        response.raise_for_status()
+
+        if response.status_code == 206 and (not offset or _content_range_start(response) != offset):
+            # A range we did not ask for (or without Content-Range) is not the rest of our file.
+            if not offset:
+                raise DownloadError(f"Server sent a partial response without a Range request: {response.headers.get('content-range')!r}")
+            _remove(part_path, meta_path)
+            return _download_attempt(http, url, part_path, meta_path, progress_callback, cancel_check, timeout, progress_interval)
+
+        if response.status_code == 206:
+            # Resume: the digest has to include the bytes we already have.
+            _hash_existing(part_path, offset, hasher)
+            mode = 'ab'
+        else:
+            offset = 0
+            mode = 'wb'
+            _write_meta(meta_path, url, response)
+
+        length = int(response.headers.get('content-length', 0))
+        total = offset + length if length else 0
+        downloaded = offset
+
+        last_progress = 0.0
+        chunk_size = MIN_CHUNK_SIZE
+        with open(part_path, mode) as f:
+            while True:
+                if cancel_check and cancel_check():
+                    raise DownloadCancelled("Download canceled by user.")
+
+                started = time.monotonic()
+                chunk = response.raw.read(chunk_size)
+                if not chunk:
+                    break
+                f.write(chunk)
+                hasher.update(chunk)
+                downloaded += len(chunk)
+
+                elapsed = time.monotonic() - started
+                if elapsed < FAST_CHUNK_SEC and len(chunk) == chunk_size:
+                    chunk_size = min(chunk_size * 2, MAX_CHUNK_SIZE)
+                elif elapsed > SLOW_CHUNK_SEC:
+                    chunk_size = max(chunk_size // 2, MIN_CHUNK_SIZE)
+
+                now = time.monotonic()
+                if progress_callback and now - last_progress >= progress_interval:
+                    last_progress = now
+                    progress_callback(downloaded, total)
+
+        if total and downloaded < total:
+            raise requests.exceptions.ChunkedEncodingError(f"Connection closed after {downloaded} of {total} bytes")
+
+    if progress_callback:
+        progress_callback(downloaded, total or downloaded)
+    return hasher.hexdigest()
+
+
+def _resume_offset(url, part_path, meta_path):
+    """Size of a resumable partial download of the same URL, or 0."""
+    try:
+        size = os.path.getsize(part_path)
+    except OSError:
+        return 0
+    if size and _read_meta(meta_path).get("url") == url:
+        return size
+    _remove(part_path, meta_path)
+    return 0
+
+
+def _content_range_start(response):
+    # "bytes 1000-1999/2000"
+    content_range = response.headers.get('content-range', '')
+    try:
+        return int(content_range.split()[1].split('-')[0])
+    except (IndexError, ValueError):
+        return -1
+
+
+def _hash_existing(path, length, hasher):
+    with open(path, 'rb') as f:
+        remaining = length
+        while remaining:
+            block = f.read(min(MAX_CHUNK_SIZE, remaining))
+            if not block:
+                break
+            hasher.update(block)
+            remaining -= len(block)
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(meta_path, url, response):
+    meta = {
+        "url": url,
+        "etag": response.headers.get('etag'),
+        "last_modified": response.headers.get('last-modified'),
+    }
+    try:
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    except OSError as e:
+        print(f"Could not write download metadata '{meta_path}': {e}")
+
+
+def _remove(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,189 @@
+# src/services/save_layout.py
+"""
+Layout of the Elden Ring save file (PC .sl2/.co2), described once.
+
+Each record lists its fields by offset; the record is compiled into a single
+struct.Struct (gaps become pad bytes), so one unpack_from() call over the
+save data decodes a whole record and iter_unpack() decodes a table of them.
+Adding a field (e.g. once another offset is confirmed) is a one-line change.
+
+Offsets are based on ER-Save-Lib and save file format research.
+"""
+
+import codecs
+import struct
+from typing import Any, Dict, List, NamedTuple
+
+# BND4 container
+SAVE_HEADER_SIZE = 0x300  # BND4 magic (4) + header (0x2FC)
+BND4_MAGIC = b"BND4"
+BND4_HEADER_SIZE = 0x40
+BND4_ENTRY_HEADER_SIZE = 0x20
+SLOT_CHECKSUM_SIZE = 0x10  # MD5 of the rest of the entry, PC saves only
+
+# Character slots (UserData0..9). Slots are at 0x300, 0x280310, 0x500320, ...
+SLOT_BASE_OFFSET = 0x300  # First slot starts at 0x300
+SLOT_INCREMENT = 0x280010  # Distance between slot starts
+SLOT_SIZE = 0x280010  # Size of each character slot data
+MAX_CHARACTER_SLOTS = 10
+
+# Profile summary is at a FIXED location in the file (UserData10 section)
+PROFILE_SUMMARY_BASE = 0x1901D00
+USER_DATA_10_INDEX = 10  # BND4 entry holding the profile summary
+PROFILE_SUMMARY_OFFSET_IN_USER_DATA_10 = 0x1960  # PROFILE_SUMMARY_BASE relative to UserData10
+PROFILE_ENTRY_SIZE = 0x24C  # 588 bytes per profile entry
+
+# Event flags configuration
+EVENT_FLAGS_SIZE = 0x1BF99F  # Event flags section size (~1.83MB per slot)
+EVENT_FLAGS_SLOT_OFFSET = 0x388FC  # Offset of event flags within each character slot (verified)
+
+# Field kind -> (struct code, byte size). "utf16" fields take a length in characters,
+# "bytes" fields (returned undecoded) a length in bytes.
+_KINDS = {
+    "u8": ("B", 1),
+    "u16": ("H", 2),
+    "u32": ("I", 4),
+    "i32": ("i", 4),
+    "u64": ("Q", 8),
+    "bytes": ("s", 1),
+    "utf16": ("s", 2),
+}
+
+
+class Field(NamedTuple):
+    name: str
+    offset: int  # Relative to the start of the record
+    kind: str  # One of _KINDS
+    length: int = 1  # Characters for "utf16", bytes for "bytes", otherwise 1
+
+
+class Record:
+    """A fixed-size record compiled to one little-endian struct.Struct."""
+
+    def __init__(self, name: str, size: int, fields: List[Field]):
+        self.name = name
+        self.size = size
+        self.fields = sorted(fields, key=lambda f: f.offset)
+        self._string_indexes = []  # Positions of the "utf16" fields in the unpacked tuple
+
+        parts = ["<"]
+        position = 0
+        for index, f in enumerate(self.fields):  # One unpacked value per field
+            code, unit = _KINDS[f.kind]
+            if f.offset < position:
+                raise ValueError(f"{name}.{f.name} at 0x{f.offset:X} overlaps the previous field")
+            if f.offset > position:
+                parts.append(f"{f.offset - position}x")
+            if code == "s":
+                parts.append(f"{f.length * unit}s")
+                if f.kind == "utf16":
+                    self._string_indexes.append(index)
+                position = f.offset + f.length * unit
+            else:
+                parts.append(code)
+                position = f.offset + unit
+        if position > size:
+            raise ValueError(f"{name} fields end at 0x{position:X}, past the record size 0x{size:X}")
+        if size > position:
+            parts.append(f"{size - position}x")
+
+        self.struct = struct.Struct("".join(parts))
+        self._names = [f.name for f in self.fields]
+
+    def _to_dict(self, values) -> Dict[str, Any]:
+        if self._string_indexes:
+            values = list(values)
+            for index in self._string_indexes:
+                values[index] = decode_utf16(values[index])
+        return dict(zip(self._names, values))
+
+    def unpack_from(self, buffer, offset: int = 0) -> Dict[str, Any]:
+        """Decodes one record at `offset`. Raises struct.error if it does not fit."""
+        return self._to_dict(self.struct.unpack_from(buffer, offset))
+
+    def unpack_table(self, buffer, offset: int, count: int) -> List[Dict[str, Any]]:
+        """
+        Decodes up to `count` consecutive records starting at `offset` (fewer if the
+        buffer ends early) with a single iter_unpack over a zero-copy view.
+        """
+        available = max(0, (len(buffer) - offset) // self.size)
+        count = min(count, available)
+        if count <= 0:
+            return []
+        view = memoryview(buffer)[offset:offset + count * self.size]
+        try:
+            return [self._to_dict(values) for values in self.struct.iter_unpack(view)]
+        finally:
+            view.release()
+
+
+def decode_utf16(raw: bytes) -> str:
+    """Decodes a NUL-terminated UTF-16LE string."""
+    if raw[:2] == b"\x00\x00":
+        return ""  # Empty slot names, the common case in the profile table
+    # The codec function directly: str.decode's codec lookup costs more than decoding 32 bytes.
+    text = codecs.utf_16_le_decode(raw, "ignore")[0]
+    end = text.find("\x00")
+    return text if end == -1 else text[:end]
+
+
+# BND4 header and entry table (SoulsFormats format 0x74, as written by Elden Ring)
+BND4_HEADER = Record("BND4Header", BND4_HEADER_SIZE, [
+    Field("magic", 0x00, "bytes", 4),
+    Field("entry_count", 0x0C, "u32"),
+    Field("header_size", 0x10, "u64"),
+    Field("entry_header_size", 0x20, "u64"),
+    Field("data_start", 0x28, "u64"),
+    Field("unicode", 0x30, "u8"),
+    Field("format", 0x31, "u8"),
+])
+
+BND4_ENTRY = Record("BND4Entry", BND4_ENTRY_HEADER_SIZE, [
+    Field("flags", 0x00, "u8"),
+    Field("size", 0x08, "u64"),
+    Field("data_offset", 0x10, "u32"),
+    Field("name_offset", 0x14, "u32"),
+])
+
+# One entry of the profile summary (the character list shown on the title screen)
+PROFILE_ENTRY = Record("ProfileEntry", PROFILE_ENTRY_SIZE, [
+    Field("character_name", 0x0E, "utf16", 16),  # UTF-16LE, 32 bytes max
+    Field("character_level", 0x30, "u32"),
+    Field("seconds_played", 0x34, "u32"),
+])
+
+# Start of a character slot (UserDataX, PC layout per ER-Save-Lib)
+SLOT_HEADER = Record("SlotHeader", 0x30, [
+    Field("checksum", 0x00, "bytes", SLOT_CHECKSUM_SIZE),  # MD5 of the rest of the slot
+    Field("version", 0x10, "u32"),
+    Field("map_id", 0x14, "bytes", 4),
+])
+
+# The item handle table (gaitem map) follows the header. Entries are
+# variable-length, so everything after it must be walked, see user_data_x.py.
+GAITEM_COUNT = 0x1400
+GAITEM_COUNT_OLD = 0x13FE  # Save versions <= 81
+GAITEM_OLD_VERSION = 81
+GAITEM_TYPE_MASK = 0xF0000000
+GAITEM_TYPE_WEAPON = 0x80000000  # handle, item id, 2 x i32, ash of war handle, u8
+GAITEM_TYPE_ARMOR = 0x90000000  # handle, item id, 2 x i32
+GAITEM_SIZE_WEAPON = 21
+GAITEM_SIZE_ARMOR = 16
+GAITEM_SIZE_OTHER = 8  # handle, item id
+PLAYER_GAME_DATA_SIZE = 0x1B0  # Stats, level and the character name
+
+# Game manager fields stored right before the event flags
+SLOT_TAIL = Record("SlotTail", 0x1A, [
+    Field("total_deaths_count", 0x00, "u32"),
+    Field("character_type", 0x04, "i32"),
+    Field("in_online_session", 0x08, "u8"),
+    Field("character_type_online", 0x09, "u32"),
+    Field("last_rested_grace", 0x0D, "u32"),
+    Field("not_alone", 0x11, "u8"),
+    Field("in_game_countdown_timer", 0x12, "u32"),
+])
+
+
+def slot_offset(slot_index: int) -> int:
+    """Byte offset of a character slot: 0x300 + slot_index * 0x280010."""
+    return SLOT_BASE_OFFSET + slot_index * SLOT_INCREMENT
@@ -1,18 +1,25 @@
 # src/save_monitor_logic.py
 import os
 import time
-import json
-import psutil # <--- NEW IMPORT
 from PySide6.QtCore import QObject, Signal, QTimer
 from ..domain.boss_data_manager import BossDataManager
-from ..config.app_config import DEFAULT_MONITORING_INTERVAL_SEC
+from .game_process_tracker import GameProcessTracker
+from .monitor_cadence import MonitorCadence
+from .monitor_delta import compute_delta
+from ..config.app_config import (
+    DEFAULT_MONITORING_INTERVAL_SEC, GAME_PROCESS_NAME,
+    GAME_PROCESS_CHECK_INTERVAL_SEC, GAME_PROCESS_MAX_SCAN_INTERVAL_SEC,
+    MONITOR_MIN_INTERVAL_SEC, MONITOR_ACTIVE_INTERVAL_SEC, MONITOR_MAX_INTERVAL_SEC
+)
 
 class SaveMonitorLogic(QObject):
     monitoring_started = Signal(str, int)
     monitoring_stopped = Signal()
-    stats_updated = Signal(dict)
+    stats_updated = Signal(dict) # Full payload on any change
+    delta_updated = Signal(object) # MonitorDelta describing the same change
     boss_defeated = Signal(str, int)
     game_process_status = Signal(bool) # <--- NEW SIGNAL (is_running)
+    cadence_changed = Signal(float, str) # (seconds until next poll, reason)
     
     def __init__(self, save_handler, boss_data_manager: BossDataManager, parent=None):
         """
@@ -26,56 +33,119 @@ class SaveMonitorLogic(QObject):
         self.rust_cli = save_handler  # Keep name for compatibility
         self.boss_data_manager = boss_data_manager
         
+        # Single-shot timer, re-armed after every poll with the interval chosen by the cadence.
         self.monitoring_timer = QTimer(self)
+        self.monitoring_timer.setSingleShot(True)
         self.monitoring_timer.timeout.connect(self.on_monitoring_timeout)
         self.monitoring_interval_sec = DEFAULT_MONITORING_INTERVAL_SEC
+        self.cadence = MonitorCadence(
+            min_interval=MONITOR_MIN_INTERVAL_SEC,
+            active_interval=MONITOR_ACTIVE_INTERVAL_SEC,
+            base_interval=DEFAULT_MONITORING_INTERVAL_SEC,
+            max_interval=MONITOR_MAX_INTERVAL_SEC,
+        )
+        self.is_monitoring = False
+        self._last_cadence = None
         
         self.current_save_file_path = ""
         self.current_slot_index = -1
         self.last_known_data = None
+        self._last_save_stamp = None
         self.game_process_is_running = False # <--- NEW STATE VARIABLE
 
+        # Process detection runs on its own timer, independent of save polling.
+        self.process_tracker = GameProcessTracker(
+            GAME_PROCESS_NAME,
+            min_scan_interval=GAME_PROCESS_CHECK_INTERVAL_SEC,
+            max_scan_interval=GAME_PROCESS_MAX_SCAN_INTERVAL_SEC,
+        )
+        self.process_timer = QTimer(self)
+        self.process_timer.timeout.connect(self.check_game_process)
+
     def _is_game_running(self):
-        """Checks if eldenring.exe is a running process."""
-        for proc in psutil.process_iter(['name']):
-            if proc.info['name'].lower() == "eldenring.exe":
-                return True
-        return False
+        """Checks if the game is running (cached PID, full scans only with backoff)."""
+        return self.process_tracker.is_running()
+
+    def check_game_process(self):
+        is_running = self._is_game_running()
+        if is_running != self.game_process_is_running:
+            print(f"[Monitor] Game process state changed to: {is_running}. Emitting signal.") # DEBUG
+            self.game_process_is_running = is_running
+            self.game_process_status.emit(is_running)
+            if self.is_monitoring:
+                self._schedule_poll(*self.cadence.on_game_state_changed(is_running))
+
+    @property
+    def current_interval_sec(self) -> float:
+        return self.cadence.interval
+
+    @property
+    def wake_reason(self) -> str:
+        return self.cadence.reason
 
     def start_monitoring(self, save_file_path: str, slot_index: int, character_name: str):
         self.stop_monitoring()
         self.current_save_file_path = save_file_path
         self.current_slot_index = slot_index
+        self.is_monitoring = True
+        self.cadence.reset()
+        self._last_cadence = None
         
-        # Use a single-shot timer to ensure the first check happens after the event loop is ready
-        QTimer.singleShot(0, self.on_monitoring_timeout)
+        # Fire the first check once the event loop is ready; later polls are scheduled by the cadence
+        self.monitoring_timer.start(0)
         
-        self.monitoring_timer.start(self.monitoring_interval_sec * 1000)
+        self.process_tracker.reset_backoff()
+        QTimer.singleShot(0, self.check_game_process)
+        self.process_timer.start(int(GAME_PROCESS_CHECK_INTERVAL_SEC * 1000))
         self.monitoring_started.emit(character_name, self.monitoring_interval_sec)
 
     def stop_monitoring(self):
-        if self.monitoring_timer.isActive():
-            self.monitoring_timer.stop()
+        self.process_timer.stop()
+        self.monitoring_timer.stop()
+        if self.is_monitoring:
+            self.is_monitoring = False
             self.current_slot_index = -1
             self.last_known_data = None
+            self._last_save_stamp = None
             self.monitoring_stopped.emit()
 
     def on_monitoring_timeout(self):
-        """Loads full data from the file and compares it."""
-        # --- NEW PROCESS CHECK ---
-        is_running = self._is_game_running()
-        print(f"[Monitor] Checking game process... Running: {is_running}, Previous State: {self.game_process_is_running}") # DEBUG
-        if is_running != self.game_process_is_running:
-            print(f"[Monitor] Game process state changed to: {is_running}. Emitting signal.") # DEBUG
-            self.game_process_is_running = is_running
-            self.game_process_status.emit(is_running)
-        
-        if self.current_slot_index == -1:
+        """Polls the save file and schedules the next poll."""
+        if not self.is_monitoring:
             return
+        save_written = self._poll_save()
+        self._schedule_poll(*self.cadence.next_interval(time.monotonic(), save_written, self.game_process_is_running))
+
+    def _schedule_poll(self, interval_sec, reason):
+        if not self.is_monitoring:
+            return
+        self.monitoring_timer.start(int(interval_sec * 1000))
+        if (interval_sec, reason) != self._last_cadence:
+            self._last_cadence = (interval_sec, reason)
+            self.cadence_changed.emit(interval_sec, reason)
+
+    def _save_stamp(self, all_event_ids):
+        """Cheap change check: the save's mtime/size plus the set of tracked flags."""
+        try:
+            st = os.stat(self.current_save_file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, len(all_event_ids))
+
+    def _poll_save(self) -> bool:
+        """Loads full data from the file (only if it changed) and compares it. Returns True if the file was written."""
+        if self.current_slot_index == -1:
+            return False
 
         all_event_ids = self.boss_data_manager.get_all_event_ids_to_monitor()
         if not all_event_ids:
-            return
+            return False
+
+        stamp = self._save_stamp(all_event_ids)
+        if stamp is not None and stamp == self._last_save_stamp:
+            return False
+        save_written = self._last_save_stamp is not None
+        self._last_save_stamp = stamp
 
         new_data, err = self.rust_cli.get_full_status(
             self.current_save_file_path,
@@ -85,27 +155,23 @@ class SaveMonitorLogic(QObject):
 
         if err or new_data is None:
             print(f"Monitoring Error: {err or 'No data returned'}")
-            return
+            # Retry the parse next time even if the file does not change (e.g. a half-written save).
+            self._last_save_stamp = None
+            return save_written
+
+        delta = compute_delta(self.last_known_data, new_data)
+        if delta.is_empty():
+            return save_written
 
-        # Check for newly defeated bosses before emitting the general update
-        if self.last_known_data:
-            old_statuses = self.last_known_data.get("boss_statuses", {})
-            new_statuses = new_data.get("boss_statuses", {})
+        # Report newly defeated bosses before the general update
+        if not delta.initial:
             current_play_time = new_data.get("stats", {}).get("seconds_played", 0)
+            for boss_id in delta.newly_defeated:
+                # We emit the ID and let the GUI find the name.
+                self.boss_defeated.emit(boss_id, current_play_time)
 
-            for boss_id, is_defeated in new_statuses.items():
-                # If the boss is now defeated but wasn't before
-                if is_defeated and not old_statuses.get(boss_id, False):
-                    # We need to find the boss name from its ID.
-                    # This is a bit tricky here. We will emit the ID and let the GUI find the name.
-                    self.boss_defeated.emit(boss_id, current_play_time)
-
-        # --- ROBUST COMPARISON FIX ---
-        # Convert dictionaries to sorted JSON strings for a reliable, order-independent comparison.
-        new_data_str = json.dumps(new_data, sort_keys=True)
-        last_data_str = json.dumps(self.last_known_data, sort_keys=True) if self.last_known_data else ""
-
-        if new_data_str != last_data_str:
-            print("Change detected in save data. Emitting update.")
-            self.last_known_data = new_data
-            self.stats_updated.emit(new_data)
\ No newline at end of file
+        print("Change detected in save data. Emitting update.")
+        self.last_known_data = new_data
+        self.delta_updated.emit(delta)
+        self.stats_updated.emit(new_data)
+        return save_written
\ No newline at end of file
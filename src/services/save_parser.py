@@ -6,12 +6,21 @@ Replaces the Rust CLI tool functionality.
 Based on research from ER-Save-Lib and save file format documentation.
 """
 
-import struct
 import io
 import os
-import urllib.request
+from functools import lru_cache
 from typing import Optional, Tuple, List, Dict, Any
 
+# Save file structure (for PC version)
+from .save_layout import (
+    SAVE_HEADER_SIZE, SLOT_SIZE, MAX_CHARACTER_SLOTS,
+    PROFILE_SUMMARY_BASE, PROFILE_ENTRY_SIZE, EVENT_FLAGS_SLOT_OFFSET,
+    PROFILE_ENTRY, SLOT_TAIL, slot_offset, BND4_MAGIC, USER_DATA_10_INDEX,
+    PROFILE_SUMMARY_OFFSET_IN_USER_DATA_10
+)
+from .bnd4 import Bnd4Directory, get_directory
+from .user_data_x import resolve_slot_layout
+
 
 # Constants for event flag parsing
 FLAG_DIVISOR = 1000
@@ -52,22 +61,25 @@ def _download_bst() -> Dict[int, int]:
     bst_map = {}
     try:
         print("Downloading event flag BST from ER-Save-Lib...")
-        with urllib.request.urlopen(_BST_URL, timeout=15) as response:
-            bst_content = response.read().decode('utf-8')
-            
-            # Parse the content
-            for line in bst_content.strip().split('\n'):
-                if ',' in line:
-                    parts = line.split(',')
-                    if len(parts) == 2:
-                        bst_map[int(parts[0])] = int(parts[1])
-            
-            # Cache the file for future use
-            cache_file = os.path.join(_get_cache_dir(), 'eventflag_bst.txt')
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                f.write(bst_content)
-            print(f"BST downloaded and cached ({len(bst_map)} entries)")
-            
+        # Imported here so the parser itself stays usable without the app's network stack
+        from .http_client import get_shared_client
+        # The BST is cached below as a plain file, so the HTTP response cache is not needed
+        body, err = get_shared_client().fetch(_BST_URL, use_cache=False)
+        if err:
+            raise IOError(err)
+        bst_content = body.decode('utf-8')
+        # Parse the content
+        for line in bst_content.strip().split('\n'):
+            if ',' in line:
+                parts = line.split(',')
+                if len(parts) == 2:
+                    bst_map[int(parts[0])] = int(parts[1])
+        
+        # Cache the file for future use
+        cache_file = os.path.join(_get_cache_dir(), 'eventflag_bst.txt')
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            f.write(bst_content)
+        print(f"BST downloaded and cached ({len(bst_map)} entries)")
     except Exception as e:
         print(f"Failed to download BST: {e}")
     
@@ -98,30 +110,68 @@ def get_event_flag_block_map() -> Dict[int, int]:
     
     return _EVENT_FLAG_BLOCK_MAP
 
-# Save file structure offsets (for PC version)
-# Based on BND4 file structure analysis with ER-Save-Lib
-SAVE_HEADER_SIZE = 0x300  # BND4 magic (4) + header (0x2FC)
-SLOT_SIZE = 0x280010  # Size of each character slot data
 
-# Slot start offsets (from BND4 file headers)
-# Each slot is stored as a separate file within the BND4 archive
-# Slots are at: 0x300, 0x280310, 0x500320, 0x780330, etc.
-SLOT_BASE_OFFSET = 0x300  # First slot starts at 0x300
-SLOT_INCREMENT = 0x280010  # Base slot size
-SLOT_GAP = 0x10  # Gap between slots increases by 0x10 per slot
+def set_event_flag_block_map(bst_map: Dict[int, int]):
+    """Replaces the event flag block map (benchmarks and tools with their own BST)."""
+    global _EVENT_FLAG_BLOCK_MAP
+    _EVENT_FLAG_BLOCK_MAP = dict(bst_map)
+    _compile_flag_plan.cache_clear()
 
-# Profile summary is at a FIXED location in the file (UserData10 section)
-PROFILE_SUMMARY_BASE = 0x1901D00  # Base offset for profile summary section
-PROFILE_ENTRY_SIZE = 0x24C  # 588 bytes per profile entry
+class FlagPlan:
+    """
+    A list of event IDs resolved once to (byte offset within the event flags, bit mask).
+    The same plan is evaluated against every slot (and every save file) that is checked
+    for these IDs, so the BST lookups and divisions happen only once.
+    """
 
-# Profile entry structure offsets (relative to entry start)
-PROFILE_NAME_OFFSET = 0x0E  # Character name (UTF-16LE, 32 bytes max)
-PROFILE_LEVEL_OFFSET = 0x30  # Character level (4 bytes, little-endian)
-PROFILE_PLAYTIME_OFFSET = 0x34  # Play time in seconds (4 bytes, little-endian)
+    def __init__(self, event_ids, bst_map: Dict[int, int]):
+        self.keys: List[str] = []
+        self.offsets: List[int] = []
+        self.masks: List[int] = []
+        self.errors: Dict[str, str] = {}  # Event IDs that cannot be resolved
+        for event_id in event_ids:
+            block = event_id // FLAG_DIVISOR
+            index = event_id - block * FLAG_DIVISOR
+            if block not in bst_map:
+                self.errors[str(event_id)] = f"Event ID {event_id} not found in flag map (block {block})"
+                continue
+            byte_index = index // 8
+            bit_index = 7 - (index - byte_index * 8)
+            self.keys.append(str(event_id))
+            self.offsets.append(bst_map[block] * BLOCK_SIZE + byte_index)
+            self.masks.append(1 << bit_index)
+        self.max_offset = max(self.offsets, default=-1)
+
+    def __len__(self):
+        return len(self.keys) + len(self.errors)
+
+    def evaluate(self, data, event_flags_start: int) -> Tuple[Dict[str, bool], List[str]]:
+        """Returns ({event_id_str: is_set}, errors). Unresolvable IDs are reported as False."""
+        statuses = dict.fromkeys(self.errors, False)
+        errors = list(self.errors.values())
+        if event_flags_start + self.max_offset < len(data):
+            # Common case: the whole plan is in bounds, no per-flag checks needed.
+            for key, offset, mask in zip(self.keys, self.offsets, self.masks):
+                statuses[key] = (data[event_flags_start + offset] & mask) != 0
+        else:
+            for key, offset, mask in zip(self.keys, self.offsets, self.masks):
+                position = event_flags_start + offset
+                if position < len(data):
+                    statuses[key] = (data[position] & mask) != 0
+                else:
+                    statuses[key] = False
+                    errors.append(f"Event {key}: Offset {position} out of bounds")
+        return statuses, errors
+
+
+@lru_cache(maxsize=8)
+def _compile_flag_plan(event_ids: Tuple[int, ...]) -> FlagPlan:
+    return FlagPlan(event_ids, get_event_flag_block_map())
 
-# Event flags configuration  
-EVENT_FLAGS_SIZE = 0x1BF99F  # Event flags section size (~1.83MB per slot)
-EVENT_FLAGS_SLOT_OFFSET = 0x388FC  # Offset of event flags within each character slot (verified)
+
+def get_flag_plan(event_ids) -> FlagPlan:
+    """Returns the (cached) compiled plan for these event IDs."""
+    return _compile_flag_plan(tuple(int(eid) for eid in event_ids))
 
 
 class EldenRingSaveParser:
@@ -130,23 +180,27 @@ class EldenRingSaveParser:
     def __init__(self):
         self._data: Optional[bytes] = None
         self._file_path: Optional[str] = None
+        self._directory: Optional[Bnd4Directory] = None  # None: fixed slot arithmetic
         
     def load_file(self, file_path: str) -> Tuple[bool, Optional[str]]:
         """Load a save file into memory."""
         try:
             with open(file_path, 'rb') as f:
                 self._data = f.read()
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
             self._file_path = file_path
+            self._directory = None
             
             # Basic validation
             if len(self._data) < SAVE_HEADER_SIZE:
                 return False, "File too small to be a valid save file"
             
-            # Check magic bytes (BND4 or save file magic)
-            magic = self._data[:4]
-            if magic not in [b'BND4', b'\x00\x00\x00\x00']:
-                # More flexible check - look for valid save structure
-                pass
+            # Slot offsets from the BND4 entry table (cached per file identity).
+            # Files without a BND4 header (e.g. decrypted console exports) use the fixed layout.
+            if self._data[:4] == BND4_MAGIC:
+                self._directory, err = get_directory(file_path, self._data, mtime_ns)
+                if err:
+                    print(f"Warning: {err} in '{file_path}', using the default slot layout")
                 
             return True, None
         except FileNotFoundError:
@@ -160,8 +214,8 @@ class EldenRingSaveParser:
         """
         Get the event flags base offset for a character slot.
         
-        The event flags are stored at a fixed offset (0x389F8) within each 
-        character slot. This offset was discovered through calibration with
+        The event flags are stored at a fixed offset (EVENT_FLAGS_SLOT_OFFSET,
+        0x388FC, see save_layout.py) within each character slot. This offset was discovered through calibration with
         known boss event flags using the BST (block->offset) mapping algorithm.
         """
         if self._data is None:
@@ -191,39 +245,35 @@ class EldenRingSaveParser:
         
         Pattern: 0x300 + (slot_index * 0x280010)
         Each slot is exactly 0x280010 bytes apart.
+        The BND4 entry table is used when present; the pattern is the fallback.
         """
-        return SLOT_BASE_OFFSET + (slot_index * SLOT_INCREMENT)
-    
-    def _read_utf16_string(self, offset: int, max_length: int = 32) -> str:
-        """Read a null-terminated UTF-16LE string from the save data."""
+        entry = self._directory.entry(slot_index) if self._directory else None
+        return entry.data_offset if entry else slot_offset(slot_index)
+
+    def _get_profile_summary_base(self) -> int:
+        """Profile summary offset: inside UserData10 per the BND4 table, or the fixed offset."""
+        entry = self._directory.entry(USER_DATA_10_INDEX) if self._directory else None
+        return entry.data_offset + PROFILE_SUMMARY_OFFSET_IN_USER_DATA_10 if entry else PROFILE_SUMMARY_BASE
+
+    def get_slot_view(self, slot_index: int) -> Optional[memoryview]:
+        """Zero-copy view of a character slot's data (from the BND4 table, or the fixed layout)."""
         if self._data is None:
-            return ""
-        
-        try:
-            # Read max_length characters (2 bytes each for UTF-16)
-            raw = self._data[offset:offset + max_length * 2]
-            # Find null terminator
-            null_pos = raw.find(b'\x00\x00')
-            if null_pos != -1:
-                # Make sure we're at an even boundary
-                if null_pos % 2 == 1:
-                    null_pos += 1
-                raw = raw[:null_pos]
-            return raw.decode('utf-16-le', errors='ignore').rstrip('\x00')
-        except Exception:
-            return ""
-    
-    def _read_uint32(self, offset: int) -> int:
-        """Read a 4-byte unsigned integer (little-endian)."""
-        if self._data is None or offset + 4 > len(self._data):
-            return 0
-        return struct.unpack('<I', self._data[offset:offset + 4])[0]
-    
-    def _read_uint8(self, offset: int) -> int:
-        """Read a single byte."""
-        if self._data is None or offset >= len(self._data):
-            return 0
-        return self._data[offset]
+            return None
+        if self._directory and self._directory.entry(slot_index):
+            return self._directory.view(self._data, slot_index)
+        start = slot_offset(slot_index)
+        if start + SLOT_SIZE > len(self._data):
+            return None
+        return memoryview(self._data)[start:start + SLOT_SIZE]
+
+    def verify_slot_checksum(self, slot_index: int) -> Optional[bool]:
+        """
+        Checks the slot's MD5 checksum (computed once per file version).
+        Returns None when the file has no BND4 table or the slot does not exist.
+        """
+        if self._data is None or self._directory is None:
+            return None
+        return self._directory.checksum_ok(self._data, slot_index)
     
     def list_characters(self) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
         """
@@ -236,48 +286,22 @@ class EldenRingSaveParser:
         if self._data is None:
             return None, "No save file loaded"
         
-        characters = []
+        # One unpack over the whole summary table (fewer entries if the file is truncated)
+        entries = PROFILE_ENTRY.unpack_table(self._data, self._get_profile_summary_base(), MAX_CHARACTER_SLOTS)
         
-        # Elden Ring supports up to 10 character slots
-        for slot_idx in range(10):
-            try:
-                # Profile summary entries are at a fixed base, sequential
-                entry_offset = PROFILE_SUMMARY_BASE + (slot_idx * PROFILE_ENTRY_SIZE)
-                
-                # Check if entry is within file bounds
-                if entry_offset + PROFILE_ENTRY_SIZE > len(self._data):
-                    break
-                
-                # Read character name at entry + 0x0E (UTF-16LE, 32 bytes max = 16 chars)
-                name_offset = entry_offset + PROFILE_NAME_OFFSET
-                char_name = self._read_utf16_string(name_offset, 16)
-                
-                if not char_name:
-                    # Empty slot - skip
-                    continue
-                
-                # Read character level at entry + 0x30
-                level_offset = entry_offset + PROFILE_LEVEL_OFFSET
-                level = self._read_uint32(level_offset)
-                
-                # Read play time at entry + 0x34 (in seconds)
-                time_offset = entry_offset + PROFILE_PLAYTIME_OFFSET
-                play_time = self._read_uint32(time_offset)
-                
-                # Deaths are not in profile summary - would need to read from slot data
-                deaths = 0
-                
-                if char_name:  # Only add if we found a valid character
-                    characters.append({
-                        'slot_index': slot_idx,
-                        'character_name': char_name,
-                        'character_level': level,
-                        'deaths': deaths,
-                        'seconds_played': play_time
-                    })
-            except Exception as e:
-                print(f"Error reading slot {slot_idx}: {e}")
+        characters = []
+        for slot_idx, entry in enumerate(entries):
+            if not entry['character_name']:
+                # Empty slot - skip
                 continue
+            characters.append({
+                'slot_index': slot_idx,
+                'character_name': entry['character_name'],
+                'character_level': entry['character_level'],
+                # Deaths are not in profile summary - would need to read from slot data
+                'deaths': 0,
+                'seconds_played': entry['seconds_played']
+            })
         
         if not characters:
             return None, "No characters found in save file. The file may be corrupted or in an unsupported format."
@@ -347,22 +371,46 @@ class EldenRingSaveParser:
         """
         if self._data is None:
             return None, "No save file loaded"
+        return self._evaluate_plan(get_flag_plan(event_ids), slot_index)
+
+    def _evaluate_plan(self, plan: FlagPlan, slot_index: int) -> Tuple[Optional[Dict[str, bool]], Optional[str]]:
+        event_flags_start = self._find_event_flags_base(slot_index)
+        if event_flags_start is None:
+            return None, f"Could not find event flags for slot {slot_index}"
         
-        statuses = {}
-        errors = []
-        
-        for event_id in event_ids:
-            result, err = self.get_event_flag(slot_index, event_id)
-            if err:
-                errors.append(f"Event {event_id}: {err}")
-                statuses[str(event_id)] = False
-            else:
-                statuses[str(event_id)] = result if result is not None else False
+        statuses, errors = plan.evaluate(self._data, event_flags_start)
         
-        if errors and len(errors) == len(event_ids):
+        if errors and len(errors) == len(plan):
             return None, "; ".join(errors[:3])  # Return first 3 errors
         
         return statuses, None
+
+    def get_roster(self, event_ids: List[int], plan: Optional[FlagPlan] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Boss statuses for every character in the loaded file, in one pass over the
+        already loaded data with a single compiled flag plan.
+        A precompiled `plan` (e.g. built once per batch worker) replaces `event_ids`.
+        
+        Returns the list_characters() entries extended with 'boss_statuses',
+        'defeated' (number of set flags) and 'total'.
+        """
+        characters, err = self.list_characters()
+        if err:
+            return None, err
+        
+        if plan is None:
+            plan = get_flag_plan(event_ids)
+        roster = []
+        for character in characters:
+            statuses, err = self._evaluate_plan(plan, character['slot_index'])
+            entry = dict(character)
+            entry['boss_statuses'] = statuses or {}
+            entry['defeated'] = sum(entry['boss_statuses'].values())
+            entry['total'] = len(plan)
+            if err:
+                entry['error'] = err
+            roster.append(entry)
+        return roster, None
     
     def get_character_stats(self, slot_index: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
@@ -379,34 +427,27 @@ class EldenRingSaveParser:
         
         try:
             # Read from profile summary (same location as list_characters)
-            entry_offset = PROFILE_SUMMARY_BASE + (slot_index * PROFILE_ENTRY_SIZE)
-            
-            # Read character name
-            name_offset = entry_offset + PROFILE_NAME_OFFSET
-            char_name = self._read_utf16_string(name_offset, 16)
-            
-            # Read level at entry + 0x30
-            level_offset = entry_offset + PROFILE_LEVEL_OFFSET
-            level = self._read_uint32(level_offset)
-            
-            # Read play time at entry + 0x34 (in seconds)
-            time_offset = entry_offset + PROFILE_PLAYTIME_OFFSET
-            play_time = self._read_uint32(time_offset)
+            entry_offset = self._get_profile_summary_base() + (slot_index * PROFILE_ENTRY_SIZE)
+            if entry_offset + PROFILE_ENTRY_SIZE > len(self._data):
+                return None, f"Profile entry for slot {slot_index} is outside the save file"
+            entry = PROFILE_ENTRY.unpack_from(self._data, entry_offset)
             
-            # Deaths - read from slot data
-            # Based on ER-Save-Lib, UserDataX starts with checksum (0x10) then version (u32)
-            # The value at slot+0x0 appears to be the save format version (commonly 251)
-            # The actual death count is deeper in the structure after variable-length fields
-            # TODO: Implement proper UserDataX parsing to find exact death count offset
-            # For now, attempt to read from slot+0x0 as it correlates with expected values
-            slot_offset = self._get_slot_offset(slot_index)
-            deaths = self._read_uint32(slot_offset) if slot_offset else 0
+            # Deaths - the counter sits behind the variable-length item table,
+            # located by walking the slot (cached per slot checksum, see user_data_x.py)
+            deaths = 0
+            slot_view = self.get_slot_view(slot_index)
+            if slot_view is not None and entry['character_name']:
+                layout, _ = resolve_slot_layout(
+                    self._file_path, slot_index, slot_view, entry['character_name'], EVENT_FLAGS_SLOT_OFFSET
+                )
+                if layout:
+                    deaths = SLOT_TAIL.unpack_from(slot_view, layout.tail)['total_deaths_count']
             
             stats = {
-                'character_name': char_name,
+                'character_name': entry['character_name'],
                 'deaths': deaths,
-                'seconds_played': play_time,
-                'level': level
+                'seconds_played': entry['seconds_played'],
+                'level': entry['character_level']
             }
             
             return stats, None
@@ -428,16 +469,23 @@ class EldenRingSaveParser:
         """
         if self._data is None:
             return None, "No save file loaded"
+
+        # A slot read while the game is writing the file does not match its checksum yet;
+        # the caller retries on the next poll.
+        if self.verify_slot_checksum(slot_index) is False:
+            return None, f"Slot {slot_index} checksum mismatch (save file is being written?)"
         
         # Get character stats
         stats, stats_err = self.get_character_stats(slot_index)
         if stats_err:
             stats = {'deaths': 0, 'seconds_played': 0, 'level': 1}
         
-        # Get boss statuses
-        boss_statuses, boss_err = self.get_boss_statuses(slot_index, event_ids)
-        if boss_err:
-            return None, boss_err
+        # Get boss statuses (none to check if no boss definitions are loaded)
+        boss_statuses = {}
+        if event_ids:
+            boss_statuses, boss_err = self.get_boss_statuses(slot_index, event_ids)
+            if boss_err:
+                return None, boss_err
         
         return {
             'stats': stats,
@@ -490,5 +538,15 @@ class SaveParserHandler:
         return self._parser.get_full_status(slot_index, event_ids)
 
 
+    def get_roster(self, save_file_path: str, event_ids: List[int]) -> Tuple[Optional[List[Dict]], Optional[str]]:
+        """Boss statuses for all characters in the save file (see EldenRingSaveParser.get_roster)."""
+        success, err = self._parser.load_file(save_file_path)
+        if not success:
+            return None, err
+        self._current_file = save_file_path
+        
+        return self._parser.get_roster(event_ids)
+
+
 # For backwards compatibility, alias the class
 PythonSaveHandler = SaveParserHandler
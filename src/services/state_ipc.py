@@ -0,0 +1,285 @@
+# src/services/state_ipc.py
+"""
+Local IPC access to the current monitoring state, for bots, split timers and
+other tools running on the same machine. Readers never touch the save file.
+
+Socket API (line-delimited JSON, one request and one response per line):
+    {"cmd": "ping"}       -> {"ok": true}
+    {"cmd": "get_seq"}    -> {"ok": true, "seq": 12}
+    {"cmd": "get_state"}  -> {"ok": true, "seq": 12, "state": {...}}
+    {"cmd": "subscribe"}  -> the current state, then one line per update
+The socket is a Unix domain socket where the platform supports it, otherwise
+a TCP socket on 127.0.0.1.
+
+Status block (optional): a fixed-layout file meant to be mmap'd by readers:
+    header (STATUS_HEADER, little endian), then a bitset of defeated bosses
+    (bit i = entry i of the "bosses" list in the index JSON next to it).
+The block is written under a seqlock: `seq` is odd while an update is in
+progress; readers retry when it is odd or changes during their read.
+"""
+
+import os
+import json
+import mmap
+import time
+import zlib
+import socket
+import struct
+import asyncio
+
+from .background_server import BackgroundServer
+
+DEFAULT_HOST = "127.0.0.1"
+CLIENT_QUEUE_SIZE = 16
+MAX_REQUEST_LINE = 64 * 1024
+
+STATUS_MAGIC = b"TTCS"
+STATUS_VERSION = 1
+# magic, version, header_size, seq, defeated, total, deaths, boss_count,
+# seconds_played, updated_at_ms, roster_crc, reserved
+STATUS_HEADER = struct.Struct("<4sHHQiiiIqqII")
+STATUS_MAX_BOSSES = 1024
+STATUS_BLOCK_SIZE = STATUS_HEADER.size + STATUS_MAX_BOSSES // 8
+_SEQ_OFFSET = 8
+
+
+class StateIpcServer(BackgroundServer):
+    """Line-delimited JSON request/response server for the current state snapshot."""
+    name = "State IPC server"
+
+    def __init__(self, socket_path=None, port=8766):
+        super().__init__()
+        self.socket_path = socket_path
+        self.port = port
+        self.uses_unix_socket = False
+        self._seq = 0
+        self._state = None
+        self._subscribers = set()
+
+    def address(self) -> str:
+        if self.uses_unix_socket:
+            return f"unix:{self.socket_path}"
+        return f"tcp:{DEFAULT_HOST}:{self.port}"
+
+    def publish(self, snapshot: dict):
+        """Replaces the served snapshot and notifies subscribers. Safe to call from any thread."""
+        self.call_soon(self._apply_snapshot, snapshot)
+
+    async def _create_server(self):
+        if self.socket_path and hasattr(socket, "AF_UNIX"):
+            try:
+                os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+                if os.path.exists(self.socket_path):
+                    os.remove(self.socket_path) # Stale socket from a previous run
+                server = await asyncio.start_unix_server(self._tracked(self._handle_client), self.socket_path, limit=MAX_REQUEST_LINE)
+                os.chmod(self.socket_path, 0o600)
+                self.uses_unix_socket = True
+                return server
+            except (NotImplementedError, AttributeError, OSError) as e:
+                print(f"Unix socket not available ({e}), falling back to TCP loopback.")
+
+        server = await asyncio.start_server(self._tracked(self._handle_client), DEFAULT_HOST, self.port, limit=MAX_REQUEST_LINE)
+        self.port = server.sockets[0].getsockname()[1]
+        return server
+
+    def _on_stopping(self):
+        for queue in list(self._subscribers):
+            queue.put_nowait(None)
+        if self.uses_unix_socket:
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+
+    # --- Event loop side ---
+
+    def _state_line(self):
+        return self._encode({"ok": True, "seq": self._seq, "state": self._state})
+
+    @staticmethod
+    def _encode(message):
+        return json.dumps(message, separators=(',', ':')).encode('utf-8') + b"\n"
+
+    def _apply_snapshot(self, snapshot):
+        self._seq += 1
+        self._state = snapshot
+        line = self._state_line()
+        for queue in list(self._subscribers):
+            if queue.full():
+                # Subscribers only care about the newest state.
+                queue.get_nowait()
+            queue.put_nowait(line)
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(self._encode({"ok": False, "error": "request too long"}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                    cmd = request.get("cmd") if isinstance(request, dict) else None
+                except ValueError:
+                    cmd = None
+
+                if cmd == "ping":
+                    writer.write(self._encode({"ok": True}))
+                elif cmd == "get_seq":
+                    writer.write(self._encode({"ok": True, "seq": self._seq}))
+                elif cmd == "get_state":
+                    writer.write(self._state_line())
+                elif cmd == "subscribe":
+                    await self._stream_updates(writer)
+                    break
+                else:
+                    writer.write(self._encode({"ok": False, "error": "unknown command"}))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _stream_updates(self, writer):
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            writer.write(self._state_line())
+            await writer.drain()
+            while True:
+                line = await queue.get()
+                if line is None:
+                    break
+                writer.write(line)
+                await writer.drain()
+        finally:
+            self._subscribers.discard(queue)
+
+
+class StatusBlock:
+    """Fixed-layout, memory-mapped status file (counters plus a bitset of defeated bosses)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + "_index.json"
+        self._file = None
+        self._map = None
+        self._seq = 0
+        self._roster = None
+        self._roster_crc = 0
+
+    def open(self) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a+b")
+            self._file.truncate(STATUS_BLOCK_SIZE)
+            self._map = mmap.mmap(self._file.fileno(), STATUS_BLOCK_SIZE)
+        except (OSError, ValueError) as e:
+            print(f"Could not open status block '{self.path}': {e}")
+            self.close()
+            return False
+        self._map[:STATUS_BLOCK_SIZE] = bytes(STATUS_BLOCK_SIZE)
+        return True
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def update(self, snapshot, boss_data_by_location):
+        """Writes counters and the defeated bitset under the seqlock."""
+        if self._map is None:
+            return
+
+        bosses = [
+            (location, boss)
+            for location, location_bosses in boss_data_by_location.items() if isinstance(location_bosses, list)
+            for boss in location_bosses if isinstance(boss, dict)
+        ][:STATUS_MAX_BOSSES]
+        self._update_index(bosses)
+
+        bitset = bytearray(STATUS_MAX_BOSSES // 8)
+        for bit, (_, boss) in enumerate(bosses):
+            if boss.get("is_defeated"):
+                bitset[bit >> 3] |= 1 << (bit & 7)
+
+        stats = snapshot.get("stats", {})
+        header = STATUS_HEADER.pack(
+            STATUS_MAGIC, STATUS_VERSION, STATUS_HEADER.size, self._seq + 2,
+            stats.get("defeated") or 0, stats.get("total") or 0,
+            (stats.get("deaths") or 0) + snapshot.get("death_offset", 0), len(bosses),
+            stats.get("seconds_played", -1), int(time.time() * 1000), self._roster_crc, 0,
+        )
+
+        # Seqlock: odd while writing, next even value once the block is consistent.
+        struct.pack_into("<Q", self._map, _SEQ_OFFSET, self._seq + 1)
+        self._map[_SEQ_OFFSET + 8:STATUS_HEADER.size] = header[_SEQ_OFFSET + 8:]
+        self._map[STATUS_HEADER.size:STATUS_BLOCK_SIZE] = bitset
+        self._map[:_SEQ_OFFSET] = header[:_SEQ_OFFSET]
+        self._seq += 2
+        struct.pack_into("<Q", self._map, _SEQ_OFFSET, self._seq)
+
+    def _update_index(self, bosses):
+        """Writes the bit -> boss mapping whenever the roster changes."""
+        roster = [(location, boss.get("name"), boss.get("event_id")) for location, boss in bosses]
+        if roster == self._roster:
+            return
+        self._roster = roster
+        index = {
+            "version": STATUS_VERSION,
+            "bosses": [{"bit": i, "location": loc, "name": name, "event_id": eid} for i, (loc, name, eid) in enumerate(roster)],
+        }
+        body = json.dumps(index, ensure_ascii=False, indent=2)
+        self._roster_crc = zlib.crc32(body.encode('utf-8'))
+        tmp_path = f"{self.index_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(body)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Could not write status index '{self.index_path}': {e}")
+
+
+def read_status_block(path, retries=100):
+    """
+    Reads a consistent copy of a status block (reference reader for other tools).
+    Returns (fields_dict, defeated_bits) or (None, error).
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+    try:
+        for _ in range(retries):
+            seq_before = struct.unpack_from("<Q", mapped, _SEQ_OFFSET)[0]
+            if seq_before & 1:
+                continue
+            raw = bytes(mapped[:STATUS_BLOCK_SIZE])
+            if struct.unpack_from("<Q", mapped, _SEQ_OFFSET)[0] != seq_before:
+                continue
+
+            (magic, version, header_size, seq, defeated, total, deaths, boss_count,
+             seconds_played, updated_at_ms, roster_crc, _) = STATUS_HEADER.unpack_from(raw)
+            if magic != STATUS_MAGIC:
+                return None, "not a status block"
+            bitset = raw[header_size:header_size + (boss_count + 7) // 8]
+            defeated_bits = [bool(bitset[i >> 3] & (1 << (i & 7))) for i in range(boss_count)]
+            fields = {
+                "version": version, "seq": seq, "defeated": defeated, "total": total, "deaths": deaths,
+                "seconds_played": seconds_played, "updated_at_ms": updated_at_ms, "roster_crc": roster_crc,
+            }
+            return fields, defeated_bits
+        return None, "status block kept changing while reading"
+    finally:
+        mapped.close()
@@ -0,0 +1,59 @@
+# src/services/state_snapshot.py
+"""
+Builds the machine-readable snapshot of the current monitoring state.
+
+One builder is shared by every external consumer (state.json, local IPC),
+so they all expose the same structure.
+"""
+
+import json
+import heapq
+
+SCHEMA_VERSION = 1
+RECENT_KILLS_LIMIT = 10
+
+
+def build_state_snapshot(data, boss_data_manager=None, timestamp_manager=None, death_offset=0):
+    """
+    Returns a JSON-serializable dict with the full current state:
+    stats, base/DLC counts, per-region counts, last kill and recent kills.
+    `data` is the usual payload ({"stats": ..., "last_kill": ...}).
+    """
+    data = data or {}
+    stats = dict(data.get("stats", {}))
+    boss_counts = stats.pop("boss_counts", None) or {}
+    character_name = stats.get("character_name")
+
+    snapshot = {
+        "version": SCHEMA_VERSION,
+        "character_name": character_name,
+        "stats": stats,
+        "death_offset": death_offset,
+        "boss_counts": boss_counts,
+        "regions": boss_data_manager.get_location_counts() if boss_data_manager else {},
+        "last_kill": data.get("last_kill"),
+        "recent_kills": [],
+    }
+
+    if timestamp_manager and character_name:
+        timestamps = timestamp_manager.get_timestamps_for_character(character_name)
+        newest = heapq.nlargest(RECENT_KILLS_LIMIT, timestamps.items(), key=lambda item: item[1])
+        snapshot["recent_kills"] = [
+            {
+                "boss_id": boss_id,
+                "name": boss_data_manager.get_boss_name_by_id(boss_id) if boss_data_manager else None,
+                "time": play_time,
+            }
+            for boss_id, play_time in newest
+        ]
+    return snapshot
+
+
+def read_sequence(path) -> int:
+    """Returns the sequence number stored in an existing snapshot file, or 0."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            seq = json.load(f).get("seq", 0)
+        return seq if isinstance(seq, int) and seq >= 0 else 0
+    except (OSError, ValueError, AttributeError):
+        return 0
@@ -1,11 +1,11 @@
 # src/services/update_checker.py
 
-import requests
 import threading
 from PySide6.QtCore import QObject, Signal
 from packaging.version import parse as parse_version
 
 from ..config.app_config import APP_VERSION, MANIFEST_URL
+from .http_client import get_shared_client
 
 class UpdateChecker(QObject):
     """
@@ -36,9 +36,12 @@ class UpdateChecker(QObject):
         Stáhne manifest, porovná verze a v případě potřeby vyšle signál.
         """
         try:
-            response = requests.get(MANIFEST_URL, timeout=10)
-            response.raise_for_status()  # Vyvolá výjimku pro HTTP chyby 4xx/5xx
-            manifest_data = response.json()
+            # Podmíněný request: nezměněný manifest vrátí 304 a použije se kopie z cache.
+            # Offline se cache nepoužije, aktualizaci by stejně nešlo stáhnout.
+            manifest_data, err = get_shared_client().fetch_json(MANIFEST_URL, offline_fallback=False)
+            if err:
+                print(f"Error during update check (network): {err}")
+                return
             
             latest_version_str = manifest_data.get("version")
             if not latest_version_str:
@@ -55,7 +58,5 @@ class UpdateChecker(QObject):
             else:
                 print(f"Application is up to date (current: {APP_VERSION}, latest: {latest_version_str}).")
 
-        except requests.RequestException as e:
-            print(f"Error during update check (network): {e}")
         except Exception as e:
             print(f"An unexpected error occurred during update check: {e}")
\ No newline at end of file
@@ -0,0 +1,93 @@
+# src/services/user_data_x.py
+"""
+Locates fields of a character slot (UserDataX) that sit behind its
+variable-length sections, e.g. the real death counter.
+
+The slot starts with the item handle table (gaitem map), whose entries are
+8, 16 or 21 bytes depending on the item type, so nothing after it is at a
+fixed offset. walk_slot() walks the table forward to PlayerGameData and checks
+that it holds the character's name before any later field is trusted. The
+death counter is one of the game manager fields stored right before the
+event flags (SLOT_TAIL in save_layout.py).
+
+The walk takes a few milliseconds, so its result is cached per (file, slot,
+stored slot checksum): polls that re-read an unchanged slot only do the
+dictionary lookup and a single unpack.
+"""
+
+import os
+import struct
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from .save_layout import (
+    SLOT_HEADER, SLOT_TAIL, SLOT_CHECKSUM_SIZE, PLAYER_GAME_DATA_SIZE,
+    GAITEM_COUNT, GAITEM_COUNT_OLD, GAITEM_OLD_VERSION, GAITEM_TYPE_MASK,
+    GAITEM_TYPE_WEAPON, GAITEM_TYPE_ARMOR, GAITEM_SIZE_WEAPON, GAITEM_SIZE_ARMOR, GAITEM_SIZE_OTHER
+)
+
+_U32 = struct.Struct("<I")
+_CACHE_SIZE = 64
+_layout_cache = OrderedDict()  # (path, slot, checksum) -> (SlotLayout or None, error)
+
+
+class SlotLayout(NamedTuple):
+    """Offsets relative to the start of the slot."""
+    player_game_data: int
+    tail: int  # SLOT_TAIL record (death counter, ...)
+
+
+def walk_slot(view, character_name: str, event_flags_offset: int) -> Tuple[Optional[SlotLayout], Optional[str]]:
+    """
+    Walks one slot (a view starting at the slot's checksum). Returns (layout, error).
+    `character_name` comes from the profile summary and anchors PlayerGameData.
+    """
+    if len(view) < max(SLOT_HEADER.size, event_flags_offset):
+        return None, "Slot is smaller than its header and event flags"
+    header = SLOT_HEADER.unpack_from(view, 0)
+    count = GAITEM_COUNT_OLD if header["version"] <= GAITEM_OLD_VERSION else GAITEM_COUNT
+
+    position = SLOT_HEADER.size
+    limit = event_flags_offset - PLAYER_GAME_DATA_SIZE - SLOT_TAIL.size
+    unpack_u32 = _U32.unpack_from
+    for _ in range(count):
+        if position > limit:
+            return None, "Item table runs into the event flags (unknown slot layout)"
+        handle = unpack_u32(view, position)[0]
+        item_type = handle & GAITEM_TYPE_MASK
+        if handle and item_type == GAITEM_TYPE_WEAPON:
+            position += GAITEM_SIZE_WEAPON
+        elif handle and item_type == GAITEM_TYPE_ARMOR:
+            position += GAITEM_SIZE_ARMOR
+        else:
+            position += GAITEM_SIZE_OTHER
+    if position > limit:
+        return None, "Item table runs into the event flags (unknown slot layout)"
+
+    name = character_name.encode("utf-16-le")
+    if not name or bytes(view[position:position + PLAYER_GAME_DATA_SIZE]).find(name) == -1:
+        return None, "Character name not found in PlayerGameData (unknown slot layout)"
+
+    tail_offset = event_flags_offset - SLOT_TAIL.size
+    tail = SLOT_TAIL.unpack_from(view, tail_offset)
+    if tail["in_online_session"] > 1 or tail["not_alone"] > 1:
+        return None, "Unexpected values before the event flags (unknown slot layout)"
+    return SlotLayout(position, tail_offset), None
+
+
+def resolve_slot_layout(path: str, slot_index: int, view, character_name: str,
+                        event_flags_offset: int) -> Tuple[Optional[SlotLayout], Optional[str]]:
+    """walk_slot() cached per (file, slot, stored slot checksum). Failures are cached too."""
+    key = (os.path.abspath(path), slot_index, bytes(view[:SLOT_CHECKSUM_SIZE]), character_name)
+    cached = _layout_cache.get(key)
+    if cached is not None:
+        _layout_cache.move_to_end(key)
+        return cached
+
+    result = walk_slot(view, character_name, event_flags_offset)
+    if result[1]:
+        print(f"Slot {slot_index} of '{os.path.basename(path)}': {result[1]}")
+    _layout_cache[key] = result
+    if len(_layout_cache) > _CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return result
@@ -6,6 +6,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPixmap, QGuiApplication
 from PySide6.QtCore import Qt
 from ...utils import get_image_path
+from ...services.image_loader import get_location_image_loader
+from ...config.app_config import LOCATION_IMAGE_WIDTH
 
 class LocationDialog(QDialog):
     """
@@ -27,24 +29,31 @@ class LocationDialog(QDialog):
         main_layout.setSpacing(10)
 
         image_path = self.boss_data.get("location_image")
-        image_label = QLabel()
+        self.image_label = QLabel()
+        self._image_name = None
+        self._waiting_for_image = False
 
         if image_path:
-            # The 'location_image' field now contains the full relative path to the image.
-            # We just need to pass it to get_image_path to get the absolute path.
-            full_image_path = get_image_path(image_path)
-            pixmap = QPixmap(full_image_path)
-            
-            if not pixmap.isNull():
-                image_label.setPixmap(pixmap.scaledToWidth(870, Qt.TransformationMode.SmoothTransformation))
+            # The 'location_image' field contains the image's relative path; the loader
+            # reads it from the asset pack, or from the loose file via get_image_path.
+            self._image_name = image_path
+            loader = get_location_image_loader()
+            image = loader.cached_image(self._image_name, LOCATION_IMAGE_WIDTH)
+
+            if image is not None:
+                self.image_label.setPixmap(QPixmap.fromImage(image))
             else:
-                error_path_display = full_image_path.replace('\\', '/')
-                image_label.setText(f"Image not found at:\n{error_path_display}")
+                # Show a placeholder right away; the image is decoded on a worker thread.
+                self.image_label.setText("Loading location image...")
+                self.image_label.setMinimumSize(LOCATION_IMAGE_WIDTH, LOCATION_IMAGE_WIDTH * 9 // 16)
+                self._waiting_for_image = True
+                loader.image_ready.connect(self._on_image_ready)
+                loader.request(self._image_name, LOCATION_IMAGE_WIDTH)
         else:
-            image_label.setText("No location image available for this boss.")
+            self.image_label.setText("No location image available for this boss.")
         
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(image_label)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.image_label)
 
         # Description Label
         description = self.boss_data.get("description", "")
@@ -60,4 +69,27 @@ class LocationDialog(QDialog):
         button_box.accepted.connect(self.accept)
         main_layout.addWidget(button_box, 0, Qt.AlignmentFlag.AlignCenter)
 
-        self.setLayout(main_layout)
\ No newline at end of file
+        self.setLayout(main_layout)
+
+    def _on_image_ready(self, image_name, width, image):
+        if image_name != self._image_name or width != LOCATION_IMAGE_WIDTH:
+            return
+        self._stop_waiting_for_image()
+        self.image_label.setMinimumSize(0, 0)
+
+        if not image.isNull():
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+        else:
+            error_path_display = get_image_path(image_name).replace('\\', '/')
+            self.image_label.setText(f"Image not found at:\n{error_path_display}")
+        self.adjustSize()
+
+    def _stop_waiting_for_image(self):
+        if self._waiting_for_image:
+            self._waiting_for_image = False
+            get_location_image_loader().image_ready.disconnect(self._on_image_ready)
+
+    def done(self, result):
+        # Stop listening for the image if the dialog is closed before it arrives.
+        self._stop_waiting_for_image()
+        super().done(result)
\ No newline at end of file
@@ -0,0 +1,83 @@
+# src/ui/dialogs/roster_dialog.py
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from ...utils import format_seconds_to_hms
+
+class RosterDialog(QDialog):
+    """
+    Shows boss progress for every character in the save file side by side.
+    Each roster entry is a list_characters() dict plus "counts" from BossDataManager.count_defeated().
+    """
+    COLUMNS = ["Character", "Level", "Play Time", "Base Game", "DLC", "Total", "Completion"]
+
+    def __init__(self, roster, selected_slot=None, parent=None):
+        super().__init__(parent)
+        self.roster = roster
+        self.selected_slot = selected_slot
+        self.setWindowTitle("Characters")
+        self.setMinimumWidth(640)
+        self.setObjectName("rosterDialog")
+
+        self._init_ui()
+
+    def _init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(15)
+
+        title_label = QLabel("Boss Progress by Character")
+        title_label.setObjectName("dialogTitle")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(title_label)
+
+        table = QTableWidget(len(self.roster), len(self.COLUMNS))
+        table.setHorizontalHeaderLabels(self.COLUMNS)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+
+        for row, character in enumerate(self.roster):
+            counts = character.get("counts", {})
+            total = counts.get("total", {"defeated": 0, "total": 0})
+            completion = f"{total['defeated'] * 100 / total['total']:.0f}%" if total["total"] else "-"
+            if character.get("error"):
+                completion = "Unreadable"
+
+            values = [
+                character.get("character_name", f"Slot {character.get('slot_index')}"),
+                str(character.get("character_level", "??")),
+                format_seconds_to_hms(character.get("seconds_played", -1)),
+                self._format_count(counts.get("base")),
+                self._format_count(counts.get("dlc")),
+                self._format_count(total),
+                completion,
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if character.get("slot_index") == self.selected_slot:
+                    font = QFont(item.font())
+                    font.setBold(True)
+                    item.setFont(font)
+                if character.get("error"):
+                    item.setToolTip(character["error"])
+                table.setItem(row, column, item)
+
+        main_layout.addWidget(table)
+
+        # OK Button
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+        button_box.accepted.connect(self.accept)
+        main_layout.addWidget(button_box)
+
+    @staticmethod
+    def _format_count(count):
+        if not count or not count.get("total"):
+            return "-"
+        return f"{count['defeated']} / {count['total']}"
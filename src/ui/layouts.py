@@ -48,6 +48,12 @@ def create_file_slot_layout(parent_widget):
     parent_widget.character_slot_combobox.setEnabled(False)
     main_v_layout.addWidget(parent_widget.character_slot_combobox)
 
+    parent_widget.roster_button = QPushButton("Compare All Characters")
+    parent_widget.roster_button.setObjectName("rosterButton")
+    parent_widget.roster_button.setToolTip("Boss progress of every character in this save file")
+    parent_widget.roster_button.setEnabled(False)
+    main_v_layout.addWidget(parent_widget.roster_button)
+
     # Add a label for character mismatch warnings
     parent_widget.character_warning_label = QLabel("")
     parent_widget.character_warning_label.setObjectName("warningLabel")
@@ -247,10 +253,43 @@ def create_obs_panel_layout(parent_widget):
     parent_widget.obs_last_boss_format = QLineEdit("Last Kill: {boss_name} ({kill_time})")
     last_boss_layout.addWidget(parent_widget.obs_last_boss_format)
     files_layout.addLayout(last_boss_layout)
+
+    state_json_layout = QVBoxLayout()
+    parent_widget.obs_state_json_enabled = QCheckBox("Enable state.json (for bots and other tools)")
+    parent_widget.obs_state_json_enabled.setObjectName("obsStateJsonCheckbox")
+    parent_widget.obs_state_json_enabled.setToolTip("Writes the full current state (stats, region counts, recent kills) as one JSON file with an increasing 'seq' number.")
+    state_json_layout.addWidget(parent_widget.obs_state_json_enabled)
+    files_layout.addLayout(state_json_layout)
     
     files_groupbox.setLayout(files_layout)
     layout.addWidget(files_groupbox)
     
+    push_server_groupbox = QGroupBox("Browser Source (Live Updates)")
+    push_server_layout = QVBoxLayout(push_server_groupbox)
+    parent_widget.obs_push_server_enabled = QCheckBox("Enable local browser source server")
+    parent_widget.obs_push_server_enabled.setObjectName("obsPushServerCheckbox")
+    parent_widget.obs_push_server_enabled.setToolTip("Serves a live overlay page for OBS Browser Sources. Updates are pushed instantly, no files are polled.")
+    push_server_layout.addWidget(parent_widget.obs_push_server_enabled)
+    parent_widget.obs_push_server_url_label = QLabel("")
+    parent_widget.obs_push_server_url_label.setObjectName("obsPushServerUrlLabel")
+    parent_widget.obs_push_server_url_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+    push_server_layout.addWidget(parent_widget.obs_push_server_url_label)
+    layout.addWidget(push_server_groupbox)
+
+    ipc_groupbox = QGroupBox("External Tools (Local IPC)")
+    ipc_layout = QVBoxLayout(ipc_groupbox)
+    parent_widget.ipc_server_enabled = QCheckBox("Enable local state server")
+    parent_widget.ipc_server_enabled.setToolTip("Serves the current state as line-delimited JSON to local tools (bots, stream decks). Only reachable from this PC.")
+    ipc_layout.addWidget(parent_widget.ipc_server_enabled)
+    parent_widget.ipc_status_block_enabled = QCheckBox("Enable status block file")
+    parent_widget.ipc_status_block_enabled.setToolTip("Keeps a small fixed-layout status file (counters and defeated bosses) updated for tools that read shared memory.")
+    ipc_layout.addWidget(parent_widget.ipc_status_block_enabled)
+    parent_widget.ipc_status_label = QLabel("")
+    parent_widget.ipc_status_label.setWordWrap(True)
+    parent_widget.ipc_status_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+    ipc_layout.addWidget(parent_widget.ipc_status_label)
+    layout.addWidget(ipc_groupbox)
+
     # --- Add Apply Button ---
     layout.addSpacing(5)
     parent_widget.obs_apply_button = QPushButton("Apply Changes")
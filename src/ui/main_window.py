@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QPushButton, QFileDialog, QLineEdit, QCheckBox, QFrame, QMessageBox, QStackedLayout
 )
 from .widgets.resizing_stacked_widget import ResizingStackedWidget
-from PySide6.QtCore import Qt, QTimer, QSettings
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
 
 from .styles import apply_app_styles
@@ -27,7 +27,13 @@ from src.config.app_config import (
     RUST_CLI_TOOL_PATH_PLACEHOLDER,
     DEFAULT_BOSS_REFERENCE_FILENAME,
     DLC_BOSS_REFERENCE_FILENAME,
-    LOCATION_PROGRESSION_ORDER
+    LOCATION_PROGRESSION_ORDER,
+    SEARCH_DEBOUNCE_MS,
+    STATE_IPC_ENABLED,
+    STATE_IPC_STATUS_BLOCK_ENABLED,
+    STATE_IPC_SOCKET_NAME,
+    STATE_IPC_PORT,
+    STATUS_BLOCK_FILENAME
 )
 from src.services.hybrid_save_handler import HybridSaveHandler
 from src.domain.boss_data_manager import BossDataManager
@@ -35,8 +41,10 @@ from src.services.save_monitor_logic import SaveMonitorLogic
 from .managers.obs_manager import ObsManager
 from src.domain.timestamp_manager import TimestampManager
 from src.services.update_checker import UpdateChecker
+from src.services.live_clock import LiveClock
+from src.services.state_ipc import StateIpcServer, StatusBlock
 from src.app_logic import AppLogic
-from src.utils import get_resource_path, get_app_icon_path
+from src.utils import get_resource_path, get_app_icon_path, get_app_data_path, get_app_settings, startup_trace
 import webbrowser
 
 class BossChecklistApp(QWidget):
@@ -46,22 +54,30 @@ class BossChecklistApp(QWidget):
         self.setGeometry(600, 200, 1000, 900)
         self.setWindowIcon(QIcon(get_app_icon_path()))
 
-        self._init_managers()
-        self.app_logic = AppLogic(self)
-        self.boss_data_manager.load_definitions()
-        self._init_ui()
-        self.load_and_apply_filters()
-        self.boss_data_manager.set_content_filter(self.content_filter_combobox.currentData())
-        self._init_overlay_and_obs_managers()
-        self._connect_signals()
-        self.app_logic.update_main_boss_area(clear=True)
-        if self.character_slot_combobox.currentIndex() > 0:
-            self.app_logic.handle_character_selection_change(self.character_slot_combobox.currentIndex())
-        apply_app_styles(self)
+        with startup_trace.phase("managers"):
+            self._init_managers()
+            self.app_logic = AppLogic(self)
+        with startup_trace.phase("load_definitions"):
+            self.boss_data_manager.load_definitions()
+        with startup_trace.phase("UI build"):
+            self._init_ui()
+            self.load_and_apply_filters()
+        with startup_trace.phase("set_content_filter"):
+            self.boss_data_manager.set_content_filter(self.content_filter_combobox.currentData())
+        with startup_trace.phase("overlay and OBS managers"):
+            self._init_overlay_and_obs_managers()
+            self._connect_signals()
+            self._load_state_ipc_settings()
+        with startup_trace.phase("boss area"):
+            self.app_logic.update_main_boss_area(clear=True)
+            if self.character_slot_combobox.currentIndex() > 0:
+                self.app_logic.handle_character_selection_change(self.character_slot_combobox.currentIndex())
+        with startup_trace.phase("styles"):
+            apply_app_styles(self)
         self.browse_button.setEnabled(True) # Final override to ensure the button is enabled
 
     def _init_managers(self):
-        self.settings = QSettings("TheTarnishedChronicle", "App")
+        self.settings = get_app_settings()
         self.boss_data_manager = BossDataManager(
             base_filename=DEFAULT_BOSS_REFERENCE_FILENAME,
             dlc_filename=DLC_BOSS_REFERENCE_FILENAME
@@ -69,10 +85,67 @@ class BossChecklistApp(QWidget):
         self.rust_cli_handler = HybridSaveHandler(RUST_CLI_TOOL_PATH_PLACEHOLDER)
         self.save_monitor_logic = SaveMonitorLogic(self.rust_cli_handler, self.boss_data_manager, self)
         self.timestamp_manager = TimestampManager()
-        self.ui_timer = QTimer(self)
-        self.ui_timer.setInterval(1000)
+        self.live_clock = LiveClock(self)
+        self.search_debounce_timer = QTimer(self)
+        self.search_debounce_timer.setSingleShot(True)
+        self.search_debounce_timer.setInterval(SEARCH_DEBOUNCE_MS)
         self.location_widgets = {}
         self.update_checker = UpdateChecker(self)
+        self._init_state_ipc()
+
+    def _init_state_ipc(self):
+        """The optional local IPC endpoints for external tools; started by _load_state_ipc_settings()."""
+        self.state_ipc_server = None
+        self.status_block = None
+
+    def _load_state_ipc_settings(self):
+        """Restores the IPC toggles and starts the enabled endpoints."""
+        for checkbox, key, default in (
+            (self.ipc_server_enabled, "ipc/enabled", STATE_IPC_ENABLED),
+            (self.ipc_status_block_enabled, "ipc/statusBlock", STATE_IPC_STATUS_BLOCK_ENABLED),
+        ):
+            checkbox.blockSignals(True)
+            checkbox.setChecked(self.settings.value(key, default, type=bool))
+            checkbox.blockSignals(False)
+        self._apply_state_ipc()
+
+    def handle_state_ipc_change(self):
+        self.settings.setValue("ipc/enabled", self.ipc_server_enabled.isChecked())
+        self.settings.setValue("ipc/statusBlock", self.ipc_status_block_enabled.isChecked())
+        self._apply_state_ipc()
+
+    def _apply_state_ipc(self):
+        """Starts or stops the IPC server and the status block to match the toggles."""
+        messages = []
+        if self.ipc_server_enabled.isChecked():
+            if not self.state_ipc_server:
+                server = StateIpcServer(os.path.join(get_app_data_path(), STATE_IPC_SOCKET_NAME), STATE_IPC_PORT)
+                if server.start():
+                    self.state_ipc_server = server
+            if self.state_ipc_server:
+                messages.append(f"State server: {self.state_ipc_server.address()}")
+            else:
+                messages.append("Could not start the state server.")
+        elif self.state_ipc_server:
+            self.state_ipc_server.stop()
+            self.state_ipc_server = None
+
+        if self.ipc_status_block_enabled.isChecked():
+            if not self.status_block:
+                status_block = StatusBlock(os.path.join(get_app_data_path(), STATUS_BLOCK_FILENAME))
+                if status_block.open():
+                    self.status_block = status_block
+            if self.status_block:
+                messages.append(f"Status block: {self.status_block.path}")
+            else:
+                messages.append("Could not open the status block file.")
+        elif self.status_block:
+            self.status_block.close()
+            self.status_block = None
+
+        self.ipc_status_label.setText("\n".join(messages))
+        # Endpoints that were just started get the current state right away
+        self.app_logic.publish_state_snapshot()
 
     def _init_overlay_and_obs_managers(self):
         self.overlay_manager = OverlayManager(
@@ -116,7 +189,8 @@ class BossChecklistApp(QWidget):
         saved_path = self.settings.value("saveFilePath", "")
         if os.path.exists(saved_path):
             self.save_file_path_label.setText(saved_path)
-            self.app_logic.on_save_file_path_changed(saved_path)
+            with startup_trace.phase("first parse"):
+                self.app_logic.on_save_file_path_changed(saved_path)
         else:
             self.save_file_path_label.setText("Please select a save file...")
             self.character_slot_combobox.clear()
@@ -210,22 +284,30 @@ class BossChecklistApp(QWidget):
     def _connect_signals(self):
         self.save_monitor_logic.monitoring_started.connect(self.app_logic._handle_monitoring_started)
         self.save_monitor_logic.monitoring_stopped.connect(self.app_logic._handle_monitoring_stopped)
-        self.save_monitor_logic.stats_updated.connect(self.app_logic.handle_stats_update)
+        self.save_monitor_logic.delta_updated.connect(self.app_logic.handle_monitor_delta)
+        # Connected after handle_monitor_delta so the snapshot sees the processed stats.
+        self.save_monitor_logic.delta_updated.connect(self.app_logic.publish_state_snapshot)
         
         self.browse_button.clicked.connect(self.app_logic.browse_for_save_file)
         self.character_slot_combobox.currentIndexChanged.connect(self.app_logic.handle_character_selection_change)
         self.character_slot_combobox.currentIndexChanged.connect(self.obs_manager.on_character_changed)
+        self.roster_button.clicked.connect(self.app_logic.show_roster_dialog)
         
         self.content_filter_combobox.currentIndexChanged.connect(self.app_logic.handle_content_filter_change)
         self.hide_defeated_checkbox.stateChanged.connect(self.app_logic.handle_status_filter_change)
         
         self.search_bar.textChanged.connect(self.app_logic.on_search_text_changed)
+        self.search_debounce_timer.timeout.connect(self.app_logic.apply_search_filter)
         
         self.toggle_overlay_button.toggled.connect(self.overlay_manager.on_toggle_overlay)
         self.overlay_settings_button.clicked.connect(self.app_logic.toggle_overlay_settings)
         self.obs_settings_button.clicked.connect(self.app_logic.toggle_obs_settings)
+        self.ipc_server_enabled.toggled.connect(self.handle_state_ipc_change)
+        self.ipc_status_block_enabled.toggled.connect(self.handle_state_ipc_change)
 
-        self.ui_timer.timeout.connect(self.app_logic.update_live_timer)
+        self.live_clock.seconds_changed.connect(self.stats_section.update_playtime)
+        self.live_clock.seconds_changed.connect(self.overlay_manager.update_playtime)
+        self.live_clock.seconds_changed.connect(self.obs_manager.update_time)
         
         self.save_monitor_logic.boss_defeated.connect(self.app_logic.on_boss_defeated)
         self.save_monitor_logic.game_process_status.connect(self.app_logic.on_game_process_status_changed)
@@ -296,6 +378,12 @@ class BossChecklistApp(QWidget):
         self.settings.setValue("geometry", self.saveGeometry())
         if self.overlay_manager and self.overlay_manager.overlay_window:
             self.overlay_manager.overlay_window.close()
+        if self.obs_manager:
+            self.obs_manager.close()
+        if self.state_ipc_server:
+            self.state_ipc_server.stop()
+        if self.status_block:
+            self.status_block.close()
         super().closeEvent(event)
 
 
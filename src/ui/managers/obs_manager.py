@@ -1,9 +1,18 @@
 # src/obs_manager.py
 
 import os
-from PySide6.QtWidgets import QFileDialog, QMessageBox, QGroupBox, QPushButton
-from PySide6.QtCore import QSettings, Qt
-from ...utils import format_seconds_to_hms
+import json
+import time
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QGroupBox, QPushButton, QCheckBox, QLabel
+from PySide6.QtCore import Qt
+from ...utils import format_seconds_to_hms, get_app_settings
+from ...services.obs_writer import ObsFileWriter
+from ...services.obs_push_server import ObsPushServer
+from ...services.state_snapshot import build_state_snapshot, read_sequence
+from ...services.obs_templates import (
+    compile_template, TemplateContext, TemplateError, PLACEHOLDERS, DEFAULT_FORMATS, TIME_DEPENDENT_FIELDS
+)
+from ...config.app_config import OBS_FLUSH_INTERVAL_SEC, OBS_PUSH_SERVER_PORT
 
 class ObsManager:
     def __init__(self, main_app_ref, obs_panel_ref, settings_button_ref,
@@ -37,21 +46,31 @@ class ObsManager:
         self.obs_undo_reset_button = obs_undo_reset_button_ref
         self.character_combobox = character_slot_combobox_ref
         self.apply_button = self.panel.findChild(QPushButton, "applyButton")
+        self.push_server_enabled = self.panel.findChild(QCheckBox, "obsPushServerCheckbox")
+        self.push_server_url_label = self.panel.findChild(QLabel, "obsPushServerUrlLabel")
+        self.state_json_enabled = self.panel.findChild(QCheckBox, "obsStateJsonCheckbox")
 
         # UI Grouping for enabling/disabling
         self.child_widgets = [
             self.folder_label, self.browse_button,
             self.bosses_enabled, self.bosses_format, self.deaths_enabled,
             self.deaths_format, self.time_enabled, self.time_format,
-            self.last_boss_enabled, self.last_boss_format,
+            self.last_boss_enabled, self.last_boss_format, self.state_json_enabled,
             self.panel.findChild(QGroupBox, "files_groupbox")
         ]
 
-        self.settings = QSettings("TheTarnishedChronicle", "App")
+        self.settings = get_app_settings()
         self.death_offset = 0 # This will hold the offset for the CURRENT character
+        self.session_start_defeated = {} # Character name -> defeated count at its first update this session
+        self.templates = {} # Output file -> CompiledTemplate
+        self.state_seq = None # Sequence number of the last state.json write (seeded from the file)
+        self._last_state_body = None
+        self.writer = ObsFileWriter(OBS_FLUSH_INTERVAL_SEC)
+        self.push_server = ObsPushServer(port=OBS_PUSH_SERVER_PORT)
         self._load_settings()
         self.connect_signals()
         self.handle_state_change() # Apply initial enabled/disabled state
+        self.handle_push_server_change()
         self.on_character_changed() # Load initial offset and set button state
 
     def connect_signals(self):
@@ -71,6 +90,12 @@ class ObsManager:
         self.deaths_enabled.stateChanged.connect(self._save_settings)
         self.time_enabled.stateChanged.connect(self._save_settings)
         self.last_boss_enabled.stateChanged.connect(self._save_settings)
+        if self.state_json_enabled:
+            self.state_json_enabled.stateChanged.connect(self._save_settings)
+            self.state_json_enabled.stateChanged.connect(self.app.app_logic.force_stats_update_for_obs)
+        if self.push_server_enabled:
+            self.push_server_enabled.toggled.connect(self.handle_push_server_change)
+            self.push_server_enabled.toggled.connect(self._save_settings)
 
         # Connect format edits and the new apply button to the new handler
         if self.apply_button:
@@ -89,16 +114,26 @@ class ObsManager:
         self.folder_label.setText(self.settings.value("obs/folder", "Not set."))
         
         self.bosses_enabled.setChecked(self.settings.value("obs/bossesEnabled", True, type=bool))
-        self.bosses_format.setText(self.settings.value("obs/bossesFormat", "Bosses: {defeated}/{total}"))
+        self.bosses_format.setText(self.settings.value("obs/bossesFormat", DEFAULT_FORMATS["bosses"]))
         
         self.deaths_enabled.setChecked(self.settings.value("obs/deathsEnabled", True, type=bool))
-        self.deaths_format.setText(self.settings.value("obs/deathsFormat", "Deaths: {deaths}"))
+        self.deaths_format.setText(self.settings.value("obs/deathsFormat", DEFAULT_FORMATS["deaths"]))
 
         self.time_enabled.setChecked(self.settings.value("obs/timeEnabled", True, type=bool))
-        self.time_format.setText(self.settings.value("obs/timeFormat", "Time: {time}"))
+        self.time_format.setText(self.settings.value("obs/timeFormat", DEFAULT_FORMATS["time"]))
 
         self.last_boss_enabled.setChecked(self.settings.value("obs/lastBossEnabled", True, type=bool))
-        self.last_boss_format.setText(self.settings.value("obs/lastBossFormat", "Last Kill: {boss_name} ({kill_time})"))
+        self.last_boss_format.setText(self.settings.value("obs/lastBossFormat", DEFAULT_FORMATS["last_boss"]))
+
+        # Invalid saved formats fall back to the defaults instead of failing on every update.
+        for error in self._compile_formats(fallback_to_default=True):
+            print(f"OBS format error, using default: {error}")
+
+        if self.state_json_enabled:
+            self.state_json_enabled.setChecked(self.settings.value("obs/stateJsonEnabled", False, type=bool))
+
+        if self.push_server_enabled:
+            self.push_server_enabled.setChecked(self.settings.value("obs/pushServerEnabled", False, type=bool))
 
         # Note: Character-specific death offset is loaded in on_character_changed, not here.
 
@@ -119,12 +154,48 @@ class ObsManager:
         self.settings.setValue("obs/lastBossEnabled", self.last_boss_enabled.isChecked())
         self.settings.setValue("obs/lastBossFormat", self.last_boss_format.text())
 
+        if self.state_json_enabled:
+            self.settings.setValue("obs/stateJsonEnabled", self.state_json_enabled.isChecked())
+
+        if self.push_server_enabled:
+            self.settings.setValue("obs/pushServerEnabled", self.push_server_enabled.isChecked())
+
         # Note: Character-specific death offset is saved in its own methods.
 
+    def _format_edits(self):
+        return {
+            "bosses": self.bosses_format,
+            "deaths": self.deaths_format,
+            "time": self.time_format,
+            "last_boss": self.last_boss_format,
+        }
+
+    def _compile_formats(self, fallback_to_default=False):
+        """
+        Compiles all format strings into self.templates. Returns a list of error messages.
+        Templates that fail keep their previous compiled version (or the default one).
+        """
+        errors = []
+        for key, line_edit in self._format_edits().items():
+            try:
+                self.templates[key] = compile_template(line_edit.text())
+            except TemplateError as e:
+                errors.append(f"{key}.txt: {e}")
+                if fallback_to_default or key not in self.templates:
+                    self.templates[key] = compile_template(DEFAULT_FORMATS[key])
+        return errors
+
     def apply_and_save_formats(self):
-        """Saves the format strings and immediately refreshes the OBS files."""
+        """Validates and compiles the format strings, saves them and immediately refreshes the OBS files."""
         print("Applying and saving OBS format changes...")
+        errors = self._compile_formats()
+        if errors:
+            QMessageBox.warning(self.app, "Invalid OBS Format",
+                                "The following formats were not applied:\n\n" + "\n".join(errors))
+            return
         self._save_settings()
+        self.writer.forget()
+        self._forget_state_file()
         self.app.app_logic.force_stats_update_for_obs()
 
     def handle_state_change(self):
@@ -133,6 +204,20 @@ class ObsManager:
         for widget in self.child_widgets:
             if widget: # Check if widget exists
                 widget.setEnabled(is_enabled)
+
+    def handle_push_server_change(self):
+        """Starts or stops the local browser source server based on its checkbox."""
+        if not self.push_server_enabled:
+            return
+        if self.push_server_enabled.isChecked():
+            if self.push_server.start():
+                self.push_server_url_label.setText(f"Browser Source URL: http://{self.push_server.host}:{self.push_server.port}/")
+                self.app.app_logic.force_stats_update_for_obs()
+            else:
+                self.push_server_url_label.setText(f"Could not start server on port {self.push_server.port}.")
+        else:
+            self.push_server.stop()
+            self.push_server_url_label.setText("")
     
 
     def set_folder_path(self):
@@ -143,6 +228,8 @@ class ObsManager:
         if folder:
             self.folder_label.setText(folder)
             self._save_settings() # Save immediately after selection
+            self.writer.forget()
+            self._forget_state_file(new_folder=True)
             self.app.app_logic.force_stats_update_for_obs()
     
     def show_instructions(self):
@@ -153,7 +240,8 @@ class ObsManager:
 
         # Použijeme HTML pro bohaté formátování
         title_app = "<h3>Step 1: Configure in The Tarnished's Chronicle</h3>"
-        steps_app = """
+        placeholder_items = "".join(f"<li><code>{{{name}}}</code> - {description}</li>" for name, description in PLACEHOLDERS.items())
+        steps_app = f"""
         <ol>
             <li><b>Enable the Feature:</b> Click the main toggle at the top of this panel to enable file writing.</li>
             <li>
@@ -164,14 +252,9 @@ class ObsManager:
                 <b>Configure Files:</b> For each stat (Bosses, Deaths, Time), you can:
                 <ul>
                     <li>Check the 'Enable' box to create/update its file (e.g., <code>bosses.txt</code>).</li>
-                    <li>Customize the text format using placeholders:
+                    <li>Customize the text format using placeholders (invalid formats are rejected when you click 'Apply Changes'):
                         <ul>
-                            <li><code>{defeated}</code> - Number of bosses defeated.</li>
-                            <li><code>{total}</code> - Total number of bosses.</li>
-                            <li><code>{deaths}</code> - Current death count.</li>
-                            <li><code>{time}</code> - Total play time (HH:MM:SS).</li>
-                            <li><code>{boss_name}</code> - Name of the last boss killed.</li>
-                            <li><code>{kill_time}</code> - Play time when the last boss was killed.</li>
+                            {placeholder_items}
                         </ul>
                     </li>
                 </ul>
@@ -200,9 +283,18 @@ class ObsManager:
             </li>
         </ol>
         """
+
+        title_browser = "<h3>Alternative: Browser Source (Live Updates)</h3>"
+        steps_browser = f"""
+        <ol>
+            <li>Check <b>'Enable local browser source server'</b> at the bottom of this panel.</li>
+            <li>In OBS, add a <b>Browser</b> source and set its URL to <code>http://127.0.0.1:{self.push_server.port}/</code>.</li>
+            <li>Stats are pushed to the page the moment they change; no files are needed. Use the source's 'Custom CSS' to style it.</li>
+        </ol>
+        """
         
         msg_box.setTextFormat(Qt.RichText)
-        msg_box.setText(title_app + steps_app + title_obs + steps_obs)
+        msg_box.setText(title_app + steps_app + title_obs + steps_obs + title_browser + steps_browser)
         msg_box.addButton(QMessageBox.StandardButton.Ok)
         msg_box.exec()
 
@@ -264,55 +356,116 @@ class ObsManager:
         self.update_obs_files(self.app.last_known_stats) # Force update
         print(f"Removed death offset for {char_key}")
 
-    def update_obs_files(self, data: dict):
-        """Zapíše data do všech povolených souborů."""
+    def _make_context(self, data, seconds_played=None):
+        character_name = (data or {}).get("stats", {}).get("character_name")
+        return TemplateContext(
+            data,
+            boss_data_manager=self.app.boss_data_manager,
+            death_offset=self.death_offset,
+            session_start_defeated=self.session_start_defeated.get(character_name),
+            seconds_played=seconds_played,
+        )
+
+    def _enabled_outputs(self):
+        """Output file key -> enable checkbox, in write order."""
+        return {
+            "bosses": self.bosses_enabled,
+            "deaths": self.deaths_enabled,
+            "time": self.time_enabled,
+            "last_boss": self.last_boss_enabled,
+        }
+
+    def _render_outputs(self, context, keys=None):
+        """Vyrenderuje šablony povolených souborů (jen zadané klíče) a zapíše je."""
         if not self.enable_toggle.isChecked(): return
         folder = self.folder_label.text()
         if not folder or folder == "Not set.": return
 
+        for key, enabled in self._enabled_outputs().items():
+            if not enabled.isChecked() or (keys is not None and key not in keys):
+                continue
+            if key == "last_boss" and not context.last_kill:
+                text = "" # Clear the file if no boss has been killed
+            else:
+                text = self.templates[key].render(context)
+            self._write_file(os.path.join(folder, f"{key}.txt"), text)
+
+    def update_obs_files(self, data: dict):
+        """Zapíše data do všech povolených souborů a pošle je do browser source serveru."""
         stats = data.get("stats", {})
-        last_kill = data.get("last_kill")
+        if stats.get('defeated') is not None:
+            self.session_start_defeated.setdefault(stats.get("character_name"), stats['defeated'])
+
+        context = self._make_context(data)
+
+        if self.push_server.is_running():
+            last_kill = context.last_kill
+            self.push_server.publish({
+                "defeated": stats.get('defeated'),
+                "total": stats.get('total'),
+                "deaths": context.get("deaths"),
+                "seconds_played": stats.get('seconds_played', -1),
+                "time": context.get("time"),
+                "last_boss_name": last_kill.get("name") if last_kill else None,
+                "last_kill_time": context.get("kill_time") if last_kill else None,
+            })
+
+        self._render_outputs(context)
+        self._write_state_file(data)
+
+    def update_time(self, seconds: int):
+        """Slot for LiveClock.seconds_changed; only outputs whose template depends on play time are re-rendered."""
+        time_str = format_seconds_to_hms(seconds) if seconds >= 0 else "--:--:--"
+        if self.push_server.is_running():
+            self.push_server.publish({"seconds_played": seconds, "time": time_str})
+
+        keys = [key for key, template in self.templates.items() if template.fields & TIME_DEPENDENT_FIELDS]
+        if keys:
+            context = self._make_context(self.app.app_logic.last_known_stats, seconds_played=seconds)
+            self._render_outputs(context, keys)
+
+    def update_state_file(self, data: dict):
+        """Jen state.json (playtime-only změny); textové soubory se nemění."""
+        self._write_state_file(data)
+
+    def _write_state_file(self, data):
+        """Zapíše state.json (atomicky) jen při změně obsahu; každý zápis zvýší 'seq'."""
+        if not self.state_json_enabled or not self.state_json_enabled.isChecked(): return
+        if not self.enable_toggle.isChecked(): return
+        folder = self.folder_label.text()
+        if not folder or folder == "Not set.": return
 
-        # Formátování času
-        s = stats.get('seconds_played', -1)
-        time_str = format_seconds_to_hms(s) if s >= 0 else "--:--:--"
-        
-        # Zápis do bosses.txt
-        if self.bosses_enabled.isChecked():
-            path = os.path.join(folder, "bosses.txt")
-            text = self.bosses_format.text().format(defeated=stats.get('defeated', '--'), total=stats.get('total', '--'))
-            self._write_file(path, text)
-
-        # Zápis do deaths.txt
-        if self.deaths_enabled.isChecked():
-            path = os.path.join(folder, "deaths.txt")
-            obs_deaths = stats.get('deaths', 0) + self.death_offset
-            text = self.deaths_format.text().format(deaths=obs_deaths)
-            self._write_file(path, text)
-            
-        # Zápis do time.txt
-        if self.time_enabled.isChecked():
-            path = os.path.join(folder, "time.txt")
-            text = self.time_format.text().format(time=time_str)
-            self._write_file(path, text)
-
-        # Zápis do last_boss.txt
-        if self.last_boss_enabled.isChecked():
-            path = os.path.join(folder, "last_boss.txt")
-            if last_kill:
-                kill_time_str = format_seconds_to_hms(last_kill.get("time", 0))
-                text = self.last_boss_format.text().format(
-                    boss_name=last_kill.get("name", "N/A"),
-                    kill_time=kill_time_str
-                )
-            else:
-                text = "" # Clear the file if no boss has been killed
-            self._write_file(path, text)
+        snapshot = build_state_snapshot(
+            data,
+            boss_data_manager=self.app.boss_data_manager,
+            timestamp_manager=self.app.timestamp_manager,
+            death_offset=self.death_offset,
+        )
+        body = json.dumps(snapshot, sort_keys=True)
+        if body == self._last_state_body:
+            return
+        self._last_state_body = body
+
+        path = os.path.join(folder, "state.json")
+        if self.state_seq is None:
+            # Continue the sequence of an existing file so consumers never see it go backwards.
+            self.state_seq = read_sequence(path)
+        self.state_seq += 1
+        snapshot["seq"] = self.state_seq
+        snapshot["updated_at"] = time.time()
+        self._write_file(path, json.dumps(snapshot, indent=2, ensure_ascii=False))
+
+    def _forget_state_file(self, new_folder=False):
+        """Forces the next state.json write; a new folder continues the sequence of its own file."""
+        self._last_state_body = None
+        if new_folder:
+            self.state_seq = None
 
     def _write_file(self, path, content):
-        """Pomocná metoda pro bezpečný zápis do souboru."""
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        except IOError as e:
-            print(f"Error writing to OBS file '{path}': {e}")
\ No newline at end of file
+        """Pomocná metoda pro bezpečný zápis do souboru (jen při změně, atomicky, dávkově)."""
+        self.writer.write(path, content)
+
+    def close(self):
+        """Zapíše čekající změny a zastaví server před ukončením aplikace."""
+        self.writer.close()
+        self.push_server.stop()
\ No newline at end of file
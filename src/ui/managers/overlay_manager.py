@@ -1,11 +1,10 @@
 # src/overlay_manager.py
 
 from PySide6.QtWidgets import QColorDialog
-from PySide6.QtCore import QSettings
 from PySide6.QtGui import QColor
 
 from ...config.app_config import DEFAULT_OVERLAY_TEXT_COLOR_STR, DEFAULT_OVERLAY_FONT_SIZE_STR
-from ...utils import format_seconds_to_hms
+from ...utils import format_seconds_to_hms, get_app_settings
 
 class OverlayManager:
     def __init__(self, main_app_ref, overlay_window_ref, settings_panel_ref,
@@ -27,10 +26,13 @@ class OverlayManager:
         self.show_seconds_checkbox = show_seconds_ref
         self.show_last_boss_checkbox = show_last_boss_ref # <--- NOVÁ REFERENCE
         
-        self.settings = QSettings("TheTarnishedChronicle", "App")
+        self.settings = get_app_settings()
         self.last_known_stats = {}
+        self.live_seconds = -1 # Live playtime pushed by the shared LiveClock
+        self._last_rendered_text = None
         
         self.load_settings()
+        self._compile_template()
         self.connect_signals()
 
     def connect_signals(self):
@@ -105,13 +107,11 @@ class OverlayManager:
         a ZAJIŠŤUJE jejich okamžité zobrazení.
         """
         if checked:
-            # 1. Získáme nejnovější data z hlavní aplikace.
-            current_stats = self.app.app_logic._get_current_stats_payload()
+            # 1. Získáme nejnovější data z hlavní aplikace (bez kopírování).
+            self.last_known_stats = self.app.app_logic.last_known_stats
+            self.live_seconds = self.app.live_clock.seconds_played()
             
-            # 2. Uložíme si je, aby je ostatní metody mohly použít.
-            self.last_known_stats = current_stats.copy()
-            
-            # 3. Vynutíme sestavení a nastavení textu. TOTO JE KLÍČOVÉ.
+            # 2. Vynutíme sestavení a nastavení textu. TOTO JE KLÍČOVÉ.
             # Voláme _render_text() přímo, bez ohledu na to, zda je okno viditelné.
             self._render_text()
             
@@ -127,63 +127,88 @@ class OverlayManager:
         Aktualizuje text na základě kompletních dat (např. z monitoringu).
         Tato metoda se volá, když už je overlay pravděpodobně viditelný.
         """
-        self.last_known_stats = stats.copy()
+        self.last_known_stats = stats
         # Pokud je overlay viditelný, okamžitě překreslíme text.
         if self.overlay_window.isVisible():
             self._render_text()
 
+    def update_playtime(self, seconds: int):
+        """Slot for LiveClock.seconds_changed; re-renders only if the time is displayed."""
+        self.live_seconds = seconds
+        if self.overlay_window.isVisible() and self.show_time_checkbox.isChecked():
+            self._render_text()
+
     def force_ui_update(self):
         """Vynutí překreslení textu na základě posledních známých dat a aktuálního nastavení."""
+        # Nastavení se mohlo změnit, šablonu je potřeba sestavit znovu.
+        self._compile_template()
         # Pokud máme vybranou postavu, překreslíme.
         if self.app.save_monitor_logic.current_slot_index != -1:
             self._render_text()
-            
-    def _render_text(self):
-        """Interní metoda, která sestaví a zobrazí finální text v overlayi."""
-        # --- DEBUG PRINT ---
-        print(f"--- DEBUG: OverlayManager._render_text() called. Data: {self.last_known_stats} ---")
-        # --- END DEBUG PRINT ---
-        if not self.last_known_stats:
-            self.overlay_window.set_text("Select a character...")
-            return
 
+    def _compile_template(self):
+        """
+        Sestaví šablonu overlaye podle zaškrtnutých políček. Volá se jen při změně
+        nastavení, takže každý tik hodin už jen dosazuje hodnoty.
+        """
         parts = []
-        stats = self.last_known_stats.get("stats", {})
-        
         if self.show_bosses_checkbox.isChecked():
-            parts.append(f"Bosses: {stats.get('defeated', '--')}/{stats.get('total', '--')}")
+            parts.append(self._format_bosses)
         if self.show_deaths_checkbox.isChecked():
-            parts.append(f"Deaths: {stats.get('deaths', '--')}")
+            parts.append(self._format_deaths)
         if self.show_time_checkbox.isChecked():
-            # ... (logika pro zobrazení času zůstává stejná)
-            seconds = stats.get('seconds_played', -1)
-            if seconds >= 0:
-                h, rem = divmod(seconds, 3600)
-                m, s = divmod(rem, 60)
-                time_str = f"{int(h):02d}:{int(m):02d}"
-                if self.show_seconds_checkbox.isChecked():
-                    time_str += f":{int(s):02d}"
-                parts.append(f"Time: {time_str}")
-            else:
-                parts.append("Time: --:--:--")
+            parts.append(self._format_time_with_seconds if self.show_seconds_checkbox.isChecked() else self._format_time)
+        self._template_parts = tuple(parts)
+        self._template_shows_last_boss = self.show_last_boss_checkbox.isChecked()
+
+    def _format_bosses(self, stats):
+        return f"Bosses: {stats.get('defeated', '--')}/{stats.get('total', '--')}"
+
+    def _format_deaths(self, stats):
+        return f"Deaths: {stats.get('deaths', '--')}"
+
+    def _current_seconds(self, stats):
+        return self.live_seconds if self.live_seconds >= 0 else stats.get('seconds_played', -1)
+
+    def _format_time(self, stats):
+        seconds = self._current_seconds(stats)
+        if seconds < 0:
+            return "Time: --:--:--"
+        h, rem = divmod(int(seconds), 3600)
+        return f"Time: {h:02d}:{rem // 60:02d}"
+
+    def _format_time_with_seconds(self, stats):
+        seconds = self._current_seconds(stats)
+        if seconds < 0:
+            return "Time: --:--:--"
+        h, rem = divmod(int(seconds), 3600)
+        m, s = divmod(rem, 60)
+        return f"Time: {h:02d}:{m:02d}:{s:02d}"
+
+    def _render_text(self):
+        """Interní metoda, která dosadí data do předkompilované šablony a zobrazí výsledek."""
+        if not self.last_known_stats:
+            self._set_text("Select a character...")
+            return
+
+        stats = self.last_known_stats.get("stats", {})
 
-        
         # Sestavíme první řádek
-        final_text = " | ".join(parts)
-        
-        # --- NOVÁ LOGIKA PRO DRUHÝ ŘÁDEK ---
-        if self.show_last_boss_checkbox.isChecked():
+        final_text = " | ".join([part(stats) for part in self._template_parts])
+
+        # Druhý řádek s posledním poraženým bossem
+        if self._template_shows_last_boss:
             last_kill = self.last_known_stats.get("last_kill")
             if last_kill and last_kill.get("name"):
-                boss_name = last_kill["name"]
-                kill_time_str = format_seconds_to_hms(last_kill["time"])
-                
+                last_boss_line = f"{last_kill['name']} {format_seconds_to_hms(last_kill['time'])}"
                 # Pokud je první řádek prázdný, nepřidáváme zbytečný newline
-                if final_text:
-                    final_text += f"\n{boss_name} {kill_time_str}"
-                else:
-                    final_text = f"{boss_name} {kill_time_str}"
+                final_text = f"{final_text}\n{last_boss_line}" if final_text else last_boss_line
 
         # Pokud je po všem text stále prázdný, zobrazíme výchozí
-        final_text = final_text or "Overlay Active"
-        self.overlay_window.set_text(final_text)
\ No newline at end of file
+        self._set_text(final_text or "Overlay Active")
+
+    def _set_text(self, text: str):
+        """Pushes text to the overlay window only if it differs from what is shown."""
+        if text != self._last_rendered_text:
+            self._last_rendered_text = text
+            self.overlay_window.set_text(text)
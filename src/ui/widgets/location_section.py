@@ -9,6 +9,8 @@ from PySide6.QtGui import QIcon, QColor, QPixmap
 from PySide6.QtCore import Qt, QSize, Signal
 from ...utils import format_seconds_to_hms
 from ...utils import get_resource_path
+from ...services.image_loader import get_location_image_loader
+from ...config.app_config import LOCATION_IMAGE_WIDTH
 from .unicode_icons import create_unicode_pixmap
 
 class LocationSectionWidget(QFrame):
@@ -171,6 +173,21 @@ class LocationSectionWidget(QFrame):
             self.boss_table.setRowHidden(row, hide_defeated and is_defeated)
         self._update_table_height()
 
+    def apply_search_result(self, visible_rows):
+        """
+        Shows only the given rows (a set of row numbers), or all rows if None.
+        Rows whose visibility is unchanged are left alone and repaints are batched.
+        """
+        self.boss_table.setUpdatesEnabled(False)
+        try:
+            for row in range(self.boss_table.rowCount()):
+                should_hide = visible_rows is not None and row not in visible_rows
+                if self.boss_table.isRowHidden(row) != should_hide:
+                    self.boss_table.setRowHidden(row, should_hide)
+        finally:
+            self.boss_table.setUpdatesEnabled(True)
+        self._update_table_height()
+
     def set_expanded(self, expanded: bool):
         if self.is_expanded != expanded:
             self._toggle_expand()
@@ -188,6 +205,14 @@ class LocationSectionWidget(QFrame):
         self.header_widget.style().unpolish(self.header_widget)
         self.header_widget.style().polish(self.header_widget)
         self._update_table_height()
+        if self.is_expanded:
+            self._prefetch_location_images()
+
+    def _prefetch_location_images(self):
+        """Warms the image caches for this location's bosses so their dialogs open instantly."""
+        image_names = [b["location_image"] for b in self.bosses_data if b.get("location_image")]
+        if image_names:
+            get_location_image_loader().prefetch(image_names, LOCATION_IMAGE_WIDTH)
 
     def _on_details_button_clicked(self, boss_data):
         self.boss_details_requested.emit(boss_data)
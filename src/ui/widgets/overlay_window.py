@@ -1,8 +1,16 @@
 # src/overlay_window.py
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QApplication
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtWidgets import QWidget, QApplication
+from PySide6.QtCore import Qt, QPoint, QRectF, QSize
+from PySide6.QtGui import QPainter, QColor, QFont, QPen, QStaticText, QTransform
 
 class OverlayWindow(QWidget):
+    # Okraje kolem textu (vlevo/vpravo, nahoře/dole)
+    MARGIN_X = 10
+    MARGIN_Y = 5
+    BACKGROUND_COLOR = QColor(30, 30, 30, 204)
+    BORDER_COLOR = QColor("#4C566A")
+    BORDER_RADIUS = 8
+
     def __init__(self, parent=None, text_color="white", font_size="15pt"):
         super().__init__(parent)
         # Nastavení okna, aby bylo bez rámečků, vždy nahoře a s průhledným pozadím
@@ -17,48 +25,92 @@ class OverlayWindow(QWidget):
         self.text_color = text_color
         self.font_size = font_size
 
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(10, 5, 10, 5)
+        # Text se kreslí přímo v paintEvent z předpřipravených QStaticText (jeden na řádek),
+        # takže změna textu nevyvolává přepočet stylů ani layoutu.
+        self._text = ""
+        self._static_lines = [] # [(QStaticText, QSize), ...]
+        self._text_size = QSize(0, 0)
 
-        self.label = QLabel("Overlay Active", self)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.main_layout.addWidget(self.label)
-        
-        self.setLayout(self.main_layout)
         self._apply_styles()
+        self.set_text("Overlay Active")
 
         # Uložíme si pozici pro přesouvání myší
         self._drag_pos = QPoint(0,0)
 
     def _apply_styles(self):
-        """Aplikuje aktuální CSS styly na widgety."""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba(30, 30, 30, 0.8); /* Tmavší průhledné pozadí pro lepší čitelnost */
-                border: 1px solid #4C566A;
-                border-radius: 8px;
-            }}
-            QLabel {{
-                color: {self.text_color};
-                font-size: {self.font_size};
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-            }}
-        """)
-        self.adjustSize() # Přizpůsobí velikost okna obsahu
+        """Připraví font a barvu pro vykreslování textu."""
+        font = QFont(self.font())
+        font.setBold(True)
+        size = str(self.font_size).strip().lower()
+        try:
+            if size.endswith("px"):
+                font.setPixelSize(int(float(size[:-2])))
+            else:
+                font.setPointSizeF(float(size[:-2] if size.endswith("pt") else size))
+        except ValueError:
+            print(f"Invalid overlay font size '{self.font_size}', keeping default.")
+        self._font = font
+        self._pen = QPen(QColor(self.text_color))
+        self._relayout_text()
+
+    def _relayout_text(self):
+        """Přepočítá rozměry textu a velikost okna (jen když se opravdu změní)."""
+        # QStaticText neumí zalamovat řádky v čistém textu, proto jeden objekt na řádek.
+        self._static_lines = []
+        width = height = 0
+        for line in self._text.split("\n"):
+            static_text = QStaticText(line)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            static_text.prepare(QTransform(), self._font)
+            line_size = static_text.size().toSize()
+            self._static_lines.append((static_text, line_size))
+            width = max(width, line_size.width())
+            height += line_size.height()
+
+        text_size = QSize(width, height)
+        if text_size != self._text_size:
+            self._text_size = text_size
+            self.setFixedSize(text_size.width() + 2 * self.MARGIN_X, text_size.height() + 2 * self.MARGIN_Y)
         self.update()
 
     def update_styles(self, text_color, font_size):
         """Veřejná metoda pro aktualizaci stylů z hlavního okna."""
         self.text_color = text_color
         self.font_size = font_size
+        self._text_size = QSize(0, 0) # Vynutí přepočet velikosti
         self._apply_styles()
 
     def set_text(self, text):
-        """Nastaví zobrazovaný text a přizpůsobí velikost okna."""
-        self.label.setText(text)
-        self.adjustSize()
+        """Nastaví zobrazovaný text; velikost okna se mění jen při změně rozměrů textu."""
+        if text == self._text:
+            return
+        self._text = text
+        self._relayout_text()
+
+    def text(self):
+        return self._text
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+
+        # Pozadí se zaoblenými rohy
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(self.BORDER_COLOR, 1))
+        painter.setBrush(self.BACKGROUND_COLOR)
+        painter.drawRoundedRect(rect, self.BORDER_RADIUS, self.BORDER_RADIUS)
+
+        # Text z cache, každý řádek vycentrovaný
+        painter.setFont(self._font)
+        painter.setPen(self._pen)
+        y = (self.height() - self._text_size.height()) // 2
+        for static_text, line_size in self._static_lines:
+            x = (self.width() - line_size.width()) // 2
+            painter.drawStaticText(x, y, static_text)
+            y += line_size.height()
+        painter.end()
 
     def show_overlay(self):
         """Zobrazí okno vpravo nahoře."""
@@ -71,7 +123,7 @@ class OverlayWindow(QWidget):
         self.hide()
 
     # --- Následující 3 metody zajišťují správné přesouvání okna myší ---
-    
+
     def mousePressEvent(self, event):
         """Zaznamená počáteční bod při stisknutí levého tlačítka myši."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -87,4 +139,4 @@ class OverlayWindow(QWidget):
     def mouseReleaseEvent(self, event):
         """Resetuje pozici po uvolnění tlačítka."""
         self._drag_pos = QPoint(0,0)
-        event.accept()
\ No newline at end of file
+        event.accept()
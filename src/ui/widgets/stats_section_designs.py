@@ -120,11 +120,10 @@ class DefaultStatsDesign(BaseStatsDesign):
             self.total_labels["total"].setText(str(total_counts.get("total", 0)))
 
     def update_playtime(self, seconds: int):
-        """Updates only the playtime label."""
-        if seconds < 0:
-            self.playtime_label.setText("--:--:--")
-        else:
-            self.playtime_label.setText(format_seconds_to_hms(seconds))
+        """Updates only the playtime label, skipping the update if the text is unchanged."""
+        text = "--:--:--" if seconds < 0 else format_seconds_to_hms(seconds)
+        if self.playtime_label.text() != text:
+            self.playtime_label.setText(text)
 
 class CompactStatsDesign(BaseStatsDesign):
     def __init__(self, parent=None):
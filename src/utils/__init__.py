@@ -1 +1,11 @@
-from .utils import get_resource_path, get_app_icon_path, create_colored_pixmap, format_seconds_to_hms, get_image_path, get_app_data_path
\ No newline at end of file
+from .core import format_seconds_to_hms, get_app_data_path
+
+_QT_HELPERS = {"get_resource_path", "get_app_icon_path", "create_colored_pixmap", "get_image_path", "get_app_settings"}
+
+
+def __getattr__(name):
+    # The Qt-based helpers are imported on first use, so Qt-free code can import src.utils.
+    if name in _QT_HELPERS:
+        from . import utils
+        return getattr(utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,23 @@
+# src/utils/core.py
+"""Helpers without Qt dependencies (importable by the headless daemon and scripts)."""
+
+import os
+
+
+def format_seconds_to_hms(seconds: int) -> str:
+    """Formats a duration in seconds to a HH:MM:SS string."""
+    if not isinstance(seconds, (int, float)) or seconds < 0:
+        return "--:--"
+    
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+def get_app_data_path():
+    """Returns the path to the application's data directory."""
+    # This function is moved here to prevent circular imports.
+    from src.config.app_config import APP_DATA_DIR
+    base_path = os.getenv('LOCALAPPDATA')
+    if not base_path:
+        base_path = os.path.expanduser("~")
+    return os.path.join(base_path, APP_DATA_DIR)
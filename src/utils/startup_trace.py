@@ -0,0 +1,123 @@
+# src/utils/startup_trace.py
+"""
+Optional startup trace of the GUI (python -m src.main --trace-startup).
+
+Enabled by the `--trace-startup` flag or TTC_TRACE_STARTUP=1. Startup code
+wraps its phases in `with startup_trace.phase("name"):`; phases may nest
+(e.g. "StatsManager" inside "managers"). When main.py sees the first paint of
+the window it calls finish(), which prints the report and, if
+TTC_TRACE_STARTUP_JSON is set, writes it there as JSON (used by
+benchmarks/bench_startup.py). Times are relative to the import of this
+module, i.e. the start of main.py, not the start of the interpreter.
+
+Disabled, phase() only checks a flag, so the calls can stay in the code.
+No Qt imports here: the domain layer is traced too.
+"""
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+
+TRACE_FLAG = "--trace-startup"
+TRACE_ENV_VAR = "TTC_TRACE_STARTUP"
+TRACE_JSON_ENV_VAR = "TTC_TRACE_STARTUP_JSON"
+TRACE_EXIT_ENV_VAR = "TTC_TRACE_STARTUP_EXIT"  # Quit right after the first paint (benchmarks)
+
+_origin = time.perf_counter()
+_enabled = False
+_finished = False
+_depth = 0
+_phases = []  # [name, start_s, end_s or None, depth], in start order
+
+
+def configure(argv=None):
+    """Enables the trace from the command line flag or the env var. Removes the flag from argv."""
+    global _enabled
+    argv = sys.argv if argv is None else argv
+    if TRACE_FLAG in argv:
+        argv.remove(TRACE_FLAG)
+        _enabled = True
+    if os.environ.get(TRACE_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        _enabled = True
+    return _enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def exit_after_first_paint():
+    return _enabled and os.environ.get(TRACE_EXIT_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+@contextmanager
+def phase(name):
+    """Records the duration of the enclosed block."""
+    global _depth
+    if not _enabled or _finished:
+        yield
+        return
+    record = [name, time.perf_counter() - _origin, None, _depth]
+    _phases.append(record)
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        record[2] = time.perf_counter() - _origin
+
+
+def mark(name):
+    """Records a point in time (a phase without duration)."""
+    if _enabled and not _finished:
+        now = time.perf_counter() - _origin
+        _phases.append([name, now, now, _depth])
+
+
+def get_report():
+    """The trace as a dict: phases with start/duration in ms, plus first_paint_ms once finished."""
+    phases = []
+    first_paint_ms = None
+    for name, start, end, depth in _phases:
+        end = start if end is None else end
+        phases.append({
+            "name": name,
+            "start_ms": round(start * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+            "depth": depth,
+        })
+        if name == "first paint":
+            first_paint_ms = round(end * 1000, 3)
+    return {"phases": phases, "first_paint_ms": first_paint_ms}
+
+
+def format_report(report):
+    lines = ["Startup trace (ms from the start of main.py):", f"  {'phase':<36} {'start':>9} {'duration':>9}"]
+    for entry in report["phases"]:
+        label = "  " * entry["depth"] + entry["name"]
+        lines.append(f"  {label:<36} {entry['start_ms']:9.1f} {entry['duration_ms']:9.1f}")
+    if report["first_paint_ms"] is not None:
+        lines.append(f"  Time to first paint: {report['first_paint_ms']:.1f} ms")
+    return "\n".join(lines)
+
+
+def finish():
+    """Marks the first paint, prints the report and writes the JSON file if requested. Only the first call counts."""
+    global _finished
+    if not _enabled or _finished:
+        return None
+    mark("first paint")
+    _finished = True
+    report = get_report()
+    print(format_report(report))
+
+    json_path = os.environ.get(TRACE_JSON_ENV_VAR)
+    if json_path:
+        try:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            print(f"Error writing startup trace to '{json_path}': {e}")
+    return report
@@ -2,8 +2,9 @@
 
 import os
 import sys
-from PySide6.QtCore import QSize, QByteArray, Qt, QFile, QIODevice
+from PySide6.QtCore import QSize, QByteArray, Qt, QFile, QIODevice, QSettings
 from PySide6.QtGui import QColor, QPixmap, QPainter, QFont
+from .core import format_seconds_to_hms, get_app_data_path
 
 def get_resource_path(relative_path):
     """
@@ -21,6 +22,19 @@ def get_resource_path(relative_path):
         return relative_path
 
 
+def get_app_settings():
+    """
+    The application's QSettings. If the SETTINGS_FILE_ENV_VAR environment variable
+    is set, the settings are read from and written to that INI file instead of the
+    user's real settings (the registry on Windows).
+    """
+    from src.config.app_config import SETTINGS_ORGANIZATION, SETTINGS_APPLICATION, SETTINGS_FILE_ENV_VAR
+    settings_file = os.environ.get(SETTINGS_FILE_ENV_VAR)
+    if settings_file:
+        return QSettings(settings_file, QSettings.Format.IniFormat)
+    return QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+
+
 def get_app_icon_path():
     """Get the path to the application icon."""
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -99,24 +113,6 @@ def create_colored_pixmap(icon_path: str, color: QColor, size: QSize) -> QPixmap
             return _create_unicode_pixmap(symbol, color, size)
         print(f"Error creating colored pixmap for {icon_path}: {e}")
         return QPixmap()
-def format_seconds_to_hms(seconds: int) -> str:
-    """Formats a duration in seconds to a HH:MM:SS string."""
-    if not isinstance(seconds, (int, float)) or seconds < 0:
-        return "--:--"
-    
-    h, rem = divmod(int(seconds), 3600)
-    m, s = divmod(rem, 60)
-    return f"{h:02d}:{m:02d}:{s:02d}"
-
-def get_app_data_path():
-    """Returns the path to the application's data directory."""
-    # This function is moved here to prevent circular imports.
-    from src.config.app_config import APP_DATA_DIR
-    base_path = os.getenv('LOCALAPPDATA')
-    if not base_path:
-        base_path = os.path.expanduser("~")
-    return os.path.join(base_path, APP_DATA_DIR)
-
 def get_image_path(relative_path):
     """
     Get absolute path to a downloaded image asset.